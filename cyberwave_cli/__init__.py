@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
-from ._version import get_version
 
-__version__ = get_version()
+def __getattr__(name: str) -> str:
+    # Resolving the version goes through importlib.metadata, which scans
+    # site-packages; only pay for it when someone actually asks.
+    if name == "__version__":
+        from ._version import get_version
+
+        version = get_version()
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
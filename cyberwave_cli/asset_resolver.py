@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +27,33 @@ class AssetResolutionError(Exception):
     pass
 
 
+# Assets fetched from the API are cached for a few minutes so repeated
+# create/pair calls against the same asset skip the network round trip.
+# Keyed by (lookup kind, identifier, client identity).
+ASSET_CACHE_TTL_SECONDS = 300.0
+_ASSET_CACHE: dict[tuple[str, str, int], tuple[float, Any]] = {}
+
+
+def _cache_get(key: tuple[str, str, int]) -> Any | None:
+    entry = _ASSET_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at > ASSET_CACHE_TTL_SECONDS:
+        del _ASSET_CACHE[key]
+        return None
+    return value
+
+
+def _cache_put(key: tuple[str, str, int], value: Any) -> None:
+    _ASSET_CACHE[key] = (time.monotonic(), value)
+
+
+def clear_asset_cache() -> None:
+    """Drop all cached API asset lookups."""
+    _ASSET_CACHE.clear()
+
+
 def resolve_asset(identifier: str, client: Any) -> dict:
     """
     Resolve an asset from various identifier formats.
@@ -59,21 +87,29 @@ def resolve_asset(identifier: str, client: Any) -> dict:
     if _is_url(identifier):
         return _load_url_asset(identifier)
     
+    cache_key = ("resolve", identifier, id(client))
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return dict(cached)
+
+    asset = None
+
     # 3. Try as registry ID first (contains '/')
     if '/' in identifier:
         asset = _get_by_registry_id(identifier, client)
-        if asset:
-            return _asset_to_dict(asset)
     
     # 4. Try as alias
-    asset = _get_by_alias(identifier, client)
-    if asset:
-        return _asset_to_dict(asset)
+    if not asset:
+        asset = _get_by_alias(identifier, client)
     
     # 5. Try as registry ID without slash (maybe partial match)
-    asset = _get_by_registry_id(identifier, client)
+    if not asset and '/' not in identifier:
+        asset = _get_by_registry_id(identifier, client)
+
     if asset:
-        return _asset_to_dict(asset)
+        data = _asset_to_dict(asset)
+        _cache_put(cache_key, data)
+        return dict(data)
     
     raise AssetResolutionError(
         f"Asset not found: '{identifier}'\n"
@@ -85,6 +121,20 @@ def resolve_asset(identifier: str, client: Any) -> dict:
     )
 
 
+def get_asset(asset_uuid: str, client: Any) -> Any:
+    """Fetch an asset by UUID via ``client.assets.get``, cached for a few minutes.
+
+    Errors from the SDK propagate unchanged and are not cached.
+    """
+    cache_key = ("uuid", str(asset_uuid), id(client))
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    asset = client.assets.get(asset_uuid)
+    _cache_put(cache_key, asset)
+    return asset
+
+
 def _is_local_file(identifier: str) -> bool:
     """Check if identifier looks like a local file path."""
     # Explicit JSON extension
@@ -497,6 +497,12 @@ def edge():
     default=False,
     help="Tear down and reinstall the USB/IP server from scratch (macOS only)",
 )
+@click.option(
+    "--assume-installed",
+    is_flag=True,
+    default=False,
+    help="Skip installing edge-core and Docker; only configure the service",
+)
 @click.option(
     "--reconfigure-camera",
     is_flag=True,
@@ -533,6 +539,7 @@ def install_edge(
     channel,
     version,
     force_reinstall,
+    assume_installed,
     reconfigure_camera,
     reconfigure_microphone,
     reconfigure_speaker,
@@ -553,6 +560,7 @@ def install_edge(
         sudo cyberwave edge install
         sudo cyberwave edge install -y
         sudo cyberwave edge install --force-reinstall
+        sudo cyberwave edge install --assume-installed -y
         sudo cyberwave edge install --reconfigure-camera
         sudo cyberwave edge install --reconfigure-microphone
         sudo cyberwave edge install --reconfigure-speaker
@@ -671,6 +679,7 @@ def install_edge(
             channel=channel.lower(),
             version=version,
             force_reinstall=force_reinstall,
+            assume_installed=assume_installed,
         ):
             raise SystemExit(1)
     except KeyboardInterrupt:
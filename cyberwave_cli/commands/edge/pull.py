@@ -92,7 +92,13 @@ def _pull_via_discovery_api(fingerprint: str, target_dir: str, yes: bool) -> boo
     from ...config import get_api_url
     from ...credentials import load_credentials
     from cyberwave.fingerprint import get_device_info
-    from ...utils import print_error, print_success, print_warning, write_edge_env
+    from ...utils import (
+        get_http_client,
+        print_error,
+        print_success,
+        print_warning,
+        write_edge_env,
+    )
 
     creds = load_credentials()
     if not creds or not creds.token:
@@ -113,15 +119,14 @@ def _pull_via_discovery_api(fingerprint: str, target_dir: str, yes: bool) -> boo
             "name": device_info.get("hostname", fingerprint[:20]),
         }
 
-        with httpx.Client() as http_client:
-            response = http_client.post(
-                discover_url,
-                json=discover_payload,
-                headers=headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = get_http_client().post(
+            discover_url,
+            json=discover_payload,
+            headers=headers,
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         edge_uuid = data.get("edge_uuid")
         twins = data.get("twins", [])
@@ -57,12 +57,15 @@ def _is_retryable_workspace_token_error(error: AuthenticationError) -> bool:
     return "HTTP error: 500" in str(error)
 
 
-def _validate_stored_token(token: str) -> bool:
-    """Validate a stored API token by making a lightweight SDK call."""
+def _validate_stored_token(token: str, base_url: str | None = None) -> bool:
+    """Validate a stored API token by making a lightweight SDK call.
+
+    Checks against *base_url* when given, else the current API URL.
+    """
     try:
         from cyberwave import Cyberwave
 
-        client = Cyberwave(base_url=get_api_url(), token=token)
+        client = Cyberwave(base_url=base_url or get_api_url(), token=token)
         client.workspaces.list()
         return True
     except Exception:
@@ -155,17 +158,15 @@ def login(email: str | None, password: str | None, token: str | None) -> None:
         # then fall back to the current process URL resolution.
         validate_token = existing_creds.token
         with console.status("[dim]Checking existing credentials...[/dim]"):
-            if _stored_api_url(existing_creds):
-                try:
-                    from cyberwave import Cyberwave
-
-                    stored_url = _stored_api_url(existing_creds)
-                    client = Cyberwave(base_url=stored_url, token=validate_token)
-                    client.workspaces.list()
-                    is_valid = True
-                except Exception:
-                    is_valid = _validate_stored_token(validate_token)
-            else:
+            stored_url = _stored_api_url(existing_creds)
+            is_valid = False
+            if stored_url:
+                is_valid = _validate_stored_token(validate_token, base_url=stored_url)
+            # Only retry against the current URL when it is a different
+            # server; otherwise the second call would repeat the first.
+            if not is_valid and (
+                not stored_url or stored_url.rstrip("/") != get_api_url().rstrip("/")
+            ):
                 is_valid = _validate_stored_token(validate_token)
 
         if is_valid:
@@ -7,6 +7,7 @@ from rich.console import Console
 
 from ..config import CREDENTIALS_FILE
 from ..credentials import clear_credentials, load_credentials
+from ..utils import clear_sdk_client_cache
 
 console = Console()
 
@@ -23,5 +24,6 @@ def logout() -> None:
         return
 
     clear_credentials()
+    clear_sdk_client_cache()
     console.print("\n[green]✓[/green] Successfully logged out")
     console.print(f"[dim]Credentials removed from {CREDENTIALS_FILE}[/dim]")
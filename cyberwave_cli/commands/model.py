@@ -128,9 +128,9 @@ def get_model_info(model_id: str) -> dict | None:
                 "uuid": m.get("uuid"),
             }
     
-    # Fallback to local definitions
-    fallback = get_fallback_models()
-    return fallback.get(model_id)
+    # Fallback to local definitions (shared read-only mapping; hand out a copy)
+    info = get_fallback_models().get(model_id)
+    return dict(info) if info is not None else None
 
 
 @model.command("bind")
@@ -16,22 +16,33 @@ Examples:
 
 from __future__ import annotations
 
+import functools
 import logging
-import os
+import operator
 import platform
-import subprocess
-import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
-from rich.console import Console
+from rich.live import Live
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
+from ..asset_resolver import (
+    AssetResolutionError,
+    get_asset,
+    get_asset_display_name,
+    resolve_asset,
+)
+from ..config import CONFIG_DIR, chown_to_sudo_user, get_api_url
+from ..credentials import load_credentials
+from ..io_utils import atomic_write_json, dumps_json_bytes, echo_json, loads_json
 from ..utils import (
     console,
+    get_http_client,
     get_sdk_client,
     print_error,
     print_success,
@@ -40,6 +51,9 @@ from ..utils import (
     write_edge_env,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,26 +62,94 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1)
+def _platform_str() -> str:
+    """``<system>-<machine>`` label sent on edge discovery (computed once)."""
+    return f"{platform.system()}-{platform.machine()}"
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_device_info() -> dict:
+    from cyberwave.fingerprint import get_device_info
+
+    return get_device_info()
+
+
+def _device_info() -> dict:
+    """Hostname/platform info for this device; collected once per process."""
+    return dict(_cached_device_info())
+
+
+def _device_identity() -> tuple[str, dict]:
+    """Fingerprint and device info for this machine (local, CPU/disk bound)."""
+    from cyberwave.fingerprint import generate_fingerprint
+
+    return generate_fingerprint(), _device_info()
+
+
+# Runs local device fingerprinting / API lookups concurrently with the
+# other half of a command's setup so neither waits on the other.
+_setup_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cw-twin")
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "y"})
+
+
+def _to_int(value: str) -> object:
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _to_float(value: str) -> object:
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _to_bool(value: object) -> bool:
+    if isinstance(value, str):
+        return value.lower() in _TRUTHY
+    return bool(value)
+
+
+# Schema ``type`` -> coercer; unknown types pass the value through unchanged.
+_COERCERS = {
+    "integer": _to_int,
+    "number": _to_float,
+    "boolean": _to_bool,
+}
+
+
 def _coerce_value(field_type: str, value: str | None) -> object | None:
     """Coerce string value to the type specified in schema."""
     if value is None or value == "":
         return None
-    field_type = (field_type or "").lower()
-    if field_type == "integer":
-        try:
-            return int(value)
-        except ValueError:
-            return value
-    if field_type == "number":
-        try:
-            return float(value)
-        except ValueError:
-            return value
-    if field_type == "boolean":
-        if isinstance(value, str):
-            return value.lower() in {"1", "true", "yes", "y"}
-        return bool(value)
-    return value
+    coerce = _COERCERS.get((field_type or "").lower())
+    return coerce(value) if coerce is not None else value
+
+
+def _parse_extra_kv(args: list[str]) -> dict[str, str]:
+    """Parse leftover ``--key value`` CLI args into schema-field overrides.
+
+    Keys are normalized to snake_case. A flag not followed by a value maps to
+    ``"true"``; stray positional tokens are ignored.
+    """
+    overrides: dict[str, str] = {}
+    pending: str | None = None
+    for arg in args:
+        if arg.startswith("--"):
+            if pending is not None:
+                overrides[pending] = "true"  # Flag without value
+            pending = arg[2:].replace("-", "_")
+        elif pending is not None:
+            overrides[pending] = arg
+            pending = None
+    if pending is not None:
+        overrides[pending] = "true"
+    return overrides
 
 
 def _is_legacy_edge_configs_map(edge_configs: dict) -> bool:
@@ -92,6 +174,73 @@ def _binding_for_fingerprint(edge_configs: dict, fingerprint: str) -> dict | Non
     return None
 
 
+@dataclass(frozen=True, slots=True)
+class SchemaField:
+    """One normalized entry of an asset's ``edge_config_schema``."""
+
+    name: str
+    cli_key: str
+    type: str
+    default: Any
+    description: str
+    required: bool
+
+
+# Compiled schemas keyed by ``id(schema)``; the schema itself is kept in the
+# entry so the id can't be recycled while cached.
+_COMPILED_SCHEMAS: dict[int, tuple[list[dict], tuple[SchemaField, ...]]] = {}
+
+
+def _compile_schema(schema: list[dict]) -> tuple[SchemaField, ...]:
+    """Normalize schema fields once (defaults, CLI key) and cache the result."""
+    entry = _COMPILED_SCHEMAS.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    fields = []
+    for field in schema:
+        name = field.get("name", "")
+        if not name:
+            continue
+        flag = field.get("flag", "")
+        fields.append(
+            SchemaField(
+                name=name,
+                # CLI overrides match by flag without the leading dashes
+                cli_key=flag.lstrip("-").replace("-", "_") if flag else name,
+                type=field.get("type", "string"),
+                default=field.get("default"),
+                description=field.get("description", ""),
+                required=field.get("required", False),
+            )
+        )
+    compiled = tuple(fields)
+    _COMPILED_SCHEMAS[id(schema)] = (schema, compiled)
+    return compiled
+
+
+# Non-interactive defaults per schema (same identity keying as above):
+# (coerced defaults, required fields without a default).
+_SCHEMA_DEFAULTS: dict[int, tuple[list[dict], dict, tuple[str, ...]]] = {}
+
+
+def _schema_defaults(schema: list[dict]) -> tuple[dict, tuple[str, ...]]:
+    """Config that ``--yes`` with no overrides produces, computed once per schema."""
+    entry = _SCHEMA_DEFAULTS.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1], entry[2]
+
+    defaults: dict = {}
+    missing_required: list[str] = []
+    for field in _compile_schema(schema):
+        if field.default not in (None, ""):
+            defaults[field.name] = _coerce_value(field.type, str(field.default))
+        elif field.required:
+            missing_required.append(field.name)
+    _SCHEMA_DEFAULTS[id(schema)] = (schema, defaults, tuple(missing_required))
+    return defaults, tuple(missing_required)
+
+
 def _prompt_for_schema_fields(
     schema: list[dict],
     cli_overrides: dict[str, str],
@@ -106,24 +255,23 @@ def _prompt_for_schema_fields(
     if not schema:
         return config
 
+    if yes and not cli_overrides:
+        # Fast path for automation: nothing to prompt or override.
+        defaults, missing_required = _schema_defaults(schema)
+        for name in missing_required:
+            print_warning(f"Required field '{name}' has no default and --yes was used")
+        return dict(defaults)
+
     if not yes:
         console.print("\n[bold]Edge Configuration[/bold]")
         console.print("[dim]Configure based on asset schema. Leave blank to skip optional fields.[/dim]")
 
-    for field in schema:
-        name = field.get("name", "")
-        flag = field.get("flag", "")
-        field_type = field.get("type", "string")
-        default = field.get("default")
-        description = field.get("description", "")
-        required = field.get("required", False)
-
-        if not name:
-            continue
+    for field in _compile_schema(schema):
+        name = field.name
+        field_type = field.type
+        default = field.default
 
-        # Check if CLI override was provided (match by flag without --)
-        cli_key = flag.lstrip("-").replace("-", "_") if flag else name
-        cli_value = cli_overrides.get(cli_key)
+        cli_value = cli_overrides.get(field.cli_key)
 
         if cli_value is not None:
             # Use CLI-provided value
@@ -132,20 +280,20 @@ def _prompt_for_schema_fields(
             # Non-interactive: use default if available
             if default not in (None, ""):
                 config[name] = _coerce_value(field_type, str(default))
-            elif required:
+            elif field.required:
                 print_warning(f"Required field '{name}' has no default and --yes was used")
         else:
             # Interactive prompt
             prompt_text = f"  {name}"
-            if description:
-                console.print(f"[dim]  {description}[/dim]")
+            if field.description:
+                console.print(f"[dim]  {field.description}[/dim]")
 
             default_str = str(default) if default not in (None, "") else ""
             value = Prompt.ask(prompt_text, default=default_str)
 
             if value.strip():
                 config[name] = _coerce_value(field_type, value)
-            elif required:
+            elif field.required:
                 print_warning(f"Required field '{name}' was left empty")
 
     return config
@@ -304,6 +452,22 @@ def _resolve_quickstart_environment(client: Any) -> str | None:
     return str(env_id)
 
 
+def _list_twins_for_fingerprint(client: Any, asset_uuid: str, fingerprint: str | None) -> Any:
+    """List candidate twins for this device, narrowed server-side when possible.
+
+    Newer SDK/backends accept a ``fingerprint`` filter and return only twins
+    bound to this edge; older ones raise ``TypeError`` on the unknown kwarg,
+    in which case we fall back to listing every twin of the asset. Callers
+    still verify each binding.
+    """
+    if fingerprint:
+        try:
+            return client.twins.list(asset_uuid=asset_uuid, fingerprint=fingerprint)
+        except TypeError:
+            logger.debug("twins.list does not support fingerprint filter; scanning asset twins")
+    return client.twins.list(asset_uuid=asset_uuid)
+
+
 def _find_or_create_twin(
     client: Any,
     asset: dict,
@@ -315,14 +479,12 @@ def _find_or_create_twin(
     pick_environment: bool = False,
 ) -> Any | None:
     """Find existing twin for this fingerprint or create a new one."""
-    from cyberwave.fingerprint import get_device_info
-
     asset_uuid = asset.get('uuid')
 
     # Search for twins that have this fingerprint in their edge_configs
     if asset_uuid:
         try:
-            twins = client.twins.list(asset_uuid=asset_uuid)
+            twins = _list_twins_for_fingerprint(client, asset_uuid, fingerprint)
 
             for twin in twins:
                 metadata = getattr(twin, 'metadata', {}) or {}
@@ -360,7 +522,7 @@ def _find_or_create_twin(
 
     # Get twin name
     if not twin_name:
-        device_info = get_device_info()
+        device_info = _device_info()
         asset_name = asset.get('name', 'Edge')
         default_name = f"{asset_name[:20]}-{device_info.get('hostname', 'edge')[:10]}"
 
@@ -385,6 +547,11 @@ def _find_or_create_twin(
         return None
 
 
+# Keys _configure_edge adds for its own bookkeeping; never part of the
+# driver config sent to the backend or written to .env.
+_EDGE_CONFIG_BOOKKEEPING_KEYS = frozenset({"device_info", "registered_at", "last_sync"})
+
+
 def _configure_edge(
     client: Any,
     twin: Any,
@@ -411,84 +578,238 @@ def _configure_edge(
     # Build config from schema
     edge_config = _prompt_for_schema_fields(edge_config_schema, cli_overrides, yes)
 
+    now_iso = datetime.now(timezone.utc).isoformat()
     config = {
         **edge_config,
         "device_info": device_info,
-        "registered_at": datetime.now(timezone.utc).isoformat(),
-        "last_sync": datetime.now(timezone.utc).isoformat(),
+        "registered_at": now_iso,
+        "last_sync": now_iso,
     }
 
     return config
 
 
-def _register_and_pair_edge(twin_uuid: str, fingerprint: str, device_info: dict, config: dict) -> str | None:
-    """Register edge device and pair it to the twin using new API.
+# Gateway errors a load balancer returns while the backend restarts/deploys.
+_RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
 
-    Returns edge_uuid on success, None on failure (fallback to legacy).
+
+def _post_with_retry(
+    http_client: httpx.Client,
+    url: str,
+    payload: dict,
+    headers: dict[str, str],
+    *,
+    retries: int = 2,
+    retry_initial_delay: float = 0.5,
+) -> httpx.Response:
+    """POST *payload* as JSON to the edge API, retrying transient failures.
+
+    The body is encoded once up front (``orjson`` when available) and
+    reused across attempts. Transport errors and 502/503/504 answers are
+    retried up to *retries* times with backoff (0.5s, 1s, ...); anything
+    else is returned to the caller. Both edge endpoints are idempotent per
+    fingerprint/twin, so a replay is safe.
     """
     import httpx
 
-    from ..config import get_api_url
-    from ..credentials import load_credentials
+    body = dumps_json_bytes(payload)
+    headers = {**headers, "Content-Type": "application/json"}
 
-    creds = load_credentials()
-    if not creds or not creds.token:
-        return None
+    delay = retry_initial_delay
+    for _ in range(retries):
+        try:
+            response = http_client.post(url, content=body, headers=headers)
+            if response.status_code not in _RETRYABLE_STATUS_CODES:
+                return response
+        except httpx.TransportError:
+            pass
+        logger.debug("POST %s failed transiently, retrying in %.1fs", url, delay)
+        time.sleep(delay)
+        delay *= 2
+    # Final attempt: whatever happens is surfaced to the caller.
+    return http_client.post(url, content=body, headers=headers)
+
+
+# Remembers, per API URL, that the backend has no consolidated endpoint, so
+# later ``twin create --pair`` / ``twin pair`` runs go straight to the
+# two-step discover/pair flow. Only a definite "no such route" answer is
+# stored; the TTL lets a backend that has since shipped the endpoint be
+# picked up again.
+DISCOVER_AND_PAIR_UNSUPPORTED_FILE = CONFIG_DIR / "discover_and_pair_unsupported.json"
+DISCOVER_AND_PAIR_UNSUPPORTED_MAX_AGE_SECONDS = 24 * 60 * 60
+# API URLs that answered an ambiguous 404 in this process (see below).
+_discover_and_pair_skipped: set[str] = set()
+
+
+def _read_discover_and_pair_unsupported() -> dict[str, float]:
+    try:
+        with open(DISCOVER_AND_PAIR_UNSUPPORTED_FILE, "rb") as f:
+            data = loads_json(f.read())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
 
-    base_url = get_api_url()
-    headers = {"Authorization": f"Bearer {creds.token}"}
 
+def _discover_and_pair_known_unsupported(base_url: str) -> bool:
+    """Return True if *base_url* recently rejected ``/edges/discover-and-pair``."""
+    if base_url in _discover_and_pair_skipped:
+        return True
     try:
-        # Step 1: Register/discover edge device
-        discover_url = f"{base_url}/api/v1/edges/discover"
-        discover_payload = {
-            "fingerprint": fingerprint,
-            "hostname": device_info.get('hostname', ''),
-            "platform": f"{platform.system()}-{platform.machine()}",
-            "name": device_info.get('hostname', fingerprint[:20]),
-        }
-
-        with httpx.Client() as http_client:
-            response = http_client.post(
-                discover_url,
-                json=discover_payload,
-                headers=headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            edge_uuid = data.get("edge_uuid")
+        checked_at = float(_read_discover_and_pair_unsupported()[base_url])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return 0 <= time.time() - checked_at < DISCOVER_AND_PAIR_UNSUPPORTED_MAX_AGE_SECONDS
+
+
+def _mark_discover_and_pair_unsupported(base_url: str) -> None:
+    """Remember that *base_url* lacks ``/edges/discover-and-pair``. Best effort."""
+    entries = _read_discover_and_pair_unsupported()
+    entries[base_url] = int(time.time())
+    try:
+        atomic_write_json(DISCOVER_AND_PAIR_UNSUPPORTED_FILE, entries)
+    except OSError:
+        return
+    chown_to_sudo_user(DISCOVER_AND_PAIR_UNSUPPORTED_FILE)
 
-        if not edge_uuid:
-            return None
 
-        # Step 2: Pair twin to edge with config
-        pair_url = f"{base_url}/api/v1/edges/{edge_uuid}/pair"
+def _route_missing(response: httpx.Response) -> bool:
+    """Whether a 404/405 means the endpoint itself doesn't exist.
 
-        # Remove internal fields from config
-        config_clean = {k: v for k, v in config.items() if not k.startswith('_') and k not in ('device_info', 'registered_at', 'last_sync')}
+    A 405, or a 404 from the URL router (an HTML page rather than a JSON
+    API error), means no such route. A JSON 404 may just as well be the
+    API rejecting an unknown or inaccessible twin, so it isn't conclusive.
+    """
+    if response.status_code == 405:
+        return True
+    try:
+        loads_json(response.content)
+    except ValueError:
+        return True
+    return False
+
+
+def _discover_and_pair(
+    http_client: httpx.Client,
+    base_url: str,
+    headers: dict[str, str],
+    discover_payload: dict,
+    twin_uuid: str,
+    camera_config: dict,
+) -> str | None:
+    """Register the edge and pair the twin in one request.
+
+    Returns the edge UUID, or None when the backend doesn't expose
+    ``/edges/discover-and-pair`` yet (caller falls back to discover + pair).
+    Other HTTP errors are raised.
+    """
+    if _discover_and_pair_known_unsupported(base_url):
+        return None
 
-        pair_payload = {
+    response = _post_with_retry(
+        http_client,
+        f"{base_url}/api/v1/edges/discover-and-pair",
+        {
+            **discover_payload,
             "twin_uuid": twin_uuid,
-            "camera_config": config_clean,  # Backend expects camera_config for now
-        }
-
-        with httpx.Client() as http_client:
-            response = http_client.post(
-                pair_url,
-                json=pair_payload,
-                headers=headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
+            "camera_config": camera_config,  # Backend expects camera_config for now
+        },
+        headers,
+    )
+    if response.status_code in (404, 405):
+        if _route_missing(response):
+            _mark_discover_and_pair_unsupported(base_url)
+        else:
+            # Can't tell a missing route from a missing twin: only skip the
+            # endpoint for the rest of this process.
+            _discover_and_pair_skipped.add(base_url)
+        return None
+    response.raise_for_status()
+    return loads_json(response.content).get("edge_uuid") or None
+
+
+def _do_edge_pairing(
+    base_url: str,
+    token: str,
+    twin_uuid: str,
+    fingerprint: str,
+    device_info: dict,
+    camera_config: dict,
+) -> str:
+    """Register this device as an edge and bind *twin_uuid* to it.
 
-        console.print(f"[dim]Edge registered: {edge_uuid[:8]}...[/dim]")
+    Shared by ``twin create --pair`` and ``twin pair``. Uses the single
+    ``discover-and-pair`` request when the backend supports it, else the
+    two-step discover + pair calls, all over the shared keep-alive client.
+
+    Returns the edge UUID. Raises ``httpx.HTTPStatusError`` on API errors and
+    ``ValueError`` when the backend doesn't hand back an edge UUID.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    discover_payload = {
+        "fingerprint": fingerprint,
+        "hostname": device_info.get('hostname', ''),
+        "platform": _platform_str(),
+        "name": device_info.get('hostname', fingerprint[:20]),
+    }
+    http_client = get_http_client()
+
+    # Fast path: register and pair in a single round trip.
+    edge_uuid = _discover_and_pair(
+        http_client, base_url, headers, discover_payload, twin_uuid, camera_config
+    )
+    if edge_uuid:
         return edge_uuid
 
+    # Step 1: Register/discover edge device
+    response = _post_with_retry(
+        http_client, f"{base_url}/api/v1/edges/discover", discover_payload, headers
+    )
+    response.raise_for_status()
+    edge_uuid = loads_json(response.content).get("edge_uuid")
+    if not edge_uuid:
+        raise ValueError("backend did not return an edge_uuid")
+
+    # Step 2: Pair twin to edge with config
+    response = _post_with_retry(
+        http_client,
+        f"{base_url}/api/v1/edges/{edge_uuid}/pair",
+        {
+            "twin_uuid": twin_uuid,
+            "camera_config": camera_config,  # Backend expects camera_config for now
+        },
+        headers,
+    )
+    response.raise_for_status()
+    return edge_uuid
+
+
+def _register_and_pair_edge(twin_uuid: str, fingerprint: str, device_info: dict, config: dict) -> str | None:
+    """Register edge device and pair it to the twin using new API.
+
+    Returns edge_uuid on success, None on failure (fallback to legacy).
+    """
+    creds = load_credentials()
+    if not creds or not creds.token:
+        return None
+
+    # Remove internal and secret (``_``-prefixed) fields from config
+    config_clean = {
+        k: v
+        for k, v in config.items()
+        if k not in _EDGE_CONFIG_BOOKKEEPING_KEYS and not k.startswith('_')
+    }
+
+    try:
+        edge_uuid = _do_edge_pairing(
+            get_api_url(), creds.token, twin_uuid, fingerprint, device_info, config_clean
+        )
     except Exception as e:
         print_warning(f"New API failed, using legacy: {e}")
         return None
 
+    console.print(f"[dim]Edge registered: {edge_uuid[:8]}...[/dim]")
+    return edge_uuid
+
 
 def _save_config_to_twin(client: Any, twin_uuid: str, fingerprint: str, config: dict):
     """Save edge config to twin metadata (legacy fallback)."""
@@ -509,7 +830,7 @@ def _save_config_to_twin(client: Any, twin_uuid: str, fingerprint: str, config:
 def _write_local_env(twin_uuid: str, config: dict, fingerprint: str, target_dir: str = ".", generator: str = "cyberwave twin"):
     """Write .env file locally using shared utility."""
     # Clean config of internal fields
-    edge_config = {k: v for k, v in config.items() if k not in ('device_info', 'registered_at', 'last_sync')}
+    edge_config = {k: v for k, v in config.items() if k not in _EDGE_CONFIG_BOOKKEEPING_KEYS}
 
     write_edge_env(
         target_dir=target_dir,
@@ -599,24 +920,7 @@ def create_twin(
         cyberwave twin create camera --pair --source "rtsp://..." --fps 15
     """
     # Parse extra args as --key value pairs for schema fields
-    cli_overrides: dict[str, str] = {}
-    args = ctx.args
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg.startswith("--"):
-            key = arg[2:].replace("-", "_")
-            if i + 1 < len(args) and not args[i + 1].startswith("--"):
-                cli_overrides[key] = args[i + 1]
-                i += 2
-            else:
-                cli_overrides[key] = "true"  # Flag without value
-                i += 1
-        else:
-            i += 1
-
-    from ..asset_resolver import AssetResolutionError, get_asset_display_name, resolve_asset
-    from cyberwave.fingerprint import generate_fingerprint, get_device_info
+    cli_overrides = _parse_extra_kv(ctx.args)
 
     # Get SDK client
     client = get_sdk_client()
@@ -624,12 +928,8 @@ def create_twin(
         print_error("Not authenticated.", "Run 'cyberwave login' first.")
         return
 
-    # Generate fingerprint (needed for pairing)
-    fingerprint = generate_fingerprint()
-    device_info = get_device_info()
-
-    if do_pair:
-        console.print(f"\n[dim]Fingerprint: {fingerprint}[/dim]")
+    # Generate fingerprint (needed for pairing) while the asset resolves
+    identity = _setup_pool.submit(_device_identity)
 
     # 1. Resolve asset
     console.print(f"\nResolving asset '{asset}'...", end=" ")
@@ -642,6 +942,11 @@ def create_twin(
         print_error(str(e))
         return
 
+    fingerprint, device_info = identity.result()
+
+    if do_pair:
+        console.print(f"[dim]  Fingerprint: {fingerprint}[/dim]")
+
     # Get edge_config_schema from asset capabilities
     capabilities = resolved_asset.get('capabilities', {}) or {}
     edge_config_schema: list[dict] = capabilities.get("edge_config_schema", []) or []
@@ -739,8 +1044,9 @@ def pair_twin(ctx: click.Context, twin_uuid: str, target_dir: str, yes: bool):
     \b
     What this does:
         1. Generates a unique fingerprint for this device
-        2. Registers the edge device with the backend (auto-creates if new)
-        3. Binds the twin to this edge with configuration from schema
+        2. Collects configuration from the asset's schema
+        3. Registers the edge device with the backend (auto-creates if new)
+           and binds the twin to it with that configuration
         4. Saves local .env file for edge service
 
     \b
@@ -756,26 +1062,8 @@ def pair_twin(ctx: click.Context, twin_uuid: str, target_dir: str, yes: bool):
     """
     import httpx
 
-    from ..config import get_api_url
-    from ..credentials import load_credentials
-    from cyberwave.fingerprint import generate_fingerprint, get_device_info
-
     # Parse extra args as --key value pairs for schema fields
-    cli_overrides: dict[str, str] = {}
-    args = ctx.args
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg.startswith("--"):
-            key = arg[2:].replace("-", "_")
-            if i + 1 < len(args) and not args[i + 1].startswith("--"):
-                cli_overrides[key] = args[i + 1]
-                i += 2
-            else:
-                cli_overrides[key] = "true"  # Flag without value
-                i += 1
-        else:
-            i += 1
+    cli_overrides = _parse_extra_kv(ctx.args)
 
     # Get SDK client and auth
     client = get_sdk_client()
@@ -787,9 +1075,11 @@ def pair_twin(ctx: click.Context, twin_uuid: str, target_dir: str, yes: bool):
         print_error("Not authenticated.", "Run 'cyberwave login' first.")
         return
 
+    # Fetch the target twin while this device is fingerprinted
+    twin_future = _setup_pool.submit(client.twins.get, twin_uuid)
+
     # Generate fingerprint
-    fingerprint = generate_fingerprint()
-    device_info = get_device_info()
+    fingerprint, device_info = _device_identity()
 
     console.print("\n[bold]Device Pairing[/bold]")
     console.print(f"Fingerprint: [cyan]{fingerprint}[/cyan]")
@@ -800,7 +1090,7 @@ def pair_twin(ctx: click.Context, twin_uuid: str, target_dir: str, yes: bool):
     edge_config_schema: list[dict] = []
     driver_image: str | None = None
     try:
-        twin_obj = client.twins.get(twin_uuid)
+        twin_obj = twin_future.result()
         twin_name = getattr(twin_obj, 'name', 'Unknown')
         console.print(f"\n[bold]Target Twin:[/bold] {twin_name}")
 
@@ -809,7 +1099,7 @@ def pair_twin(ctx: click.Context, twin_uuid: str, target_dir: str, yes: bool):
         asset_uuid = getattr(twin_obj, 'asset_uuid', None) or getattr(twin_obj, 'asset_id', None)
         if asset_uuid:
             try:
-                asset = client.assets.get(asset_uuid)
+                asset = get_asset(asset_uuid, client)
                 capabilities = getattr(asset, 'capabilities', {}) or {}
                 edge_config_schema = capabilities.get("edge_config_schema", []) or []
 
@@ -847,64 +1137,16 @@ def pair_twin(ctx: click.Context, twin_uuid: str, target_dir: str, yes: bool):
         print_warning("Pairing cancelled.")
         return
 
-    # Step 1: Register/discover edge device
-    console.print("\n[dim]Registering edge device...[/dim]")
-
-    edge_uuid = None
-    try:
-        headers = {"Authorization": f"Bearer {token}"}
-        discover_url = f"{base_url}/api/v1/edges/discover"
-
-        discover_payload = {
-            "fingerprint": fingerprint,
-            "hostname": device_info.get('hostname', ''),
-            "platform": f"{platform.system()}-{platform.machine()}",
-            "name": device_info.get('hostname', fingerprint[:20]),
-        }
-
-        with httpx.Client() as http_client:
-            response = http_client.post(
-                discover_url,
-                json=discover_payload,
-                headers=headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            edge_uuid = data.get("edge_uuid")
-
-        print_success(f"Edge registered: {edge_uuid[:8]}...")
-
-    except Exception as e:
-        print_error(f"Failed to register edge device: {e}")
-        return
-
-    # Step 2: Build config from schema (fully dynamic)
+    # Step 1: Build config from schema (fully dynamic)
     edge_config = _prompt_for_schema_fields(edge_config_schema, cli_overrides, yes)
 
-    # Step 3: Pair twin to edge
-    console.print("\n[dim]Binding twin to edge device...[/dim]")
+    # Step 2: Register edge device and bind the twin to it
+    console.print("\n[dim]Registering edge device and binding twin...[/dim]")
 
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        pair_url = f"{base_url}/api/v1/edges/{edge_uuid}/pair"
-
-        pair_payload = {
-            "twin_uuid": twin_uuid,
-            "camera_config": edge_config,  # Backend expects camera_config for now
-        }
-
-        with httpx.Client() as http_client:
-            response = http_client.post(
-                pair_url,
-                json=pair_payload,
-                headers=headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-
-        print_success(f"Twin '{twin_name}' bound to this edge")
-
+        edge_uuid = _do_edge_pairing(
+            base_url, token, twin_uuid, fingerprint, device_info, edge_config
+        )
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 409:
             print_warning("Twin already paired to a different device")
@@ -915,6 +1157,9 @@ def pair_twin(ctx: click.Context, twin_uuid: str, target_dir: str, yes: bool):
         print_error(f"Failed to pair twin: {e}")
         return
 
+    print_success(f"Edge registered: {edge_uuid[:8]}...")
+    print_success(f"Twin '{twin_name}' bound to this edge")
+
     # Stamp edge_fingerprint into twin metadata so edge-core can match this
     # twin to the device at startup (it filters twins by this field).
     try:
@@ -926,7 +1171,7 @@ def pair_twin(ctx: click.Context, twin_uuid: str, target_dir: str, yes: bool):
     except Exception as e:
         print_warning(f"Could not stamp edge_fingerprint on twin: {e}")
 
-    # Step 4: Write local .env file
+    # Step 3: Write local .env file
     write_edge_env(
         target_dir=target_dir,
         twin_uuid=twin_uuid,
@@ -963,35 +1208,96 @@ def pair_twin(ctx: click.Context, twin_uuid: str, target_dir: str, yes: bool):
 # =============================================================================
 
 
+# Fields rendered per twin row, fetched in one C-level call.
+_twin_row_fields = operator.attrgetter("name", "uuid", "asset_uuid", "environment_uuid")
+
+
+def _list_twins_limited(client: Any, environment: str | None, limit: int | None) -> Any:
+    """List twins, asking the backend for at most *limit* rows when it supports it.
+
+    SDKs without a ``limit`` kwarg raise ``TypeError``; the full listing is
+    then truncated client-side.
+    """
+    kwargs: dict[str, Any] = {"environment_id": environment} if environment else {}
+    if limit:
+        try:
+            twins = client.twins.list(limit=limit, **kwargs)
+        except TypeError:
+            logger.debug("twins.list does not support limit; truncating client-side")
+            twins = client.twins.list(**kwargs)
+        return list(twins)[:limit]
+    return client.twins.list(**kwargs)
+
+
+def _name_index(items: Any) -> dict[str, str]:
+    """Map ``str(uuid) -> name`` for a listing of SDK objects."""
+    return {str(item.uuid): item.name for item in items if getattr(item, "name", None)}
+
+
+def _resolve_twin_names(client: Any, twins: Any) -> tuple[dict[str, str], dict[str, str]]:
+    """Fetch asset and environment names for *twins* in one listing call each.
+
+    Joining client-side keeps ``twin list --resolve`` at three requests no
+    matter how many rows there are, instead of one lookup per twin. The two
+    listings run concurrently; a listing that fails just leaves its column
+    unresolved.
+    """
+    if not twins:
+        return {}, {}
+    assets_future = _setup_pool.submit(client.assets.list)
+    environments_future = _setup_pool.submit(client.environments.list)
+    names: list[dict[str, str]] = []
+    for kind, future in (("assets", assets_future), ("environments", environments_future)):
+        try:
+            names.append(_name_index(future.result()))
+        except Exception as e:
+            logger.debug("Could not list %s for name resolution: %s", kind, e)
+            names.append({})
+    return names[0], names[1]
+
+
 @twin.command("list")
 @click.option("--environment", "-e", help="Filter by environment UUID")
+@click.option(
+    "--limit",
+    "-l",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Show at most N twins",
+)
+@click.option(
+    "--resolve",
+    is_flag=True,
+    help="Show asset and environment names instead of UUIDs",
+)
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def list_twins(environment: str | None, as_json: bool):
+def list_twins(environment: str | None, limit: int | None, resolve: bool, as_json: bool):
     """List digital twins."""
-    import json as json_module
-
     client = get_sdk_client()
     if not client:
         print_error("Not logged in or SDK not installed.", "Run: cyberwave login")
         raise click.Abort()
 
     try:
-        if environment:
-            twins = client.twins.list(environment_id=environment)
-        else:
-            twins = client.twins.list()
+        twins = _list_twins_limited(client, environment, limit)
+        asset_names, environment_names = (
+            _resolve_twin_names(client, twins) if resolve else ({}, {})
+        )
 
         if as_json:
-            data = [
-                {
-                    "uuid": str(t.uuid),
-                    "name": t.name,
-                    "asset_uuid": str(t.asset_uuid) if t.asset_uuid else None,
-                    "environment_uuid": str(t.environment_uuid) if t.environment_uuid else None,
+            data = []
+            for name, uuid, asset_uuid, environment_uuid in map(_twin_row_fields, twins):
+                row = {
+                    "uuid": str(uuid),
+                    "name": name,
+                    "asset_uuid": str(asset_uuid) if asset_uuid else None,
+                    "environment_uuid": str(environment_uuid) if environment_uuid else None,
                 }
-                for t in twins
-            ]
-            console.print(json_module.dumps(data, indent=2))
+                if resolve:
+                    row["asset_name"] = asset_names.get(row["asset_uuid"])
+                    row["environment_name"] = environment_names.get(row["environment_uuid"])
+                data.append(row)
+            echo_json(data)
             return
 
         if not twins:
@@ -999,22 +1305,30 @@ def list_twins(environment: str | None, as_json: bool):
             console.print("[dim]Create one with: cyberwave twin create <asset>[/dim]")
             return
 
+        # Fixed-width, non-wrapping cells keep Rich's per-refresh measuring
+        # cheap on long listings.
         table = Table(title="Digital Twins")
-        table.add_column("Name", style="cyan")
-        table.add_column("UUID", style="dim")
-        table.add_column("Asset")
-        table.add_column("Environment")
-
-        for t in twins:
-            table.add_row(
-                t.name or "Unnamed",
-                truncate_uuid(t.uuid),
-                truncate_uuid(t.asset_uuid),
-                truncate_uuid(t.environment_uuid),
-            )
+        table.add_column("Name", style="cyan", no_wrap=True, overflow="ellipsis", max_width=40)
+        table.add_column("UUID", style="dim", no_wrap=True)
+        table.add_column("Asset", no_wrap=True, overflow="ellipsis", max_width=40)
+        table.add_column("Environment", no_wrap=True, overflow="ellipsis", max_width=40)
+
+        # Rows show up as they are added; Live's own throttled refresh avoids
+        # re-rendering the whole table for every row.
+        with Live(table, console=console, refresh_per_second=10):
+            for name, uuid, asset_uuid, environment_uuid in map(_twin_row_fields, twins):
+                table.add_row(
+                    name or "Unnamed",
+                    truncate_uuid(uuid),
+                    asset_names.get(str(asset_uuid)) or truncate_uuid(asset_uuid),
+                    environment_names.get(str(environment_uuid))
+                    or truncate_uuid(environment_uuid),
+                )
 
-        console.print(table)
-        console.print(f"\n[dim]Total: {len(twins)} twin(s)[/dim]")
+        if limit and len(twins) >= limit:
+            console.print(f"\n[dim]Showing first {len(twins)} twin(s) (--limit {limit})[/dim]")
+        else:
+            console.print(f"\n[dim]Total: {len(twins)} twin(s)[/dim]")
 
     except Exception as e:
         print_error(f"Failed to list twins: {e}")
@@ -1043,8 +1357,9 @@ def show_twin(uuid: str):
         console.print(f"  Asset: {twin_data.asset_uuid or 'None'}")
         console.print(f"  Environment: {twin_data.environment_uuid or 'None'}")
 
-        if hasattr(twin_data, 'capabilities') and twin_data.capabilities:
-            console.print(f"  Capabilities: {twin_data.capabilities}")
+        capabilities = getattr(twin_data, "capabilities", None)
+        if capabilities:
+            console.print(f"  Capabilities: {capabilities}")
 
     except Exception as e:
         print_error(f"Failed to get twin: {e}")
@@ -1057,22 +1372,44 @@ def show_twin(uuid: str):
 
 
 @twin.command("delete")
-@click.argument("uuid")
+@click.argument("uuids", nargs=-1, required=True)
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
-def delete_twin(uuid: str, yes: bool):
-    """Delete a digital twin."""
+def delete_twin(uuids: tuple[str, ...], yes: bool):
+    """Delete one or more digital twins."""
     client = get_sdk_client()
     if not client:
         print_error("Not logged in or SDK not installed.")
         raise click.Abort()
 
+    uuids = tuple(dict.fromkeys(uuids))
     if not yes:
-        if not click.confirm(f"Delete twin {uuid}?"):
+        prompt = f"Delete twin {uuids[0]}?" if len(uuids) == 1 else f"Delete {len(uuids)} twins?"
+        if not click.confirm(prompt):
             raise click.Abort()
 
-    try:
-        client.twins.delete(uuid)
-        print_success(f"Deleted twin: {uuid}")
-    except Exception as e:
-        print_error(f"Failed to delete twin: {e}")
+    if len(uuids) == 1:
+        try:
+            client.twins.delete(uuids[0])
+            print_success(f"Deleted twin: {uuids[0]}")
+        except Exception as e:
+            print_error(f"Failed to delete twin: {e}")
+            raise click.Abort()
+        return
+
+    # Deletes are independent; issue them concurrently.
+    failed = 0
+    with ThreadPoolExecutor(max_workers=min(8, len(uuids))) as pool:
+        futures = {pool.submit(client.twins.delete, uuid): uuid for uuid in uuids}
+        for future in as_completed(futures):
+            uuid = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                print_error(f"Failed to delete twin {uuid}: {e}")
+            else:
+                print_success(f"Deleted twin: {uuid}")
+
+    if failed:
+        print_error(f"{failed} of {len(uuids)} twin deletions failed.")
         raise click.Abort()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, NoReturn
 from urllib.error import HTTPError, URLError
@@ -12,10 +13,12 @@ from urllib.request import Request, urlopen
 
 import click
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 
 from ..credentials import load_credentials
-from ..utils import get_sdk_client, resolve_api_url
+from ..io_utils import echo_json
+from ..utils import get_sdk_client, resolve_api_url, truncate_uuid
 
 console = Console()
 
@@ -87,6 +90,13 @@ def _format_workflow_uuid_for_table(uuid) -> str:
     return str(uuid)
 
 
+def _short_description(description: str | None, width: int = 30) -> str:
+    """Clip a workflow description to *width* characters for table cells."""
+    if not description:
+        return "-"
+    return f"{description[:width]}..." if len(description) > width else description
+
+
 def _extract_twin_uuids(nodes) -> list[str]:
     """Extract unique twin UUIDs referenced by enabled workflow nodes."""
     seen: set[str] = set()
@@ -398,77 +408,70 @@ def list_workflows(as_json: bool, base_url: str | None):
             console.print("[dim]Create one with: cyberwave workflow create[/dim]")
             return
 
-        wf_twins: dict[str, list[str]] = {}
-        with console.status("[dim]Loading workflow details...[/dim]"):
-            for w in workflows:
-                try:
-                    nodes = client.api.src_app_api_workflows_list_workflow_nodes(
-                        str(w.uuid)
+        def _workflow_twins(w) -> list[str]:
+            try:
+                nodes = client.api.src_app_api_workflows_list_workflow_nodes(str(w.uuid))
+            except Exception:
+                return []
+            return _extract_twin_uuids(nodes)
+
+        # One node lookup per workflow; run them concurrently, but consume
+        # the results in listing order so the output order is stable.
+        with ThreadPoolExecutor(max_workers=min(8, len(workflows))) as pool:
+            twin_futures = [pool.submit(_workflow_twins, w) for w in workflows]
+
+            if as_json:
+                data = []
+                with console.status("[dim]Loading workflow details...[/dim]"):
+                    for w, twins_future in zip(workflows, twin_futures):
+                        environment_uuid = getattr(w, "environment_uuid", None)
+                        execution_target = getattr(w, "execution_target", None)
+                        data.append(
+                            {
+                                "uuid": str(w.uuid),
+                                "name": w.name,
+                                "is_active": w.is_active,
+                                "run_on_edge": bool(getattr(w, "run_on_edge", False)),
+                                "environment_uuid": (
+                                    str(environment_uuid) if environment_uuid else None
+                                ),
+                                "execution_target": (
+                                    str(execution_target) if execution_target else None
+                                ),
+                                "description": w.description,
+                                "twin_uuids": twins_future.result(),
+                            }
+                        )
+                echo_json(data)
+                return
+
+            table = Table(title="Workflows")
+            table.add_column("Name", style="cyan", no_wrap=True, overflow="ellipsis", max_width=40)
+            table.add_column("UUID", style="dim", no_wrap=True)
+            table.add_column("Status", no_wrap=True)
+            table.add_column("Target", no_wrap=True)
+            table.add_column("Affect", no_wrap=True)
+            table.add_column("Environment UUID", style="dim", no_wrap=True)
+            table.add_column("Twin(s)", style="magenta")
+            table.add_column("Description", no_wrap=True, overflow="ellipsis", max_width=33)
+
+            # Render each row as soon as it and every row above it are ready.
+            with Live(table, console=console, refresh_per_second=10):
+                for w, twins_future in zip(workflows, twin_futures):
+                    status = "[green]Active[/green]" if w.is_active else "[dim]Inactive[/dim]"
+                    target = "edge" if getattr(w, "run_on_edge", False) else "cloud"
+                    twins = twins_future.result()
+                    table.add_row(
+                        w.name or "Unnamed",
+                        _format_workflow_uuid_for_table(w.uuid),
+                        status,
+                        target,
+                        getattr(w, "execution_target", None) or "-",
+                        truncate_uuid(getattr(w, "environment_uuid", None)),
+                        ", ".join(map(truncate_uuid, twins)) if twins else "[dim]-[/dim]",
+                        _short_description(w.description),
                     )
-                    wf_twins[str(w.uuid)] = _extract_twin_uuids(nodes)
-                except Exception:
-                    wf_twins[str(w.uuid)] = []
-
-        if as_json:
-            data = [
-                {
-                    "uuid": str(w.uuid),
-                    "name": w.name,
-                    "is_active": w.is_active,
-                    "run_on_edge": bool(getattr(w, "run_on_edge", False)),
-                    "environment_uuid": (
-                        str(getattr(w, "environment_uuid", None))
-                        if getattr(w, "environment_uuid", None)
-                        else None
-                    ),
-                    "execution_target": (
-                        str(getattr(w, "execution_target", None))
-                        if getattr(w, "execution_target", None)
-                        else None
-                    ),
-                    "description": w.description,
-                    "twin_uuids": wf_twins.get(str(w.uuid), []),
-                }
-                for w in workflows
-            ]
-            console.print(json.dumps(data, indent=2))
-            return
-
-        table = Table(title="Workflows")
-        table.add_column("Name", style="cyan")
-        table.add_column("UUID", style="dim", no_wrap=True)
-        table.add_column("Status")
-        table.add_column("Target")
-        table.add_column("Affect")
-        table.add_column("Environment UUID", style="dim")
-        table.add_column("Twin(s)", style="magenta")
-        table.add_column("Description")
-
-        for w in workflows:
-            status = "[green]Active[/green]" if w.is_active else "[dim]Inactive[/dim]"
-            desc = (
-                (w.description[:30] + "...")
-                if w.description and len(w.description) > 30
-                else (w.description or "-")
-            )
-            target = "edge" if bool(getattr(w, "run_on_edge", False)) else "cloud"
-            affect = getattr(w, "execution_target", None) or "-"
-            environment_uuid = getattr(w, "environment_uuid", None)
-            env_fmt = str(environment_uuid)[:8] + "..." if environment_uuid else "-"
-            twins = wf_twins.get(str(w.uuid), [])
-            twins_fmt = ", ".join(t[:8] + "..." for t in twins) if twins else "[dim]-[/dim]"
-            table.add_row(
-                w.name or "Unnamed",
-                _format_workflow_uuid_for_table(w.uuid),
-                status,
-                target,
-                affect,
-                env_fmt,
-                twins_fmt,
-                desc,
-            )
 
-        console.print(table)
         console.print(f"\n[dim]Total: {len(workflows)} workflow(s)[/dim]")
 
     except Exception as e:
@@ -529,13 +532,16 @@ def create_workflow(name: str | None, template: str | None, base_url: str | None
             workflow_name = name
             workflow_desc = ""
 
-        # Get workspace for the workflow
-        workspaces = client.workspaces.list()
-        if not workspaces:
-            console.print("[red]✗[/red] No workspace found. Create one first.")
-            raise click.Abort()
-        
-        workspace_uuid = str(workspaces[0].uuid)
+        # Get workspace for the workflow: the one stored at login, which the
+        # API token is scoped to, saves a round trip; otherwise list them.
+        creds = load_credentials()
+        workspace_uuid = creds.workspace_uuid if creds else None
+        if not workspace_uuid:
+            workspaces = client.workspaces.list()
+            if not workspaces:
+                console.print("[red]✗[/red] No workspace found. Create one first.")
+                raise click.Abort()
+            workspace_uuid = str(workspaces[0].uuid)
 
         # Create workflow via SDK
         from cyberwave.rest.models import WorkflowCreateSchema
@@ -557,7 +563,7 @@ def create_workflow(name: str | None, template: str | None, base_url: str | None
             console.print(f"  Template: {template}")
         
         # Build UI URL
-        api_url = resolve_api_url(base_url, load_credentials())
+        api_url = resolve_api_url(base_url, creds)
         ui_url = api_url.replace(":8000", ":3000").replace("api.", "")
         console.print(f"\n[dim]View in UI: {ui_url}/workflows/{result.uuid}[/dim]")
         console.print("\n[yellow]Next:[/yellow] Add nodes in the UI workflow editor.")
@@ -583,8 +589,12 @@ def show_workflow(uuid: str | None, base_url: str | None):
         uuid = _pick_workflow(client, "Select a workflow to show", base_url)
 
     try:
-        w = client.api.src_app_api_workflows_get_workflow(uuid)
-        nodes = client.api.src_app_api_workflows_list_workflow_nodes(uuid)
+        # The backend has no "include nodes" variant of get_workflow, so
+        # overlap the two independent requests instead.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            nodes_future = pool.submit(client.api.src_app_api_workflows_list_workflow_nodes, uuid)
+            w = client.api.src_app_api_workflows_get_workflow(uuid)
+            nodes = nodes_future.result()
 
         console.print(f"\n[bold cyan]{w.name}[/bold cyan]")
         console.print(f"  UUID:        {w.uuid}")
@@ -965,75 +975,124 @@ def compile_workflow_source(uuid: str | None, output: str | None, base_url: str
     )
 
 
+def _apply_to_workflows(
+    uuids: tuple[str, ...],
+    call: Callable[[str], Any],
+    action: str,
+    done: str,
+    base_url: str | None,
+) -> None:
+    """Run *call* for each workflow UUID, concurrently when there are several.
+
+    A single UUID keeps the detailed :func:`_friendly_error` output. With
+    several, failures are reported per UUID and the command aborts at the
+    end if any of them failed.
+    """
+    if len(uuids) == 1:
+        try:
+            call(uuids[0])
+        except Exception as e:
+            _friendly_error(action, e, base_url)
+        console.print(f"[green]✓[/green] {done}: {uuids[0]}")
+        return
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=min(8, len(uuids))) as pool:
+        futures = {pool.submit(call, uuid): uuid for uuid in uuids}
+        for future in as_completed(futures):
+            uuid = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                console.print(f"[red]✗[/red] Failed to {action} {uuid}: {e.__cause__ or e}")
+            else:
+                console.print(f"[green]✓[/green] {done}: {uuid}")
+
+    if failed:
+        console.print(f"[red]✗[/red] {failed} of {len(uuids)} failed.")
+        raise click.Abort()
+
+
 @workflow.command("activate")
-@click.argument("uuid", required=False, default=None)
+@click.argument("uuids", nargs=-1)
 @_base_url_option
-def activate_workflow(uuid: str | None, base_url: str | None):
-    """Activate a workflow.
+def activate_workflow(uuids: tuple[str, ...], base_url: str | None):
+    """Activate one or more workflows.
 
-    If UUID is omitted, an interactive selector is shown.
+    If no UUID is given, an interactive selector is shown.
     """
     client = get_sdk_client(api_url=base_url)
     if not client:
         console.print("[red]✗[/red] Not logged in or SDK not installed.")
         raise click.Abort()
 
-    if not uuid:
-        uuid = _pick_workflow(client, "Select a workflow to activate", base_url)
+    if not uuids:
+        uuids = (_pick_workflow(client, "Select a workflow to activate", base_url),)
 
-    try:
-        client.api.src_app_api_workflows_activate_workflow(uuid)
-        console.print(f"[green]✓[/green] Workflow activated: {uuid}")
-    except Exception as e:
-        _friendly_error("activate workflow", e, base_url)
+    _apply_to_workflows(
+        tuple(dict.fromkeys(uuids)),
+        client.api.src_app_api_workflows_activate_workflow,
+        "activate workflow",
+        "Workflow activated",
+        base_url,
+    )
 
 
 @workflow.command("deactivate")
-@click.argument("uuid", required=False, default=None)
+@click.argument("uuids", nargs=-1)
 @_base_url_option
-def deactivate_workflow(uuid: str | None, base_url: str | None):
-    """Deactivate a workflow.
+def deactivate_workflow(uuids: tuple[str, ...], base_url: str | None):
+    """Deactivate one or more workflows.
 
-    If UUID is omitted, an interactive selector is shown.
+    If no UUID is given, an interactive selector is shown.
     """
     client = get_sdk_client(api_url=base_url)
     if not client:
         console.print("[red]✗[/red] Not logged in or SDK not installed.")
         raise click.Abort()
 
-    if not uuid:
-        uuid = _pick_workflow(client, "Select a workflow to deactivate", base_url)
+    if not uuids:
+        uuids = (_pick_workflow(client, "Select a workflow to deactivate", base_url),)
 
-    try:
-        client.api.src_app_api_workflows_deactivate_workflow(uuid)
-        console.print(f"[green]✓[/green] Workflow deactivated: {uuid}")
-    except Exception as e:
-        _friendly_error("deactivate workflow", e, base_url)
+    _apply_to_workflows(
+        tuple(dict.fromkeys(uuids)),
+        client.api.src_app_api_workflows_deactivate_workflow,
+        "deactivate workflow",
+        "Workflow deactivated",
+        base_url,
+    )
 
 
 @workflow.command("delete")
-@click.argument("uuid", required=False, default=None)
+@click.argument("uuids", nargs=-1)
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
 @_base_url_option
-def delete_workflow(uuid: str | None, yes: bool, base_url: str | None):
-    """Delete a workflow.
+def delete_workflow(uuids: tuple[str, ...], yes: bool, base_url: str | None):
+    """Delete one or more workflows.
 
-    If UUID is omitted, an interactive selector is shown.
+    If no UUID is given, an interactive selector is shown.
     """
     client = get_sdk_client(api_url=base_url)
     if not client:
         console.print("[red]✗[/red] Not logged in or SDK not installed.")
         raise click.Abort()
 
-    if not uuid:
-        uuid = _pick_workflow(client, "Select a workflow to delete", base_url)
+    if not uuids:
+        uuids = (_pick_workflow(client, "Select a workflow to delete", base_url),)
+    uuids = tuple(dict.fromkeys(uuids))
 
     if not yes:
-        if not click.confirm(f"Delete workflow {uuid}?"):
+        prompt = (
+            f"Delete workflow {uuids[0]}?" if len(uuids) == 1 else f"Delete {len(uuids)} workflows?"
+        )
+        if not click.confirm(prompt):
             raise click.Abort()
 
-    try:
-        client.api.src_app_api_workflows_delete_workflow(uuid)
-        console.print(f"[green]✓[/green] Deleted workflow: {uuid}")
-    except Exception as e:
-        _friendly_error("delete workflow", e, base_url)
+    _apply_to_workflows(
+        uuids,
+        client.api.src_app_api_workflows_delete_workflow,
+        "delete workflow",
+        "Deleted workflow",
+        base_url,
+    )
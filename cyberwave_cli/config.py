@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
 from pathlib import Path
 
+__all__ = [
+    "CAMERA_EDGE_DEFAULT_DIR",
+    "CAMERA_EDGE_REPO_URL",
+    "CONFIG_DIR",
+    "CREDENTIALS_FILE",
+    "LEGACY_SYSTEM_CONFIG_DIR",
+    "SO101_DEFAULT_DIR",
+    "SO101_REPO_URL",
+    "chown_to_sudo_user",
+    "clean_subprocess_env",
+    "clean_subprocess_env_view",
+    "ensure_edge_core_importable",
+    "get_api_url",
+]
+
 # Config directory shared by CLI, edge-core service, and driver containers.
 # All platforms resolve to ``~/.cyberwave`` under the invoking user's home
 # (even when running via ``sudo``).
@@ -16,16 +32,17 @@ from pathlib import Path
 LEGACY_SYSTEM_CONFIG_DIR = Path("/etc/cyberwave")
 
 
-def _resolve_sudo_user_home() -> Path | None:
-    """Return invoking user's home when running via sudo (best effort)."""
-    sudo_user = os.getenv("SUDO_USER", "").strip()
-    if not sudo_user:
-        return None
+@functools.lru_cache(maxsize=8)
+def _user_home(user: str) -> Path | None:
+    """Look up *user*'s home directory in the passwd database.
 
+    Cached because the lookup can go through NSS (LDAP, sssd) and is
+    repeated by every caller that resolves the sudo user's home.
+    """
     try:
         import pwd
 
-        home = pwd.getpwnam(sudo_user).pw_dir
+        home = pwd.getpwnam(user).pw_dir
     except Exception:
         return None
     if not home:
@@ -33,6 +50,14 @@ def _resolve_sudo_user_home() -> Path | None:
     return Path(home)
 
 
+def _resolve_sudo_user_home() -> Path | None:
+    """Return invoking user's home when running via sudo (best effort)."""
+    sudo_user = os.getenv("SUDO_USER", "").strip()
+    if not sudo_user:
+        return None
+    return _user_home(sudo_user)
+
+
 def _resolve_config_dir() -> Path:
     """Pick the config directory.
 
@@ -90,18 +115,26 @@ CAMERA_EDGE_REPO_URL = "https://github.com/cyberwave-os/cyberwave-edge-python.gi
 CAMERA_EDGE_DEFAULT_DIR = "cyberwave-camera"
 
 
-def get_api_url() -> str:
-    """Get the API URL from environment or default.
-
-    Checks ``CYBERWAVE_BASE_URL`` first, and finally to the SDK's
-    ``DEFAULT_BASE_URL``.
-    """
+@functools.lru_cache(maxsize=1)
+def _sdk_default_base_url() -> str:
     # Imported here (not at module level) to avoid triggering the full
     # cyberwave SDK init, which transitively imports numpy and adds ~2 s of
     # startup latency even for commands like `--help` that never touch the API.
     from cyberwave.config import DEFAULT_BASE_URL  # noqa: PLC0415
 
-    return os.getenv("CYBERWAVE_BASE_URL", DEFAULT_BASE_URL)
+    return DEFAULT_BASE_URL
+
+
+def get_api_url() -> str:
+    """Get the API URL from environment or default.
+
+    Checks ``CYBERWAVE_BASE_URL`` first, and finally to the SDK's
+    ``DEFAULT_BASE_URL`` (resolved once per process).
+    """
+    env_url = os.getenv("CYBERWAVE_BASE_URL")
+    if env_url is not None:
+        return env_url
+    return _sdk_default_base_url()
 
 
 _EDGE_CORE_DEB_PYTHON_PATH = "/usr/lib/cyberwave-edge-core/python"
@@ -121,6 +154,20 @@ def ensure_edge_core_importable() -> None:
             sys.path.insert(0, _EDGE_CORE_DEB_PYTHON_PATH)
 
 
+def clean_subprocess_env_view() -> dict[str, str] | None:
+    """Return an ``env=`` value for child processes, or None to inherit ours.
+
+    Outside a PyInstaller bundle there is nothing to clean, and passing
+    ``env=None`` lets ``subprocess`` hand the parent environment straight
+    to the child without copying ``os.environ`` first. Use this where the
+    environment is only passed through; use :func:`clean_subprocess_env`
+    when the caller needs a dict to modify.
+    """
+    if "LD_LIBRARY_PATH_ORIG" not in os.environ and not getattr(sys, "_MEIPASS", None):
+        return None
+    return clean_subprocess_env()
+
+
 def clean_subprocess_env() -> dict[str, str]:
     """Return a copy of os.environ safe for child processes.
 
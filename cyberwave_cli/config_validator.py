@@ -7,12 +7,39 @@ edge_runtimes metadata. Provides helpful error messages and suggestions.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 
 from rich.console import Console
 
 console = Console()
 
+# Compiled jsonschema validators, most recently used last. Keyed by a digest
+# of the canonical schema JSON so equal schemas loaded separately (asset
+# re-fetches, local files) share one validator; bounded to keep memory flat.
+_VALIDATOR_CACHE_SIZE = 128
+_VALIDATOR_CACHE: OrderedDict[str, Any] = OrderedDict()
+# Fast path for the same schema object seen again: id -> (schema, digest).
+_SCHEMA_DIGESTS: dict[int, tuple[dict, str]] = {}
+# validate_edge_config results for recently seen (schema, config) pairs, so
+# re-validating an unchanged config (retries, health checks) is a lookup.
+# Keyed by (schema digest, config digest, max_errors) -> (stored_at, errors).
+_RESULT_CACHE_SIZE = 512
+RESULT_CACHE_TTL_SECONDS = 60.0
+_ResultKey = tuple[str, str, int | None]
+_RESULT_CACHE: OrderedDict[_ResultKey, tuple[float, tuple[str, ...]]] = OrderedDict()
+# jsonschema's Draft7Validator once resolved (None when not installed).
+_UNRESOLVED: Any = object()
+_DRAFT7_VALIDATOR: Any = _UNRESOLVED
+# edge_runtimes lists indexed by name: id -> (list, length, index).
+_RUNTIME_INDEX: dict[int, tuple[list, int, dict]] = {}
+
 
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails."""
@@ -23,20 +50,19 @@ class ConfigValidationError(Exception):
         super().__init__(self._format_message())
     
     def _format_message(self) -> str:
-        msg = "Configuration validation failed:\n"
-        for error in self.errors:
-            msg += f"  • {error}\n"
+        parts = ["Configuration validation failed:\n"]
+        parts.extend(f"  • {error}\n" for error in self.errors)
         if self.suggestions:
-            msg += "\nSuggested fixes:\n"
-            for suggestion in self.suggestions:
-                msg += f"  • {suggestion}\n"
-        return msg
+            parts.append("\nSuggested fixes:\n")
+            parts.extend(f"  • {suggestion}\n" for suggestion in self.suggestions)
+        return "".join(parts)
 
 
 def validate_edge_config(
     config: dict,
     asset: dict,
-    runtime_name: str = "cyberwave-edge-python"
+    runtime_name: str = "cyberwave-edge-python",
+    max_errors: int | None = None,
 ) -> list[str]:
     """
     Validate edge configuration against asset's runtime schema.
@@ -45,12 +71,16 @@ def validate_edge_config(
         config: Edge configuration dictionary to validate.
         asset: Asset dictionary containing edge_runtimes metadata.
         runtime_name: Name of the runtime to validate against.
+        max_errors: Stop after this many errors instead of collecting
+            them all (e.g. when only the first few are displayed). Must be
+            at least 1.
     
     Returns:
         List of validation error messages. Empty list if valid.
     
     Raises:
         ConfigValidationError: If validation fails (optional, for convenience).
+        ValueError: If *max_errors* is less than 1.
     
     Example:
         >>> errors = validate_edge_config(
@@ -61,52 +91,338 @@ def validate_edge_config(
         >>> if errors:
         ...     print("Validation failed:", errors)
     """
+    if max_errors is not None and max_errors < 1:
+        raise ValueError(f"max_errors must be at least 1, got {max_errors}")
+
     errors = []
+    schema, runtime_error = _runtime_schema(asset, runtime_name)
+    if runtime_error:
+        errors.append(runtime_error)
+    if not schema:
+        # No runtime or no schema defined - skip validation
+        return errors
+    
+    cache_key = _result_cache_key(schema, config, max_errors)
+    if cache_key is not None:
+        entry = _RESULT_CACHE.get(cache_key)
+        if entry is not None:
+            if time.monotonic() - entry[0] <= RESULT_CACHE_TTL_SECONDS:
+                _RESULT_CACHE.move_to_end(cache_key)
+                return list(entry[1])
+            del _RESULT_CACHE[cache_key]
+
+    # Try to use jsonschema for validation
+    validator = _get_validator(schema)
+    if validator is not None:
+        for error in islice(validator.iter_errors(config), max_errors):
+            path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
+            errors.append(f"{path}: {error.message}")
+    else:
+        # jsonschema not available - do basic validation
+        errors.extend(_basic_validation(config, schema, max_errors=max_errors))
     
-    # Get runtime configuration
+    if cache_key is not None:
+        _RESULT_CACHE[cache_key] = (time.monotonic(), tuple(errors))
+        if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return errors
+
+
+def clear_validation_cache() -> None:
+    """Drop remembered :func:`validate_edge_config` results."""
+    _RESULT_CACHE.clear()
+
+
+def is_edge_config_valid(
+    config: dict,
+    asset: dict,
+    runtime_name: str = "cyberwave-edge-python"
+) -> bool:
+    """
+    Return whether *config* passes :func:`validate_edge_config`.
+
+    Stops at the first problem instead of collecting and formatting every
+    error, for callers that only need pass/fail (e.g. a pre-flight check).
+    """
+    schema, runtime_error = _runtime_schema(asset, runtime_name)
+    if runtime_error:
+        return False
+    if not schema:
+        return True
+
+    validator = _get_validator(schema)
+    if validator is not None:
+        return validator.is_valid(config)
+    return not _basic_validation(config, schema, max_errors=1)
+
+
+def _runtimes_by_name(runtimes: list[dict]) -> dict[Any, dict]:
+    """Index an asset's ``edge_runtimes`` by name, once per list object.
+
+    Validating many configs against one asset then does a dict lookup
+    instead of rescanning the list. The first runtime with a given name
+    wins, as with a linear scan.
+    """
+    entry = _RUNTIME_INDEX.get(id(runtimes))
+    if entry is not None and entry[0] is runtimes and entry[1] == len(runtimes):
+        return entry[2]
+    index: dict[Any, dict] = {}
+    for runtime in runtimes:
+        index.setdefault(runtime.get('name'), runtime)
+    if len(_RUNTIME_INDEX) >= _VALIDATOR_CACHE_SIZE:
+        _RUNTIME_INDEX.clear()
+    _RUNTIME_INDEX[id(runtimes)] = (runtimes, len(runtimes), index)
+    return index
+
+
+def _runtime_schema(asset: dict, runtime_name: str) -> tuple[dict | None, str | None]:
+    """Return ``(config_schema, error)`` for *runtime_name* on *asset*.
+
+    The error is set only when the asset declares runtimes but not this
+    one; a missing runtime list or schema means there is nothing to check.
+    """
     metadata = asset.get('metadata', {}) or {}
     runtimes = metadata.get('edge_runtimes', [])
     
-    runtime = None
-    for r in runtimes:
-        if r.get('name') == runtime_name:
-            runtime = r
-            break
+    runtime = _runtimes_by_name(runtimes).get(runtime_name) if runtimes else None
     
     if not runtime:
-        # No runtime found - check if any runtimes exist
         if runtimes:
             available = [r.get('name', 'unknown') for r in runtimes]
-            errors.append(
+            return None, (
                 f"Runtime '{runtime_name}' not supported by this asset. "
                 f"Available: {', '.join(available)}"
             )
-        # If no runtimes defined, skip validation
-        return errors
-    
-    # Get schema for this runtime
-    schema = runtime.get('config_schema')
-    if not schema:
-        # No schema defined - skip validation
-        return errors
-    
-    # Try to use jsonschema for validation
+        return None, None
+
+    return runtime.get('config_schema') or None, None
+
+
+def _result_cache_key(
+    schema: dict, config: dict, max_errors: int | None
+) -> tuple[str, str, int | None] | None:
+    """Key for the result cache, or None if *config* isn't plain JSON."""
     try:
-        from jsonschema import Draft7Validator, ValidationError
-        
-        validator = Draft7Validator(schema)
-        for error in validator.iter_errors(config):
-            path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
-            errors.append(f"{path}: {error.message}")
-        
-    except ImportError:
-        # jsonschema not available - do basic validation
-        errors.extend(_basic_validation(config, schema))
-    
-    return errors
+        canonical = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    config_digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+    return _schema_digest(schema), config_digest, max_errors
+
 
+def _schema_digest(schema: dict) -> str:
+    """Return a stable digest of *schema*, reusing it for the same object."""
+    entry = _SCHEMA_DIGESTS.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+    if len(_SCHEMA_DIGESTS) >= _VALIDATOR_CACHE_SIZE:
+        _SCHEMA_DIGESTS.clear()
+    _SCHEMA_DIGESTS[id(schema)] = (schema, digest)
+    return digest
 
-def _basic_validation(config: dict, schema: dict) -> list[str]:
+
+def _draft7_validator_class() -> Any:
+    """Return jsonschema's ``Draft7Validator``, or None if it isn't installed.
+
+    The import is attempted once; later calls reuse the answer instead of
+    going through the import machinery on every validation.
+    """
+    global _DRAFT7_VALIDATOR
+    if _DRAFT7_VALIDATOR is _UNRESOLVED:
+        try:
+            import jsonschema
+        except ImportError:
+            validator_class = None
+        else:
+            validator_class = jsonschema.Draft7Validator
+        _DRAFT7_VALIDATOR = validator_class
+    return _DRAFT7_VALIDATOR
+
+
+def _get_validator(schema: dict) -> Any:
+    """
+    Return a compiled ``Draft7Validator`` for *schema*, building it once.
+
+    Returns None if jsonschema is not installed.
+    """
+    validator_class = _draft7_validator_class()
+    if validator_class is None:
+        return None
+
+    digest = _schema_digest(schema)
+    validator = _VALIDATOR_CACHE.get(digest)
+    if validator is not None:
+        _VALIDATOR_CACHE.move_to_end(digest)
+        return validator
+
+    validator = validator_class(schema)
+    _VALIDATOR_CACHE[digest] = validator
+    if len(_VALIDATOR_CACHE) > _VALIDATOR_CACHE_SIZE:
+        _VALIDATOR_CACHE.popitem(last=False)
+    return validator
+
+
+class ValidationIssue(str):
+    """A validation error message that also records what failed.
+
+    Subclasses ``str`` so callers that print, join or compare error
+    messages keep working, while :func:`suggest_fixes` reads the bound or
+    choices directly instead of parsing them back out of the text.
+    ``kind`` is one of ``missing``, ``type``, ``enum``, ``minimum``,
+    ``maximum``, ``min_length`` or ``max_length``.
+    """
+
+    path: str
+    kind: str
+    value: Any
+    bound: Any
+    allowed: tuple
+
+    def __new__(
+        cls,
+        message: str,
+        *,
+        path: str = "",
+        kind: str = "",
+        value: Any = None,
+        bound: Any = None,
+        allowed: tuple = (),
+    ) -> ValidationIssue:
+        issue = super().__new__(cls, message)
+        issue.path = path
+        issue.kind = kind
+        issue.value = value
+        issue.bound = bound
+        issue.allowed = allowed
+        return issue
+
+
+# JSON Schema type name -> exact Python types of JSON-decoded values.
+# Matched with ``type(value) in ...`` rather than isinstance, so booleans
+# (a subclass of int) aren't accepted as integers/numbers, as in JSON Schema.
+_TYPE_MAP: dict[str, frozenset[type]] = {
+    'string': frozenset({str}),
+    'integer': frozenset({int}),
+    'number': frozenset({int, float}),
+    'boolean': frozenset({bool}),
+    'array': frozenset({list}),
+    'object': frozenset({dict}),
+}
+_NUMERIC_TYPES = _TYPE_MAP['number']
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledNode:
+    """One schema node with its constraints pulled out ahead of time."""
+
+    expected_type: str | None = None
+    python_types: frozenset[type] | None = None
+    enum: list | None = None
+    enum_set: frozenset | None = None
+    minimum: Any = None
+    maximum: Any = None
+    min_length: int | None = None
+    max_length: int | None = None
+    items: _CompiledNode | None = None
+    properties: dict[str, _CompiledNode] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledSchema:
+    """Top-level object schema: required keys plus compiled properties."""
+
+    required: tuple[str, ...]
+    properties: dict[str, _CompiledNode]
+
+
+# Compiled fallback schemas keyed by id(); the schema itself is kept in the
+# entry so a recycled id can't return another schema's compilation.
+_COMPILED_BASIC: dict[int, tuple[dict, _CompiledSchema]] = {}
+
+
+def _enum_set(enum: list) -> frozenset | None:
+    """Hashable enum choices as a frozenset, or None if any can't be hashed."""
+    try:
+        return frozenset(enum)
+    except TypeError:
+        return None
+
+
+def _python_types(expected_type: Any) -> frozenset[type] | None:
+    """Python types accepted for a schema ``type``, or None to skip the check.
+
+    A list of type names is a union; ``null`` only counts inside one, as a
+    bare ``"null"`` was never checked. Unknown names disable the check.
+    """
+    if isinstance(expected_type, str):
+        return _TYPE_MAP.get(expected_type)
+    if not isinstance(expected_type, list):
+        return None
+    types: set[type] = set()
+    for name in expected_type:
+        if name == 'null':
+            types.add(type(None))
+        elif isinstance(name, str) and name in _TYPE_MAP:
+            types |= _TYPE_MAP[name]
+        else:
+            return None
+    return frozenset(types) or None
+
+
+def _compile_properties(properties: Any) -> dict[str, _CompiledNode]:
+    """Compile the dict subschemas of *properties*; anything else is unconstrained."""
+    if not isinstance(properties, dict):
+        return {}
+    return {key: _compile_node(sub) for key, sub in properties.items() if isinstance(sub, dict)}
+
+
+def _compile_node(schema: dict) -> _CompiledNode:
+    expected_type = schema.get('type')
+    python_types = _python_types(expected_type)
+    enum = schema['enum'] if 'enum' in schema else None
+    items = schema.get('items')
+    properties = schema.get('properties')
+    return _CompiledNode(
+        expected_type=(
+            " or ".join(expected_type) if python_types and type(expected_type) is list
+            else expected_type if python_types else None
+        ),
+        python_types=python_types,
+        enum=enum,
+        enum_set=_enum_set(enum) if enum is not None else None,
+        minimum=schema.get('minimum'),
+        maximum=schema.get('maximum'),
+        min_length=schema.get('minLength'),
+        max_length=schema.get('maxLength'),
+        # Tuple-form and boolean ``items`` aren't checked by the fallback.
+        items=_compile_node(items) if isinstance(items, dict) else None,
+        properties=_compile_properties(properties) if properties is not None else None,
+    )
+
+
+def _compile_basic(schema: dict) -> _CompiledSchema:
+    """Compile *schema* for :func:`_basic_validation`, once per schema object.
+
+    Walking the raw schema re-does every dict lookup for every value;
+    compiling pulls the constraints out once so validation only checks the
+    ones a node actually has.
+    """
+    entry = _COMPILED_BASIC.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    compiled = _CompiledSchema(
+        required=tuple(schema.get('required', [])),
+        properties=_compile_properties(schema.get('properties', {})),
+    )
+    if len(_COMPILED_BASIC) >= _VALIDATOR_CACHE_SIZE:
+        _COMPILED_BASIC.clear()
+    _COMPILED_BASIC[id(schema)] = (schema, compiled)
+    return compiled
+
+
+def _basic_validation(config: dict, schema: dict, max_errors: int | None = None) -> list[str]:
     """
     Basic validation without jsonschema library.
     
@@ -114,79 +430,136 @@ def _basic_validation(config: dict, schema: dict) -> list[str]:
     - Required fields are present
     - Basic type matching
     - Enum values
+
+    Stops once *max_errors* errors have been found, if given.
     """
-    errors = []
-    properties = schema.get('properties', {})
-    required = schema.get('required', [])
-    
+    errors: list[str] = []
+    compiled = _compile_basic(schema)
+
     # Check required fields
-    for field in required:
+    for field in compiled.required:
         if field not in config:
-            errors.append(f"Missing required field: {field}")
-    
+            errors.append(
+                ValidationIssue(f"Missing required field: {field}", path=field, kind="missing")
+            )
+            if max_errors is not None and len(errors) >= max_errors:
+                return errors
+
     # Check types and constraints for provided fields
+    properties = compiled.properties
     for field, value in config.items():
-        if field not in properties:
-            continue
-        
-        prop_schema = properties[field]
-        errors.extend(_validate_value(field, value, prop_schema))
-    
+        node = properties.get(field)
+        if node is not None:
+            _validate_value((field,), value, node, errors, max_errors)
+            if max_errors is not None and len(errors) >= max_errors:
+                del errors[max_errors:]
+                break
+
     return errors
 
 
-def _validate_value(path: str, value: Any, schema: dict) -> list[str]:
-    """Validate a single value against its schema."""
-    errors = []
-    expected_type = schema.get('type')
-    
-    # Type checking
-    type_map = {
-        'string': str,
-        'integer': int,
-        'number': (int, float),
-        'boolean': bool,
-        'array': list,
-        'object': dict,
-    }
-    
-    if expected_type and expected_type in type_map:
-        expected = type_map[expected_type]
-        if not isinstance(value, expected):
-            errors.append(f"{path}: Expected {expected_type}, got {type(value).__name__}")
-            return errors  # Skip further validation if type is wrong
-    
-    # Enum validation
-    if 'enum' in schema and value not in schema['enum']:
-        errors.append(f"{path}: '{value}' not in allowed values: {schema['enum']}")
-    
-    # Numeric constraints
-    if isinstance(value, (int, float)):
-        if 'minimum' in schema and value < schema['minimum']:
-            errors.append(f"{path}: {value} is below minimum ({schema['minimum']})")
-        if 'maximum' in schema and value > schema['maximum']:
-            errors.append(f"{path}: {value} exceeds maximum ({schema['maximum']})")
-    
-    # String constraints
-    if isinstance(value, str):
-        if 'minLength' in schema and len(value) < schema['minLength']:
-            errors.append(f"{path}: String too short (min {schema['minLength']})")
-        if 'maxLength' in schema and len(value) > schema['maxLength']:
-            errors.append(f"{path}: String too long (max {schema['maxLength']})")
-    
-    # Array validation
-    if isinstance(value, list) and 'items' in schema:
-        item_schema = schema['items']
-        for i, item in enumerate(value):
-            errors.extend(_validate_value(f"{path}[{i}]", item, item_schema))
-    
-    # Object validation
-    if isinstance(value, dict) and 'properties' in schema:
-        for key, val in value.items():
-            if key in schema['properties']:
-                errors.extend(_validate_value(f"{path}.{key}", val, schema['properties'][key]))
-    
-    return errors
+def _format_path(segments: tuple[str | int, ...]) -> str:
+    """Render path segments as ``cameras[0].fps``."""
+    parts = [str(segments[0])]
+    for segment in segments[1:]:
+        parts.append(f"[{segment}]" if type(segment) is int else f".{segment}")
+    return "".join(parts)
+
+
+def _enum_contains(node: _CompiledNode, value: Any) -> bool:
+    if node.enum_set is not None:
+        try:
+            return value in node.enum_set
+        except TypeError:  # unhashable value, e.g. a list
+            pass
+    return value in node.enum
+
+
+def _validate_value(
+    path: tuple[str | int, ...],
+    value: Any,
+    node: _CompiledNode,
+    errors: list[str],
+    max_errors: int | None = None,
+) -> None:
+    """Validate a value and everything nested in it against a compiled node.
+
+    Walks with an explicit stack instead of recursing, so large nested
+    configs don't pay for a Python frame per element. Children are pushed
+    in reverse so errors come out in document order. *path* is kept as a
+    tuple of keys and indices and only rendered when an error is reported,
+    since valid values (the common case) never need it as a string.
+    Returns early once *errors* holds *max_errors* entries.
+    """
+    stack: list[tuple[tuple[str | int, ...], Any, _CompiledNode]] = [(path, value, node)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        if max_errors is not None and len(errors) >= max_errors:
+            return
+        path, value, node = pop()
+        value_type = type(value)
+
+        # Type checking
+        if node.python_types is not None and value_type not in node.python_types:
+            where = _format_path(path)
+            errors.append(ValidationIssue(
+                f"{where}: Expected {node.expected_type}, got {value_type.__name__}",
+                path=where, kind="type", value=value, bound=node.expected_type,
+            ))
+            continue  # Skip further validation if type is wrong
+
+        # Enum validation
+        if node.enum is not None and not _enum_contains(node, value):
+            where = _format_path(path)
+            errors.append(ValidationIssue(
+                f"{where}: '{value}' not in allowed values: {node.enum}",
+                path=where, kind="enum", value=value, allowed=tuple(node.enum),
+            ))
+
+        # Numeric constraints
+        if value_type in _NUMERIC_TYPES:
+            if node.minimum is not None and value < node.minimum:
+                where = _format_path(path)
+                errors.append(ValidationIssue(
+                    f"{where}: {value} is below minimum ({node.minimum})",
+                    path=where, kind="minimum", value=value, bound=node.minimum,
+                ))
+            if node.maximum is not None and value > node.maximum:
+                where = _format_path(path)
+                errors.append(ValidationIssue(
+                    f"{where}: {value} exceeds maximum ({node.maximum})",
+                    path=where, kind="maximum", value=value, bound=node.maximum,
+                ))
+
+        # String constraints
+        elif value_type is str:
+            if node.min_length is not None and len(value) < node.min_length:
+                where = _format_path(path)
+                errors.append(ValidationIssue(
+                    f"{where}: String too short (min {node.min_length})",
+                    path=where, kind="min_length", value=value, bound=node.min_length,
+                ))
+            if node.max_length is not None and len(value) > node.max_length:
+                where = _format_path(path)
+                errors.append(ValidationIssue(
+                    f"{where}: String too long (max {node.max_length})",
+                    path=where, kind="max_length", value=value, bound=node.max_length,
+                ))
+
+        # Array validation
+        elif value_type is list and node.items is not None:
+            items = node.items
+            for i in range(len(value) - 1, -1, -1):
+                push((path + (i,), value[i], items))
+
+        # Object validation
+        elif value_type is dict and node.properties is not None:
+            properties = node.properties
+            for key, val in reversed(value.items()):
+                sub = properties.get(key)
+                if sub is not None:
+                    push((path + (key,), val, sub))
 
 
 def format_validation_errors(errors: list[str], suggestions: list[str] | None = None) -> str:
@@ -215,6 +588,50 @@ def format_validation_errors(errors: list[str], suggestions: list[str] | None =
     return "\n".join(lines)
 
 
+# Patterns for pulling bounds/choices back out of our own error messages.
+_RE_MAXIMUM = re.compile(r'maximum \((\d+)\)')
+_RE_MINIMUM = re.compile(r'minimum \((\d+)\)')
+_RE_ALLOWED = re.compile(r"allowed values: \[([^\]]+)\]")
+
+
+def _bound_after(error: str, marker: str, pattern: re.Pattern[str]) -> str | None:
+    """Return the integer bound in ``"... <marker> (N)"``, or None.
+
+    Our own messages end with the bound in parentheses, so plain string
+    slicing finds it; the regex only runs for messages in another shape.
+    """
+    _, found, tail = error.rpartition(f"{marker} (")
+    if found and tail.endswith(")") and tail[:-1].isdigit():
+        return tail[:-1]
+    match = pattern.search(error)
+    return match.group(1) if match else None
+
+
+def _allowed_values(error: str) -> str | None:
+    """Return the ``a, b`` part of ``"... allowed values: [a, b]"``, or None."""
+    _, found, tail = error.partition("allowed values: [")
+    if found:
+        allowed, closed, _ = tail.partition("]")
+        if closed and allowed:
+            return allowed
+    match = _RE_ALLOWED.search(error)
+    return match.group(1) if match else None
+
+
+def _suggest_for_issue(issue: ValidationIssue) -> str | None:
+    """Suggestion for a structured issue; mirrors the text-based rules below."""
+    kind = issue.kind
+    if kind == "maximum":
+        return f"Set {issue.path} to {issue.bound} (maximum supported)"
+    if kind == "minimum":
+        return f"Set {issue.path} to at least {issue.bound}"
+    if kind == "enum" and issue.allowed:
+        return f"Use one of: {', '.join(map(repr, issue.allowed))}"
+    if kind == "missing":
+        return f"Add required field: {issue.path}"
+    return None
+
+
 def suggest_fixes(errors: list[str], schema: dict | None = None) -> list[str]:
     """
     Generate fix suggestions based on validation errors.
@@ -229,30 +646,29 @@ def suggest_fixes(errors: list[str], schema: dict | None = None) -> list[str]:
     suggestions = []
     
     for error in errors:
+        if isinstance(error, ValidationIssue):
+            suggestion = _suggest_for_issue(error)
+            if suggestion:
+                suggestions.append(suggestion)
+            continue
+
         # Extract field and issue from error message
         if "exceeds maximum" in error:
             # Extract the maximum value and suggest it
-            if "maximum" in error:
-                import re
-                match = re.search(r'maximum \((\d+)\)', error)
-                if match:
-                    max_val = match.group(1)
-                    field = error.split(':')[0] if ':' in error else 'value'
-                    suggestions.append(f"Set {field} to {max_val} (maximum supported)")
+            max_val = _bound_after(error, "maximum", _RE_MAXIMUM)
+            if max_val:
+                field = error.partition(':')[0] if ':' in error else 'value'
+                suggestions.append(f"Set {field} to {max_val} (maximum supported)")
         
         elif "below minimum" in error:
-            import re
-            match = re.search(r'minimum \((\d+)\)', error)
-            if match:
-                min_val = match.group(1)
-                field = error.split(':')[0] if ':' in error else 'value'
+            min_val = _bound_after(error, "minimum", _RE_MINIMUM)
+            if min_val:
+                field = error.partition(':')[0] if ':' in error else 'value'
                 suggestions.append(f"Set {field} to at least {min_val}")
         
         elif "not in allowed values" in error:
-            import re
-            match = re.search(r"allowed values: \[([^\]]+)\]", error)
-            if match:
-                allowed = match.group(1)
+            allowed = _allowed_values(error)
+            if allowed:
                 suggestions.append(f"Use one of: {allowed}")
         
         elif "Missing required field" in error:
@@ -7,6 +7,11 @@ The authoritative source is cyberwave_edge.plugins.registry.BUILTIN_PLUGINS.
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 # Fallback plugin definitions when edge package is not available
 BUILTIN_PLUGINS_FALLBACK: dict[str, dict] = {
     "yolo": {
@@ -125,12 +130,15 @@ BUILTIN_PLUGINS_FALLBACK: dict[str, dict] = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def get_builtin_plugins() -> dict[str, dict]:
     """
     Get built-in plugin definitions.
     
     Attempts to import from edge package for single source of truth.
     Falls back to BUILTIN_PLUGINS_FALLBACK if edge package not available.
+    The import is attempted once per process (not at module import, so
+    CLI startup doesn't pay for it).
     
     Returns:
         Dictionary of plugin_id -> plugin definition
@@ -142,29 +150,28 @@ def get_builtin_plugins() -> dict[str, dict]:
         return BUILTIN_PLUGINS_FALLBACK
 
 
-def get_fallback_models() -> dict[str, dict]:
+@functools.lru_cache(maxsize=1)
+def get_fallback_models() -> Mapping[str, Mapping[str, Any]]:
     """
     Get fallback edge models in a flat format.
     
     Converts plugin format to a simpler model-focused format for
-    model listing and binding commands.
+    model listing and binding commands. Built once per process; the
+    result is read-only since every caller shares it.
     
     Returns:
-        Dictionary of model_id -> model info
+        Read-only mapping of model_id -> model info
     """
-    plugins = get_builtin_plugins()
-    models: dict[str, dict] = {}
-    
-    for plugin in plugins.values():
-        runtime = plugin.get("runtime", "")
-        for m in plugin.get("models", []):
-            models[m["id"]] = {
-                "name": m.get("name", m["id"]),
-                "description": m.get("description", ""),
-                "runtime": runtime,
-                "model_path": m.get("path", ""),
-                "event_types": [f"{m.get('task', 'detect')}_detected"],
-                "plugin_id": plugin.get("id", ""),
-            }
-    
-    return models
+    return MappingProxyType({
+        m["id"]: MappingProxyType({
+            "name": m.get("name", m["id"]),
+            "description": m.get("description", ""),
+            "runtime": runtime,
+            "model_path": m.get("path", ""),
+            "event_types": (f"{m.get('task', 'detect')}_detected",),
+            "plugin_id": plugin_id,
+        })
+        for plugin in get_builtin_plugins().values()
+        for plugin_id, runtime in ((plugin.get("id", ""), plugin.get("runtime", "")),)
+        for m in plugin.get("models", ())
+    })
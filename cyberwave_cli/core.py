@@ -8,17 +8,20 @@ This module provides the logic for:
 
 from __future__ import annotations
 
+import base64
+import functools
 import json
 import os
 import platform
-import plistlib
 import shlex
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
 import textwrap
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -31,14 +34,18 @@ from .config import (
     LEGACY_SYSTEM_CONFIG_DIR,
     chown_to_sudo_user,
     clean_subprocess_env,
+    clean_subprocess_env_view,
     ensure_edge_core_importable,
     get_api_url,
 )
 from .credentials import (
     Credentials,
     collect_runtime_env_overrides,
+    forget_token_verification,
     load_credentials,
+    mark_token_verified,
     save_credentials,
+    token_recently_verified,
 )
 
 from .macos import (
@@ -78,6 +85,11 @@ BUILDKITE_DEB_REPO_URL = "https://packages.buildkite.com/cyberwave/cyberwave-edg
 BUILDKITE_GPG_KEY_URL = "https://packages.buildkite.com/cyberwave/cyberwave-edge-core/gpgkey"
 BUILDKITE_KEYRING_PATH = Path("/etc/apt/keyrings/cyberwave_cyberwave-edge-core-archive-keyring.gpg")
 
+# apt-get update replaces files in this directory, so its mtime tells us how
+# recently the package index was refreshed.
+APT_LISTS_DIR = Path("/var/lib/apt/lists")
+APT_INDEX_FRESH_SECONDS = 600
+
 SYSTEMD_UNIT_TEMPLATE = textwrap.dedent("""\
     [Unit]
     Description=Cyberwave Edge Core Orchestrator
@@ -197,14 +209,19 @@ CLOUD_NODE_SPEC = ServiceSpec(
 # ---- helpers -----------------------------------------------------------------
 
 
+# Platform probes are invariant for the life of the process and are hit
+# from most entry points, so each is evaluated once.
+@functools.lru_cache(maxsize=1)
 def _is_linux() -> bool:
     return platform.system() == "Linux"
 
 
+@functools.lru_cache(maxsize=1)
 def _is_macos() -> bool:
     return platform.system() == "Darwin"
 
 
+@functools.lru_cache(maxsize=1)
 def _has_systemd() -> bool:
     return Path("/run/systemd/system").is_dir()
 
@@ -289,7 +306,7 @@ def is_service_active(spec: ServiceSpec = EDGE_CORE_SPEC) -> bool:
 def _run(cmd: list[str], *, check: bool = True, **kwargs) -> subprocess.CompletedProcess:
     """Run a subprocess and stream output to the console."""
     console.print(f"[dim]$ {' '.join(cmd)}[/dim]")
-    kwargs.setdefault("env", clean_subprocess_env())
+    kwargs.setdefault("env", clean_subprocess_env_view())
     return subprocess.run(cmd, check=check, **kwargs)
 
 
@@ -312,10 +329,48 @@ from .interactive_select import _select_with_arrows, _select_multiple_with_arrow
 
 
 def _get_sdk_client(token: str, *, base_url: str | None = None):
-    """Create a Cyberwave SDK client from a token."""
+    """Return a Cyberwave SDK client for a token, reused within the process."""
+    return _build_sdk_client(token, base_url or get_api_url())
+
+
+@functools.lru_cache(maxsize=4)
+def _build_sdk_client(token: str, base_url: str):
+    """Import the SDK and construct its client once per (token, URL).
+
+    The install flow asks for a client at several steps; sharing one keeps
+    its connection pool warm instead of re-importing and re-connecting.
+    """
     from cyberwave import Cyberwave
 
-    return Cyberwave(base_url=base_url or get_api_url(), token=token)
+    return Cyberwave(base_url=base_url, token=token)
+
+
+def _create_file_from_tmpfile(path: Path, data: bytes, mode: int = 0o600) -> bool:
+    """Create *path* from an unnamed ``O_TMPFILE`` inode on Linux.
+
+    The inode only gets a name once it is fully written and synced, with
+    *mode* from the start, so a crash never leaves a temp file behind.
+    ``linkat`` can't replace an existing file, so this is for first writes;
+    returns False (nothing created) when unsupported or *path* exists.
+    """
+    o_tmpfile = getattr(os, "O_TMPFILE", None)
+    if o_tmpfile is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fd = os.open(path.parent, o_tmpfile | os.O_WRONLY, mode)
+    except OSError:  # e.g. EOPNOTSUPP on filesystems without O_TMPFILE
+        return False
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+        os.link(f"/proc/self/fd/{fd}", path)
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+    return True
 
 
 def _save_environment_file(
@@ -325,8 +380,17 @@ def _save_environment_file(
     environment_uuid: str | None = None,
     environment_name: str | None = None,
     twin_uuids: list[str] | None = None,
+    durable: bool = False,
 ) -> None:
-    """Persist selected workspace/environment for edge startup."""
+    """Persist selected workspace/environment for edge startup.
+
+    The temp file is fsynced before the rename, so after a crash edge-core
+    sees either the old or the new file, never a torn one. The directory
+    fsync that makes the rename itself survive power loss is only done
+    when *durable* is set: the file is regenerated by
+    ``configure_edge_environment``, so losing the latest write is cheap.
+    Nothing is written when the file already holds the same payload.
+    """
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     payload: dict[str, Any] = {
         "workspace_uuid": workspace_uuid,
@@ -339,49 +403,67 @@ def _save_environment_file(
     if twin_uuids is not None:
         payload["twin_uuids"] = twin_uuids
 
-    serialized_payload = json.dumps(payload, indent=2) + "\n"
+    # Only edge-core reads this file, so write it compact.
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    # Re-running configure usually selects the same environment; leave an
+    # identical file alone rather than rewriting and fsyncing it.
+    try:
+        if ENVIRONMENT_FILE.read_bytes() == data:
+            return
+        exists = True
+    except FileNotFoundError:
+        exists = False
+    except OSError:
+        exists = True
 
     # Write atomically so edge-core never observes a partially written file.
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
-        dir=CONFIG_DIR,
-        prefix=f".{ENVIRONMENT_FILE.name}.",
-        suffix=".tmp",
-        delete=False,
-    ) as tmp_file:
-        tmp_path = Path(tmp_file.name)
-        tmp_file.write(serialized_payload)
-        tmp_file.flush()
-        os.fsync(tmp_file.fileno())
-
-    os.replace(tmp_path, ENVIRONMENT_FILE)
+    if exists or not _create_file_from_tmpfile(ENVIRONMENT_FILE, data):
+        with tempfile.NamedTemporaryFile(
+            mode="wb",
+            dir=CONFIG_DIR,
+            prefix=f".{ENVIRONMENT_FILE.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+
+        os.replace(tmp_path, ENVIRONMENT_FILE)
 
     if os.name != "nt":
         os.chmod(ENVIRONMENT_FILE, 0o600)
-        dir_fd = os.open(CONFIG_DIR, os.O_RDONLY)
-        try:
-            os.fsync(dir_fd)
-        finally:
-            os.close(dir_fd)
+        if durable:
+            dir_fd = os.open(CONFIG_DIR, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
     chown_to_sudo_user(CONFIG_DIR, ENVIRONMENT_FILE)
 
 
 def _load_or_generate_edge_fingerprint() -> str:
     """Load edge fingerprint saved by edge-core, fallback to CLI generator."""
-    if FINGERPRINT_FILE.exists():
-        try:
-            data = json.loads(FINGERPRINT_FILE.read_text(encoding="utf-8"))
-            value = data.get("fingerprint")
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-        except Exception:
-            pass
+    try:
+        data = json.loads(FINGERPRINT_FILE.read_text(encoding="utf-8"))
+        value = data.get("fingerprint")
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    except Exception:  # missing, unreadable or malformed file
+        pass
+
+    return _resolve_fingerprint_generator()()
+
 
+@functools.lru_cache(maxsize=1)
+def _resolve_fingerprint_generator() -> Any:
+    """Import the SDK's fingerprint generator once."""
     from cyberwave.fingerprint import generate_fingerprint
 
-    return generate_fingerprint()
+    return generate_fingerprint
 
 
 def _resolved_edge_log_level(runtime_overrides: dict[str, str | None]) -> str | None:
@@ -396,6 +478,8 @@ def _ensure_credentials(*, skip_confirm: bool) -> bool:
     """Ensure valid credentials exist in /etc/cyberwave/ before installing.
 
     If saved credentials are found and valid, returns True immediately.
+    A token that passed the live check within the last few minutes is
+    trusted without another round trip.
     Otherwise prompts for email/password and runs the full login flow.
     """
     from .auth import APIToken, AuthClient, AuthenticationError
@@ -404,9 +488,11 @@ def _ensure_credentials(*, skip_confirm: bool) -> bool:
     if creds and creds.token:
         try:
             creds_base_url = creds.cyberwave_base_url
-            sdk_client = _get_sdk_client(creds.token, base_url=creds_base_url)
-            with console.status("[dim]Checking existing credentials...[/dim]"):
-                sdk_client.workspaces.list()
+            if not token_recently_verified(creds.token, creds_base_url):
+                sdk_client = _get_sdk_client(creds.token, base_url=creds_base_url)
+                with console.status("[dim]Checking existing credentials...[/dim]"):
+                    _list_workspaces(sdk_client)
+                mark_token_verified(creds.token, creds_base_url)
             console.print(f"[green]✓[/green] Logged in as [bold]{creds.email}[/bold]")
             # Backfill persisted environment overrides when running with explicit
             # env vars so systemd startups can reuse them later.
@@ -431,6 +517,7 @@ def _ensure_credentials(*, skip_confirm: bool) -> bool:
                 )
             return True
         except Exception as e:
+            forget_token_verification()
             console.print("[yellow]Stored credentials are invalid or expired.[/yellow]")
             console.print(e)  # print the error for debugging purposes
 
@@ -529,9 +616,33 @@ def _ensure_credentials(*, skip_confirm: bool) -> bool:
         return False
 
 
+# Workspaces and workspace projects already fetched in this process, keyed by
+# id(client) (plus workspace_uuid for projects).  The credential check,
+# workspace selection and environment listing all need them, and the client
+# is kept in each entry so a recycled id can't return another client's data.
+_WORKSPACES: dict[int, tuple[Any, list[Any]]] = {}
+_WORKSPACE_PROJECTS: dict[tuple[int, str], tuple[Any, list[Any]]] = {}
+
+
+def _reset_workspace_cache() -> None:
+    """Forget cached workspaces and workspace projects."""
+    _WORKSPACES.clear()
+    _WORKSPACE_PROJECTS.clear()
+
+
+def _list_workspaces(client: Any) -> list[Any]:
+    """Return ``client.workspaces.list()``, fetched once per client."""
+    entry = _WORKSPACES.get(id(client))
+    if entry is not None and entry[0] is client:
+        return list(entry[1])
+    workspaces = list(client.workspaces.list())
+    _WORKSPACES[id(client)] = (client, workspaces)
+    return list(workspaces)
+
+
 def _select_workspace_from_env_or_default(client: Any, *, skip_confirm: bool) -> Any:
     """Pick a workspace, honoring ``CYBERWAVE_WORKSPACE_SLUG`` when provided."""
-    workspaces = client.workspaces.list()
+    workspaces = _list_workspaces(client)
     if not workspaces:
         raise RuntimeError("No workspaces available for this account.")
 
@@ -573,7 +684,7 @@ def _resolve_workspace_from_credentials(client: Any, workspace_uuid: str) -> Any
         return None
     target = raw.lower()
     try:
-        workspaces = client.workspaces.list()
+        workspaces = _list_workspaces(client)
     except Exception:
         return None
     for ws in workspaces:
@@ -583,8 +694,15 @@ def _resolve_workspace_from_credentials(client: Any, workspace_uuid: str) -> Any
     return None
 
 
+
+
 def _workspace_projects(client: Any, workspace_uuid: str) -> list[Any]:
     """Return projects that belong to the selected workspace."""
+    key = (id(client), workspace_uuid)
+    entry = _WORKSPACE_PROJECTS.get(key)
+    if entry is not None and entry[0] is client:
+        return list(entry[1])
+
     projects = client.projects.list()
     result = []
     for project in projects:
@@ -593,7 +711,8 @@ def _workspace_projects(client: Any, workspace_uuid: str) -> list[Any]:
         )
         if project_workspace_uuid == workspace_uuid:
             result.append(project)
-    return result
+    _WORKSPACE_PROJECTS[key] = (client, result)
+    return list(result)
 
 
 def _environment_workspace_uuid(environment: Any) -> str:
@@ -659,13 +778,23 @@ def _workspace_environments(client: Any, workspace_uuid: str) -> list[Any]:
             seen_uuids.add(env_uuid)
 
     # Supplement with project-scoped discovery so we never miss environments
-    # that the global listing might have filtered differently.
+    # that the global listing might have filtered differently. The
+    # per-project listings are independent, so fetch them concurrently;
+    # results are merged in project order.
     projects = _workspace_projects(client, workspace_uuid)
-    for project in projects:
+    if not projects:
+        return environments
+
+    def _project_environments(project: Any) -> list[Any]:
         try:
-            envs = client.environments.list(project_id=str(project.uuid))
+            return client.environments.list(project_id=str(project.uuid))
         except Exception:
-            continue
+            return []
+
+    with ThreadPoolExecutor(max_workers=min(8, len(projects))) as pool:
+        per_project = list(pool.map(_project_environments, projects))
+
+    for envs in per_project:
         for env in envs:
             env_uuid = str(getattr(env, "uuid", ""))
             if env_uuid and env_uuid not in seen_uuids:
@@ -689,6 +818,7 @@ def _create_environment_in_workspace(
             workspace_id=workspace_uuid,
             description="Project created by cyberwave edge install",
         )
+        _WORKSPACE_PROJECTS.pop((id(client), workspace_uuid), None)
         project_id = str(project.uuid)
 
     env_name = "Edge Environment"
@@ -908,21 +1038,29 @@ def _attach_edge_fingerprint_to_twins(
     The backend's ``twins.update`` merges ``metadata`` on top of the stored
     copy, so we only need to send the single key we want to write.
 
+    The updates are independent, so they run concurrently and the whole
+    step takes about as long as the slowest request.
+
     Returns:
         (updated_count, failed_count)
     """
-    updated = 0
-    failed = 0
-    for twin_uuid in twin_uuids:
+    if not twin_uuids:
+        return 0, 0
+
+    def _attach_one(twin_uuid: str) -> bool:
         try:
             client.twins.update(twin_uuid, metadata={"edge_fingerprint": edge_fingerprint})
-            updated += 1
+            return True
         except Exception as exc:
             console.print(
                 f"[yellow]Failed to attach fingerprint to twin {twin_uuid[:8]}…: {exc}[/yellow]"
             )
-            failed += 1
-    return updated, failed
+            return False
+
+    with ThreadPoolExecutor(max_workers=min(8, len(twin_uuids))) as pool:
+        results = list(pool.map(_attach_one, twin_uuids))
+    updated = sum(results)
+    return updated, len(results) - updated
 
 
 def _detach_edge_fingerprint_from_other_twins(
@@ -940,19 +1078,20 @@ def _detach_edge_fingerprint_from_other_twins(
     fingerprints from previous installs to pin unwanted drivers to this
     edge).
 
+    Like attaching, the per-twin updates run concurrently.
+
     Returns:
         (detached_count, failed_count)
     """
     keep_set = {str(twin_uuid) for twin_uuid in keep_twin_uuids if twin_uuid}
-    detached = 0
-    failed = 0
 
     try:
         twins = client.twins.list(environment_id=environment_uuid)
     except Exception as exc:
         console.print(f"[yellow]Could not list twins to clear stale fingerprints: {exc}[/yellow]")
-        return detached, 1
+        return 0, 1
 
+    stale_uuids = []
     for twin in twins:
         twin_uuid = str(getattr(twin, "uuid", ""))
         if not twin_uuid or twin_uuid in keep_set:
@@ -962,19 +1101,26 @@ def _detach_edge_fingerprint_from_other_twins(
         if not isinstance(metadata, dict):
             continue
 
-        if metadata.get("edge_fingerprint") != edge_fingerprint:
-            continue
+        if metadata.get("edge_fingerprint") == edge_fingerprint:
+            stale_uuids.append(twin_uuid)
+
+    if not stale_uuids:
+        return 0, 0
 
+    def _detach_one(twin_uuid: str) -> bool:
         try:
             client.twins.update(twin_uuid, metadata={"edge_fingerprint": None})
-            detached += 1
+            return True
         except Exception as exc:
             console.print(
                 f"[yellow]Failed to detach fingerprint from twin {twin_uuid[:8]}…: {exc}[/yellow]"
             )
-            failed += 1
+            return False
 
-    return detached, failed
+    with ThreadPoolExecutor(max_workers=min(8, len(stale_uuids))) as pool:
+        results = list(pool.map(_detach_one, stale_uuids))
+    detached = sum(results)
+    return detached, len(results) - detached
 
 
 _NON_TWIN_JSON_FILES = frozenset(
@@ -1286,6 +1432,63 @@ def _resolve_installed_edge_core_package_name() -> str:
     return _resolve_installed_service_package_name(EDGE_CORE_SPEC)
 
 
+def _apt_index_is_fresh() -> bool:
+    """Return True if ``apt-get update`` ran within ``APT_INDEX_FRESH_SECONDS``."""
+    try:
+        age = time.time() - APT_LISTS_DIR.stat().st_mtime
+    except OSError:
+        return False
+    return 0 <= age < APT_INDEX_FRESH_SECONDS
+
+
+def _crc24(data: bytes) -> int:
+    """OpenPGP CRC-24 (RFC 4880, section 6.1) used by ASCII-armor checksums."""
+    crc = 0xB704CE
+    for byte in data:
+        crc ^= byte << 16
+        for _ in range(8):
+            crc <<= 1
+            if crc & 0x1000000:
+                crc ^= 0x1864CFB
+    return crc & 0xFFFFFF
+
+
+def _dearmor_pgp_key(armored: bytes) -> bytes:
+    """Decode an ASCII-armored OpenPGP block, as ``gpg --dearmor`` does.
+
+    Drops the BEGIN/END lines and armor headers, base64-decodes the body
+    and verifies the ``=XXXX`` CRC-24 checksum when present. Raises
+    ValueError if *armored* holds no well-formed armored block.
+    """
+    lines = armored.decode("ascii", errors="replace").splitlines()
+    try:
+        begin = next(i for i, line in enumerate(lines) if line.startswith("-----BEGIN PGP "))
+        end = next(
+            i for i in range(begin + 1, len(lines)) if lines[i].startswith("-----END PGP ")
+        )
+    except StopIteration:
+        raise ValueError("no ASCII-armored PGP block found") from None
+
+    body = lines[begin + 1 : end]
+    # Armor headers ("Version: ...") precede the data; base64 has no colons.
+    start = 0
+    while start < len(body) and ":" in body[start]:
+        start += 1
+    data_lines = [line.strip() for line in body[start:] if line.strip()]
+    checksum = data_lines.pop() if data_lines and data_lines[-1].startswith("=") else None
+
+    try:
+        payload = base64.b64decode("".join(data_lines), validate=True)
+        crc = base64.b64decode(checksum[1:], validate=True) if checksum else None
+    except ValueError as exc:
+        raise ValueError(f"invalid base64 in armored PGP block: {exc}") from None
+    if not payload:
+        raise ValueError("armored PGP block is empty")
+    if crc is not None and (len(crc) != 3 or _crc24(payload) != int.from_bytes(crc, "big")):
+        raise ValueError("armored PGP block failed its CRC-24 checksum")
+    return payload
+
+
 def _apt_get_install(
     spec: ServiceSpec = EDGE_CORE_SPEC,
     *,
@@ -1297,6 +1500,8 @@ def _apt_get_install(
 
     Adds the Buildkite package registry GPG key and source if not already
     configured, then installs (or upgrades) the requested version of the package.
+    ``apt-get update`` is skipped when nothing about the repository changed
+    and the package index was refreshed within the last few minutes.
 
     Returns True on success.
     """
@@ -1313,15 +1518,23 @@ def _apt_get_install(
         )
         return False
 
+    # Whether apt's view of our repository changed in this run, in which case
+    # the package index must be refreshed before installing.
+    sources_changed = False
+
     if registry_read_token:
         try:
-            auth_conf_path.parent.mkdir(parents=True, exist_ok=True)
-            auth_conf_path.write_text(
+            auth_conf = (
                 "machine "
                 f"https://packages.buildkite.com/{BUILDKITE_ORG_SLUG}/{registry_slug}/ "
-                f"login buildkite password {registry_read_token}\n",
-                encoding="utf-8",
+                f"login buildkite password {registry_read_token}\n"
             )
+            try:
+                sources_changed = auth_conf_path.read_text(encoding="utf-8") != auth_conf
+            except OSError:
+                sources_changed = True
+            auth_conf_path.parent.mkdir(parents=True, exist_ok=True)
+            auth_conf_path.write_text(auth_conf, encoding="utf-8")
             _run(["chmod", "600", str(auth_conf_path)])
         except PermissionError:
             console.print(
@@ -1332,59 +1545,43 @@ def _apt_get_install(
 
     # Install the GPG signing key if missing
     if not keyring_path.exists():
+        import httpx
+
         console.print("[cyan]Installing Cyberwave package signing key...[/cyan]")
         try:
             keyring_path.parent.mkdir(parents=True, exist_ok=True)
 
-            child_env = clean_subprocess_env()
-            ld_library_path = child_env.get("LD_LIBRARY_PATH", "(unset)")
-            console.print(f"[dim]LD_LIBRARY_PATH for child: {ld_library_path}[/dim]")
-
-            # Download the armored GPG key
-            curl = subprocess.run(
-                ["curl", "-fsSL", _resolve_deb_registry_gpg_key_fetch_url(spec, channel)],
-                capture_output=True,
-                check=True,
-                env=child_env,
+            # Download and dearmor the key in-process rather than via curl | gpg
+            response = httpx.get(
+                _resolve_deb_registry_gpg_key_fetch_url(spec, channel),
+                timeout=30.0,
+                follow_redirects=True,
             )
-            if not curl.stdout:
+            response.raise_for_status()
+            key_bytes = response.content
+            if not key_bytes:
                 console.print("[red]Downloaded GPG key is empty.[/red]")
                 console.print(
                     f"[dim]URL: {_resolve_deb_registry_gpg_key_fetch_url(spec, channel)}[/dim]"
                 )
                 return False
 
-            # Dearmor into the keyring file
-            gpg = subprocess.run(
-                ["gpg", "--batch", "--yes", "--dearmor", "-o", str(keyring_path)],
-                input=curl.stdout,
-                capture_output=True,
-                env=child_env,
-            )
-            if gpg.returncode != 0:
-                stderr_msg = gpg.stderr.decode(errors="replace").strip()
-                console.print(f"[red]gpg --dearmor failed (exit {gpg.returncode}).[/red]")
-                if stderr_msg:
-                    console.print(f"[dim]{stderr_msg}[/dim]")
+            try:
+                keyring = _dearmor_pgp_key(key_bytes)
+            except ValueError as exc:
+                console.print(f"[red]Downloaded GPG key is not a valid armored key: {exc}[/red]")
                 return False
+            keyring_path.write_bytes(keyring)
+            if os.name != "nt":
+                os.chmod(keyring_path, 0o644)
+            sources_changed = True
 
-        except subprocess.CalledProcessError as exc:
-            stderr_msg = ""
-            if exc.stderr:
-                stderr_msg = exc.stderr.decode(errors="replace").strip()
-            console.print(f"[red]Failed to download GPG key (exit {exc.returncode}).[/red]")
-            if stderr_msg:
-                console.print(f"[dim]{stderr_msg}[/dim]")
+        except httpx.HTTPError as exc:
+            console.print(f"[red]Failed to download GPG key: {exc}[/red]")
             console.print(
                 f"[dim]URL: {_resolve_deb_registry_gpg_key_fetch_url(spec, channel)}[/dim]"
             )
             return False
-        except FileNotFoundError as exc:
-            console.print(f"[red]Required command not found: {exc.filename}[/red]")
-            console.print(
-                "[dim]Ensure curl and gpg are installed: sudo apt-get install curl gnupg[/dim]"
-            )
-            return False
         except PermissionError:
             console.print(
                 "[red]Permission denied installing GPG key.[/red]\n"
@@ -1392,22 +1589,26 @@ def _apt_get_install(
             )
             return False
 
-    # Add the repository if missing
-    if not sources_list.exists():
-        console.print("[cyan]Adding Cyberwave package repository...[/cyan]")
-        signed_by = f"signed-by={keyring_path}"
-        source_lines = (
-            f"deb [{signed_by}] {deb_repo_url} any main\n"
-            f"deb-src [{signed_by}] {deb_repo_url} any main\n"
+    # Add the repository if missing. Exclusive create checks and writes in
+    # one step; an existing sources list is left untouched.
+    signed_by = f"signed-by={keyring_path}"
+    source_lines = (
+        f"deb [{signed_by}] {deb_repo_url} any main\n"
+        f"deb-src [{signed_by}] {deb_repo_url} any main\n"
+    )
+    try:
+        with open(sources_list, "x") as sources_file:
+            console.print("[cyan]Adding Cyberwave package repository...[/cyan]")
+            sources_file.write(source_lines)
+        sources_changed = True
+    except FileExistsError:
+        pass
+    except PermissionError:
+        console.print(
+            "[red]Permission denied writing apt sources.[/red]\n"
+            f"[dim]Re-run with sudo: {spec.sudo_command_hint}[/dim]"
         )
-        try:
-            sources_list.write_text(source_lines)
-        except PermissionError:
-            console.print(
-                "[red]Permission denied writing apt sources.[/red]\n"
-                f"[dim]Re-run with sudo: {spec.sudo_command_hint}[/dim]"
-            )
-            return False
+        return False
 
     # Update and install the latest version
     install_target = f"{resolved_name}={package_version}" if package_version else resolved_name
@@ -1423,10 +1624,16 @@ def _apt_get_install(
     dpkg_force_unsafe_io = "-o=Dpkg::Options::=--force-unsafe-io"
 
     try:
+        # Skip the index refresh (a full apt startup plus network fetches)
+        # when our repository is already configured and the index is recent.
+        if not sources_changed and _apt_index_is_fresh():
+            console.print("[dim]Package index is up to date; skipping apt-get update.[/dim]")
+            apt_update_retries = 0
+        else:
+            apt_update_retries = 3
         # Retry apt-get update to handle transient CDN mirror sync failures.
         # After all attempts, warn and continue — apt will use its cached index
         # for any failing source and the install may still succeed.
-        apt_update_retries = 3
         apt_update_retry_delay = 8  # seconds
         for attempt in range(1, apt_update_retries + 1):
             try:
@@ -1631,31 +1838,118 @@ def install_edge_core(*, channel: str = "stable", version: str | None = None) ->
 # ---- docker installation -----------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
+def _docker_path() -> str | None:
+    """Return ``shutil.which("docker")``, looked up once per process."""
+    return shutil.which("docker")
+
+
+# Set once the daemon has answered (socket ping or ``docker info``); a
+# reachable daemon is not re-probed for the rest of the run.  Failures are never remembered, so a
+# daemon started after a failed check is picked up on the next call.
+_DOCKER_DAEMON_READY = False
+
+
+def _forget_docker_probe() -> None:
+    """Drop the memoized docker lookups, e.g. after installing Docker."""
+    global _DOCKER_DAEMON_READY  # noqa: PLW0603
+    _DOCKER_DAEMON_READY = False
+    _docker_path.cache_clear()
+
+
+DOCKER_DEFAULT_HOST = "unix:///var/run/docker.sock"
+DOCKER_PING_TIMEOUT_SECONDS = 0.5
+
+
+def _docker_daemon_pingable() -> bool:
+    """Return True if the Docker daemon answers ``GET /_ping`` on its socket.
+
+    Talks to ``$DOCKER_HOST`` (``unix://`` or plain ``tcp://``) directly
+    instead of spawning the docker CLI. Any other setup (TLS, ssh://,
+    non-default contexts) or any failure returns False so the caller can
+    fall back to ``docker info``, which also reports why.
+    """
+    if os.environ.get("DOCKER_TLS_VERIFY"):
+        return False
+    host = os.environ.get("DOCKER_HOST") or DOCKER_DEFAULT_HOST
+    try:
+        if host.startswith("unix://"):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address: Any = host[len("unix://"):]
+        elif host.startswith("tcp://"):
+            hostname, _, port = host[len("tcp://"):].rstrip("/").rpartition(":")
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = (hostname, int(port))
+        else:
+            return False
+    except (AttributeError, ValueError, OSError):
+        return False
+
+    with sock:
+        try:
+            sock.settimeout(DOCKER_PING_TIMEOUT_SECONDS)
+            sock.connect(address)
+            sock.sendall(b"GET /_ping HTTP/1.0\r\n\r\n")
+            status_line = sock.recv(64).split(b"\r\n", 1)[0]
+        except OSError:
+            return False
+    return status_line.startswith(b"HTTP/1.") and status_line[9:12] == b"200"
+
+
+def _wait_docker_ready(timeout: float = 5.0) -> bool:
+    """Poll the daemon socket until it answers or *timeout* seconds pass.
+
+    Starts at 10 ms and doubles up to 0.5 s between attempts, so a daemon
+    that comes up quickly is seen almost at once without busy-waiting.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        if _docker_daemon_pingable():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.5)
+
+
 def _ensure_docker_installed() -> bool:
     """Ensure Docker is installed and running."""
-    if not shutil.which("docker"):
+    global _DOCKER_DAEMON_READY  # noqa: PLW0603
+    if _DOCKER_DAEMON_READY:
+        return True
+    if not _docker_path():
         console.print("[red]Docker not found.[/red]")
         return False
 
+    if _docker_daemon_pingable():
+        _DOCKER_DAEMON_READY = True
+        return True
+
     try:
         proc = subprocess.run(
             ["docker", "info"],
             check=False,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
-            env=clean_subprocess_env(),
+            text=True,
+            errors="replace",
+            env=clean_subprocess_env_view(),
         )
     except FileNotFoundError:
         console.print("[red]Docker not found in PATH.[/red]")
         return False
 
     if proc.returncode != 0:
-        stderr_msg = proc.stderr.decode(errors="replace").strip() if proc.stderr else ""
-        console.print("[red]Docker is installed, but the daemon is not ready/running.[/red]")
+        stderr_msg = (proc.stderr or "").strip()
+        message = "[red]Docker is installed, but the daemon is not ready/running.[/red]"
         if stderr_msg:
-            console.print(f"[dim]{stderr_msg}[/dim]")
+            message += f"\n[dim]{stderr_msg}[/dim]"
+        console.print(message)
         return False
 
+    _DOCKER_DAEMON_READY = True
     return True
 
 
@@ -1675,8 +1969,8 @@ def _check_docker_macos() -> bool:
                 ["docker", "info"],
                 check=False,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                env=clean_subprocess_env(),
+                stderr=subprocess.DEVNULL,
+                env=clean_subprocess_env_view(),
             )
         except FileNotFoundError:
             proc = None
@@ -1714,7 +2008,7 @@ def _check_docker_macos() -> bool:
 
 def _install_docker() -> bool:
     """Install Docker if not present in the edge device."""
-    if shutil.which("docker"):
+    if _docker_path():
         console.print("[green]Docker is already installed.[/green]")
         return _ensure_docker_installed()
 
@@ -1740,6 +2034,10 @@ def _install_docker() -> bool:
         console.print(f"[red]Required command not found: {exc.filename}[/red]")
         return False
 
+    _forget_docker_probe()
+    # The daemon may still be binding its socket right after the installer
+    # exits; give it a moment before reporting failure.
+    _wait_docker_ready()
     if not _ensure_docker_installed():
         console.print("[red]Docker installation did not complete successfully.[/red]")
         return False
@@ -1748,8 +2046,13 @@ def _install_docker() -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=1)
 def _get_docker_installer_script_path() -> Path:
-    """Resolve install_docker.sh in source and bundled runtimes."""
+    """Resolve install_docker.sh in source and bundled runtimes.
+
+    Both locations are fixed for the life of the process, so the lookup
+    is done once.
+    """
     candidates = [Path(__file__).with_name("install_docker.sh")]
 
     mei_dir = getattr(sys, "_MEIPASS", None)
@@ -1843,6 +2146,8 @@ def create_launchagent_service(
         "StandardErrorPath": str(_launchagent_log_path(spec)),
     }
 
+    import plistlib  # macOS-only; keeps it out of every core import
+
     plist_path = _launchagent_plist_path(spec)
     try:
         plist_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1974,6 +2279,13 @@ def create_systemd_service(spec: ServiceSpec = EDGE_CORE_SPEC) -> bool:
     binary = _resolve_service_binary(spec)
     unit_contents = spec.unit_template.format(binary_path=binary, config_dir=CONFIG_DIR)
 
+    try:
+        if spec.unit_path.read_text() == unit_contents:
+            console.print(f"[dim]Unchanged:[/dim] {spec.unit_path}")
+            return True
+    except OSError:
+        pass
+
     try:
         spec.unit_path.write_text(unit_contents)
     except PermissionError:
@@ -1987,6 +2299,31 @@ def create_systemd_service(spec: ServiceSpec = EDGE_CORE_SPEC) -> bool:
     return True
 
 
+def _systemd_unit_properties(unit_name: str, *properties: str) -> dict[str, str]:
+    """Return the requested ``systemctl show`` properties of *unit_name*.
+
+    Returns an empty dict if systemctl is unavailable or fails, so callers
+    fall back to their unconditional path.
+    """
+    cmd = ["systemctl", "show", unit_name]
+    for prop in properties:
+        cmd += ["-p", prop]
+    try:
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, env=clean_subprocess_env_view()
+        )
+    except (FileNotFoundError, OSError):
+        return {}
+    if result.returncode != 0:
+        return {}
+    values: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            values[key] = value
+    return values
+
+
 def enable_and_start_service(spec: ServiceSpec = EDGE_CORE_SPEC) -> bool:
     """Enable the service described by ``spec`` to start on boot, then start it now.
 
@@ -2000,22 +2337,30 @@ def enable_and_start_service(spec: ServiceSpec = EDGE_CORE_SPEC) -> bool:
     signal ``READY=1`` (which includes Docker image pulls and can take
     several minutes on slow links).
 
+    ``daemon-reload`` and ``enable`` are only issued when systemd reports
+    that they are needed, so a re-install with an unchanged, already
+    enabled unit costs a single ``systemctl show`` plus the restart.
+    ``enable`` reloads the daemon itself, so the two are never both run.
+
     Returns True on success.
     """
     if not spec.unit_path.exists():
         console.print("[red]Service unit not found — run install first.[/red]")
         return False
 
+    state = _systemd_unit_properties(spec.unit_name, "NeedDaemonReload", "UnitFileState")
     try:
-        _run(["systemctl", "daemon-reload"])
-        _run(["systemctl", "enable", spec.unit_name])
+        if state.get("UnitFileState") != "enabled":
+            _run(["systemctl", "enable", spec.unit_name])
+        elif state.get("NeedDaemonReload") != "no":
+            _run(["systemctl", "daemon-reload"])
         _run(["systemctl", "restart", "--no-block", spec.unit_name])
     except subprocess.CalledProcessError as exc:
         console.print(f"[red]systemctl command failed (exit {exc.returncode}).[/red]")
         return False
 
-    console.print(f"[green]Service enabled and (re)starting:[/green] {spec.unit_name}")
     console.print(
+        f"[green]Service enabled and (re)starting:[/green] {spec.unit_name}\n"
         f"[dim]The service is booting in the background (driver image pulls, "
         f"twin sync, etc.).\n"
         f"Run 'cyberwave edge logs' to follow progress.[/dim]"
@@ -2528,6 +2873,7 @@ def setup_service(
     config_path: str | None = None,
     post_install_hook: Any = None,
     force_reinstall: bool = False,
+    assume_installed: bool = False,
 ) -> bool:
     """Generic install orchestrator: install package, optionally set up Docker + systemd.
 
@@ -2535,6 +2881,10 @@ def setup_service(
     stream) are torn down and rebuilt from scratch instead of being skipped
     when already running.
 
+    When *assume_installed* is True, the package install and the Docker
+    install/check are skipped and setup goes straight to the service
+    configuration, for images or hosts where both are known to be present.
+
     Returns True if everything succeeded.
     """
     _migrate_legacy_config_dir()
@@ -2572,7 +2922,9 @@ def setup_service(
     if not skip_confirm:
         if linux_service_setup:
             has_apt = bool(shutil.which("apt-get"))
-            if has_apt:
+            if assume_installed:
+                install_method = f"Use the installed [bold]{spec.package_name}[/bold]"
+            elif has_apt:
                 selected_pkg = _resolve_service_package_name(channel, spec)
                 selected_target = f"{selected_pkg}={version}" if version else selected_pkg
                 install_method = f"Install [bold]{selected_target}[/bold] via apt-get"
@@ -2621,17 +2973,22 @@ def setup_service(
     # before pip-installing edge-core. Catches the common "I forgot to open
     # Docker Desktop" failure mode early instead of leaving the user with a
     # registered LaunchAgent that crash-loops trying to spawn drivers.
-    if is_macos() and spec.requires_docker:
-        if not _check_docker_macos():
-            return False
-
-    if not install_service_package(spec, channel=channel, version=version):
-        return False
+    if assume_installed:
+        console.print(
+            f"[dim]Assuming {spec.package_name} and its dependencies are installed.[/dim]"
+        )
+    else:
+        if is_macos() and spec.requires_docker:
+            if not _check_docker_macos():
+                return False
 
-    if linux_service_setup and spec.requires_docker:
-        if not _install_docker():
+        if not install_service_package(spec, channel=channel, version=version):
             return False
 
+        if linux_service_setup and spec.requires_docker:
+            if not _install_docker():
+                return False
+
     if force_reinstall and not (is_macos() and spec.requires_docker):
         console.print(
             "[dim]--force-reinstall has no effect on this platform "
@@ -2781,7 +3138,7 @@ def _pull_worker_image() -> bool:
     ``WorkerManager._run_container()`` will pull implicitly on first
     start and itself falls back to a locally-present image.
     """
-    docker_bin = shutil.which("docker")
+    docker_bin = _docker_path()
     if not docker_bin:
         console.print("[yellow]Docker not found — skipping worker image pull.[/yellow]")
         return True
@@ -2824,12 +3181,16 @@ def setup_edge_core(
     version: str | None = None,
     force_reinstall: bool = False,
     pull_worker_image: bool = True,
+    assume_installed: bool = False,
 ) -> bool:
     """Full setup for edge core: install the package, create the service, enable on boot.
 
     When *force_reinstall* is True, platform helpers (USB/IP, camera stream)
     are torn down and rebuilt from scratch.
 
+    When *assume_installed* is True, installing edge-core and Docker (and
+    the Docker readiness check) is skipped; see :func:`setup_service`.
+
     The *pull_worker_image* parameter is **deprecated** and ignored.
     The ML worker Docker image is now pulled asynchronously by the
     edge-core service on first startup via ``WorkerManager``, matching the
@@ -2848,4 +3209,5 @@ def setup_edge_core(
         version=version,
         post_install_hook=_post_install,
         force_reinstall=force_reinstall,
+        assume_installed=assume_installed,
     )
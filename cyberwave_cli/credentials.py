@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import dataclasses
+import hashlib
 import json
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -17,6 +20,12 @@ from .io_utils import atomic_write_json
 
 _console = Console()
 
+# Records when the stored token last passed a live API check, so commands
+# run back to back don't each repeat the round trip.  Holds a digest of
+# the token and base URL, never the token itself.
+TOKEN_VERIFIED_FILE = CONFIG_DIR / "token_verified.json"
+TOKEN_VERIFIED_MAX_AGE_SECONDS = 600
+
 
 def _raise_permission_error() -> None:
     """Print a colored permission-denied message and exit."""
@@ -277,32 +286,98 @@ def save_credentials(credentials: Credentials) -> None:
         atomic_write_json(CREDENTIALS_FILE, merged_payload)
     except PermissionError:
         _raise_permission_error()
+    _invalidate_credentials_cache()
 
     chown_to_sudo_user(CREDENTIALS_FILE)
 
 
+# Last parsed credentials keyed by the file's identity (path, inode, mtime,
+# size).  Commands call ``load_credentials()`` several times per invocation;
+# re-reading and re-parsing JSON is skipped until the file actually changes.
+_credentials_cache: tuple[tuple[Any, ...], Optional[Credentials]] | None = None
+
+
+def _invalidate_credentials_cache() -> None:
+    global _credentials_cache  # noqa: PLW0603
+    _credentials_cache = None
+
+
 def load_credentials() -> Optional[Credentials]:
     """Load credentials from the config file."""
+    global _credentials_cache  # noqa: PLW0603
     try:
-        if not CREDENTIALS_FILE.exists():
-            return None
+        stat = CREDENTIALS_FILE.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
     except PermissionError:
         _raise_permission_error()
 
+    cache_key = (str(CREDENTIALS_FILE), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    if _credentials_cache is not None and _credentials_cache[0] == cache_key:
+        cached = _credentials_cache[1]
+        # Hand out a copy so callers mutating fields can't poison the cache.
+        return dataclasses.replace(cached) if cached is not None else None
+
     try:
         with open(CREDENTIALS_FILE, "r") as f:
             data = json.load(f)
-            return Credentials.from_dict(data)
+            credentials = Credentials.from_dict(data)
     except PermissionError:
         _raise_permission_error()
     except (json.JSONDecodeError, KeyError):
-        return None
+        credentials = None
+
+    _credentials_cache = (cache_key, credentials)
+    return dataclasses.replace(credentials) if credentials is not None else None
 
 
 def clear_credentials() -> None:
     """Remove stored credentials."""
     if CREDENTIALS_FILE.exists():
         CREDENTIALS_FILE.unlink()
+    _invalidate_credentials_cache()
+    forget_token_verification()
+
+
+def _token_digest(token: str, base_url: Optional[str]) -> str:
+    return hashlib.sha256(f"{base_url or ''}\n{token}".encode("utf-8")).hexdigest()
+
+
+def token_recently_verified(
+    token: str,
+    base_url: Optional[str] = None,
+    *,
+    max_age: float = TOKEN_VERIFIED_MAX_AGE_SECONDS,
+) -> bool:
+    """Return True if *token* passed a live check against *base_url* within *max_age* seconds."""
+    try:
+        with open(TOKEN_VERIFIED_FILE, "r") as f:
+            data = json.load(f)
+        verified_at = float(data["verified_at"])
+        digest = data["token_sha256"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    return digest == _token_digest(token, base_url) and 0 <= time.time() - verified_at < max_age
+
+
+def mark_token_verified(token: str, base_url: Optional[str] = None) -> None:
+    """Remember that *token* just passed a live check. Best effort."""
+    try:
+        atomic_write_json(
+            TOKEN_VERIFIED_FILE,
+            {"token_sha256": _token_digest(token, base_url), "verified_at": int(time.time())},
+        )
+    except OSError:
+        return
+    chown_to_sudo_user(TOKEN_VERIFIED_FILE)
+
+
+def forget_token_verification() -> None:
+    """Drop the remembered token check so the next command re-validates."""
+    try:
+        TOKEN_VERIFIED_FILE.unlink()
+    except OSError:
+        pass
 
 
 def upsert_runtime_env(key: str, value: str) -> None:
@@ -329,6 +404,7 @@ def upsert_runtime_env(key: str, value: str) -> None:
     data["envs"] = envs
 
     atomic_write_json(CREDENTIALS_FILE, data)
+    _invalidate_credentials_cache()
 
 
 def get_token() -> Optional[str]:
@@ -77,9 +77,11 @@ fi
 
 log "Preparing apt for Docker (${DISTRO_ID}, ${DOCKER_REPO_CODENAME}, ${ARCH})..."
 export DEBIAN_FRONTEND=noninteractive
+# dpkg's per-file fsync is very slow on SD-card devices (Raspberry Pi etc.).
+DPKG_UNSAFE_IO="-o=Dpkg::Options::=--force-unsafe-io"
 
 apt-get update -y
-apt-get install -y ca-certificates curl
+apt-get install -y --no-install-recommends "$DPKG_UNSAFE_IO" ca-certificates curl
 
 install -m 0755 -d /etc/apt/keyrings
 curl -fsSL "https://download.docker.com/linux/${DOCKER_REPO_DISTRO}/gpg" -o /etc/apt/keyrings/docker.asc
@@ -94,13 +96,16 @@ Signed-By: /etc/apt/keyrings/docker.asc
 EOF
 
 log "Installing Docker packages..."
-apt-get update -y
-apt-get install -y docker-ce docker-ce-cli containerd.io docker-buildx-plugin docker-compose-plugin
+# The other sources were refreshed above; only fetch the Docker index now.
+apt-get update -y \
+  -o Dir::Etc::sourcelist=/etc/apt/sources.list.d/docker.sources \
+  -o Dir::Etc::sourceparts=- \
+  -o APT::Get::List-Cleanup=0
+apt-get install -y "$DPKG_UNSAFE_IO" docker-ce docker-ce-cli containerd.io docker-buildx-plugin docker-compose-plugin
 
 if command -v systemctl >/dev/null 2>&1; then
   log "Starting Docker service with systemd..."
-  systemctl enable docker
-  systemctl start docker
+  systemctl enable --now docker
 elif command -v service >/dev/null 2>&1; then
   log "Starting Docker service with service command..."
   service docker start
@@ -12,8 +12,58 @@ import sys
 from rich.console import Console
 from rich.prompt import Prompt
 
+try:
+    import termios
+    import tty
+except ImportError:  # non-POSIX: numbered-prompt fallback only
+    _HAS_TERMIOS = False
+else:
+    _HAS_TERMIOS = True
+
 console = Console()
 
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+_HIDE_CURSOR = "\x1b[?25l"
+_SHOW_CURSOR = "\x1b[?25h"
+
+# Final byte of a CSI (``ESC [``) or SS3 (``ESC O``) cursor-key sequence.
+_ARROW_KEYS = {"A": "up", "B": "down"}
+
+
+def _tty_write(text: str) -> None:
+    """Write text in raw TTY mode using CRLF line endings."""
+    sys.stdout.write(text.replace("\n", "\r\n"))
+
+
+def _terminal_dimensions() -> tuple[int, int]:
+    """Return ``(lines, columns)`` of the terminal, defaulting to 24x80.
+
+    Measured once per selector call rather than cached at import, so a
+    terminal resized between prompts is picked up by the next menu.
+    """
+    try:
+        term_size = shutil.get_terminal_size()
+    except Exception:
+        return 24, 80
+    return term_size.lines, term_size.columns
+
+
+def _read_key() -> str:
+    """Read one keypress from raw-mode stdin.
+
+    Arrow keys arrive as a whole escape sequence in a single terminal
+    write, so after the first ``read(1)`` the rest already sits in
+    ``sys.stdin``'s buffer and is consumed without further syscalls.
+    Returns ``"up"``/``"down"`` for arrows (normal and application cursor
+    mode), ``""`` for other escape sequences, else the character itself.
+    """
+    char = sys.stdin.read(1)
+    if char != "\x1b":
+        return char
+    if sys.stdin.read(1) not in ("[", "O"):
+        return ""
+    return _ARROW_KEYS.get(sys.stdin.read(1), "")
+
 
 def _select_with_arrows(title: str, options: list[str]) -> int:
     """Interactive arrow-key selector. Falls back to numeric prompt."""
@@ -34,10 +84,7 @@ def _select_with_arrows(title: str, options: list[str]) -> int:
                 pass
             console.print(f"[red]Please enter a number between 1 and {len(options)}[/red]")
 
-    try:
-        import termios
-        import tty
-    except ImportError:
+    if not _HAS_TERMIOS:
         # Non-POSIX fallback
         console.print(f"\n[bold]{title}[/bold]")
         for idx, option in enumerate(options, 1):
@@ -57,73 +104,84 @@ def _select_with_arrows(title: str, options: list[str]) -> int:
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
 
-    try:
-        term_height = shutil.get_terminal_size().lines
-    except Exception:
-        term_height = 24
+    term_height, term_width = _terminal_dimensions()
     # Reserve lines for: title(1) + instructions(1) + blank(1) + scroll indicators(2)
     max_visible = max(5, term_height - 5)
 
-    def _tty_write(text: str) -> None:
-        """Write text in raw TTY mode using CRLF line endings."""
-        sys.stdout.write(text.replace("\n", "\r\n"))
+    # State of the last full draw, so a move that keeps the viewport only
+    # rewrites the two affected rows instead of repainting the screen.
+    drawn_offset: int | None = None
+    drawn_selected = 0
+    end_row = 1
+
+    def _option_line(idx: int) -> str:
+        prefix = "❯" if idx == selected else " "
+        return f"{prefix} {options[idx]}"
 
     def _render() -> None:
-        nonlocal scroll_offset
+        nonlocal scroll_offset, drawn_offset, drawn_selected, end_row
         # Keep selected item within the visible viewport
         if selected < scroll_offset:
             scroll_offset = selected
         elif selected >= scroll_offset + max_visible:
             scroll_offset = selected - max_visible + 1
 
-        _tty_write("\x1b[2J\x1b[H")
-        _tty_write(f"{title}\n")
-        _tty_write("Use \u2191/\u2193 and press Enter, q/Ctrl-C to abort\n\n")
+        # Each frame is assembled and written in one go: a single write is
+        # much cheaper than one per row over ssh or serial consoles.
+        if drawn_offset == scroll_offset:
+            first_row = 4 if scroll_offset == 0 else 5
+            parts = [
+                f"\x1b[{first_row + idx - scroll_offset};1H\x1b[2K{_option_line(idx)}"
+                for idx in {drawn_selected, selected}
+            ]
+            parts.append(f"\x1b[{end_row};1H")
+            sys.stdout.write("".join(parts))
+            drawn_selected = selected
+            sys.stdout.flush()
+            return
+
+        lines = [title, "Use \u2191/\u2193 and press Enter, q/Ctrl-C to abort", ""]
 
         visible_end = min(scroll_offset + max_visible, len(options))
 
         if scroll_offset > 0:
-            _tty_write(f"  \u2191 {scroll_offset} more above\n")
+            lines.append(f"  \u2191 {scroll_offset} more above")
 
         for idx in range(scroll_offset, visible_end):
-            prefix = "❯" if idx == selected else " "
-            _tty_write(f"{prefix} {options[idx]}\n")
+            lines.append(_option_line(idx))
 
         remaining = len(options) - visible_end
         if remaining > 0:
-            _tty_write(f"  \u2193 {remaining} more below\n")
+            lines.append(f"  \u2193 {remaining} more below")
+
+        _tty_write(_CLEAR_SCREEN + "".join(f"{line}\n" for line in lines))
 
+        # Row addressing only works if no line wrapped onto a second row.
+        if all(len(line) < term_width for line in lines):
+            drawn_offset, drawn_selected, end_row = scroll_offset, selected, len(lines) + 1
+        else:
+            drawn_offset = None
         sys.stdout.flush()
 
     try:
         tty.setraw(fd)
-        sys.stdout.write("\x1b[?25l")
+        sys.stdout.write(_HIDE_CURSOR)
         _render()
         while True:
-            char = sys.stdin.read(1)
-            if char in ("\r", "\n"):
+            key = _read_key()
+            if key in ("\r", "\n"):
                 return selected
-            if char in ("\x03", "q", "Q"):
+            if key in ("\x03", "q", "Q"):
                 raise KeyboardInterrupt
-            if char == "\x1b":
-                nxt = sys.stdin.read(1)
-                if nxt == "[":
-                    arrow = sys.stdin.read(1)
-                    if arrow == "A":
-                        selected = (selected - 1) % len(options)
-                        _render()
-                    elif arrow == "B":
-                        selected = (selected + 1) % len(options)
-                        _render()
-            elif char.lower() == "k":
+            if key in ("up", "k", "K"):
                 selected = (selected - 1) % len(options)
                 _render()
-            elif char.lower() == "j":
+            elif key in ("down", "j", "J"):
                 selected = (selected + 1) % len(options)
                 _render()
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        sys.stdout.write("\x1b[?25h")
+        sys.stdout.write(_SHOW_CURSOR)
         sys.stdout.flush()
 
 
@@ -155,10 +213,7 @@ def _select_multiple_with_arrows(title: str, options: list[str]) -> list[int]:
                 selected.append(idx)
         return selected
 
-    try:
-        import termios
-        import tty
-    except ImportError:
+    if not _HAS_TERMIOS:
         console.print(f"\n[bold]{title}[/bold]")
         for idx, option in enumerate(options, 1):
             console.print(f"  {idx}. {option}")
@@ -187,80 +242,91 @@ def _select_multiple_with_arrows(title: str, options: list[str]) -> list[int]:
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
 
-    try:
-        term_height = shutil.get_terminal_size().lines
-    except Exception:
-        term_height = 24
+    term_height, term_width = _terminal_dimensions()
     max_visible = max(5, term_height - 5)
 
-    def _tty_write(text: str) -> None:
-        """Write text in raw TTY mode using CRLF line endings."""
-        sys.stdout.write(text.replace("\n", "\r\n"))
+    # State of the last full draw, so moving or toggling within the viewport
+    # only rewrites the affected rows instead of repainting the screen.
+    drawn_offset: int | None = None
+    drawn_cursor = 0
+    end_row = 1
+
+    def _option_line(idx: int) -> str:
+        cursor_mark = "❯" if idx == cursor else " "
+        selected_mark = "[x]" if idx in selected else "[ ]"
+        return f"{cursor_mark} {selected_mark} {options[idx]}"
 
     def _render() -> None:
-        nonlocal scroll_offset
+        nonlocal scroll_offset, drawn_offset, drawn_cursor, end_row
         if cursor < scroll_offset:
             scroll_offset = cursor
         elif cursor >= scroll_offset + max_visible:
             scroll_offset = cursor - max_visible + 1
 
-        _tty_write("\x1b[2J\x1b[H")
-        _tty_write(f"{title}\n")
-        _tty_write(
-            "Use \u2191/\u2193 to move, Space to toggle, Enter to confirm, q/Ctrl-C to abort\n\n"
-        )
+        # Each frame is assembled and written in one go: a single write is
+        # much cheaper than one per row over ssh or serial consoles.
+        if drawn_offset == scroll_offset:
+            first_row = 4 if scroll_offset == 0 else 5
+            parts = [
+                f"\x1b[{first_row + idx - scroll_offset};1H\x1b[2K{_option_line(idx)}"
+                for idx in {drawn_cursor, cursor}
+            ]
+            parts.append(f"\x1b[{end_row};1H")
+            sys.stdout.write("".join(parts))
+            drawn_cursor = cursor
+            sys.stdout.flush()
+            return
+
+        lines = [
+            title,
+            "Use \u2191/\u2193 to move, Space to toggle, Enter to confirm, q/Ctrl-C to abort",
+            "",
+        ]
 
         visible_end = min(scroll_offset + max_visible, len(options))
 
         if scroll_offset > 0:
-            _tty_write(f"  \u2191 {scroll_offset} more above\n")
+            lines.append(f"  \u2191 {scroll_offset} more above")
 
         for idx in range(scroll_offset, visible_end):
-            cursor_mark = "❯" if idx == cursor else " "
-            selected_mark = "[x]" if idx in selected else "[ ]"
-            _tty_write(f"{cursor_mark} {selected_mark} {options[idx]}\n")
+            lines.append(_option_line(idx))
 
         remaining = len(options) - visible_end
         if remaining > 0:
-            _tty_write(f"  \u2193 {remaining} more below\n")
+            lines.append(f"  \u2193 {remaining} more below")
+
+        _tty_write(_CLEAR_SCREEN + "".join(f"{line}\n" for line in lines))
 
+        # Row addressing only works if no line wrapped onto a second row.
+        if all(len(line) < term_width for line in lines):
+            drawn_offset, drawn_cursor, end_row = scroll_offset, cursor, len(lines) + 1
+        else:
+            drawn_offset = None
         sys.stdout.flush()
 
     try:
         tty.setraw(fd)
-        sys.stdout.write("\x1b[?25l")
+        sys.stdout.write(_HIDE_CURSOR)
         _render()
         while True:
-            char = sys.stdin.read(1)
-            if char in ("\x03", "q", "Q"):
+            key = _read_key()
+            if key in ("\x03", "q", "Q"):
                 raise KeyboardInterrupt
-            if char in ("\r", "\n"):
+            if key in ("\r", "\n"):
                 return sorted(selected)
-            if char == " ":
+            if key == " ":
                 if cursor in selected:
                     selected.remove(cursor)
                 else:
                     selected.add(cursor)
                 _render()
-                continue
-            if char == "\x1b":
-                nxt = sys.stdin.read(1)
-                if nxt == "[":
-                    arrow = sys.stdin.read(1)
-                    if arrow == "A":
-                        cursor = (cursor - 1) % len(options)
-                        _render()
-                    elif arrow == "B":
-                        cursor = (cursor + 1) % len(options)
-                        _render()
-            elif char.lower() == "k":
+            elif key in ("up", "k", "K"):
                 cursor = (cursor - 1) % len(options)
                 _render()
-            elif char.lower() == "j":
+            elif key in ("down", "j", "J"):
                 cursor = (cursor + 1) % len(options)
                 _render()
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        sys.stdout.write("\x1b[?25h")
-        _tty_write("\n")
+        _tty_write(_SHOW_CURSOR + "\n")
         sys.stdout.flush()
@@ -8,6 +8,47 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
+import click
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speed-up, see the ``fast`` extra
+    _orjson = None
+
+
+def dumps_json_bytes(data: Any) -> bytes:
+    """Serialize *data* to compact UTF-8 JSON bytes.
+
+    Uses ``orjson`` when installed and the stdlib otherwise; both produce
+    the same compact encoding, ready to send as a request body.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON from *data*, using ``orjson`` when installed."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def echo_json(data: Any) -> None:
+    """Write *data* to stdout as indented JSON for ``--json`` command output.
+
+    Bytes go straight to the binary stdout stream, bypassing Rich's
+    markup/highlighting pass, which dominates on large listings. Values
+    JSON can't represent natively (UUIDs, datetimes) are written as strings.
+    """
+    if _orjson is not None:
+        payload = _orjson.dumps(data, default=str, option=_orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+    stream = click.get_binary_stream("stdout")
+    stream.write(payload + b"\n")
+    stream.flush()
+
 
 def atomic_write_json(path: Path, data: Any, *, mode: int = 0o600) -> None:
     """Atomically write *data* as JSON to *path* with restrictive permissions.
@@ -29,7 +29,7 @@ from xml.sax.saxutils import escape as _xml_escape
 
 from rich.console import Console
 
-from .config import _resolve_sudo_user_home, clean_subprocess_env
+from .config import _resolve_sudo_user_home, clean_subprocess_env, clean_subprocess_env_view
 
 logger = logging.getLogger(__name__)
 
@@ -273,7 +273,7 @@ def is_usbip_server_installed() -> bool:
 
 def _run(cmd: list[str], *, check: bool = True, **kwargs: Any) -> subprocess.CompletedProcess:
     _get_console().print(f"[dim]$ {' '.join(cmd)}[/dim]")
-    kwargs.setdefault("env", clean_subprocess_env())
+    kwargs.setdefault("env", clean_subprocess_env_view())
     return subprocess.run(cmd, check=check, **kwargs)
 
 
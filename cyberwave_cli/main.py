@@ -8,8 +8,6 @@ from typing import Any
 import click
 from rich.console import Console
 
-from . import __version__
-
 console = Console()
 
 
@@ -84,6 +82,16 @@ class _LazyGroup(click.Group):
         return cmd
 
 
+def _print_version(ctx: click.Context, _param: click.Parameter, value: bool) -> None:
+    """Eager ``--version`` callback; resolves the version only when asked for."""
+    if not value or ctx.resilient_parsing:
+        return
+    from ._version import get_version
+
+    click.echo(f"cyberwave, version {get_version()}")
+    ctx.exit()
+
+
 def _load_sdk_default_api():
     """Import and return the generated SDK DefaultApi type."""
     from cyberwave.rest import DefaultApi
@@ -108,7 +116,14 @@ def run_sdk_selfcheck() -> int:
 
 
 @click.group(cls=_LazyGroup, lazy_commands=_LAZY_COMMANDS, invoke_without_command=True)
-@click.version_option(version=__version__, prog_name="cyberwave")
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
+)
 @click.pass_context
 def cli(ctx: click.Context) -> None:
     """Cyberwave CLI - Manage digital twins and edge ML.
@@ -9,8 +9,12 @@ This module provides common functionality used across multiple CLI commands:
 
 from __future__ import annotations
 
+import atexit
+import functools
 import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Any, Callable, Optional, TypeVar
 from urllib.parse import urlparse
 
@@ -238,6 +242,29 @@ def _resolve_mqtt_kwargs(
     return kwargs
 
 
+@functools.lru_cache(maxsize=1)
+def get_http_client():
+    """Process-wide ``httpx.Client`` for CLI calls made outside the SDK.
+
+    Endpoints the SDK doesn't wrap (edge discover/pair, ...) are often hit
+    back to back on the same host; one pooled client keeps the connection
+    alive between them instead of paying a fresh TCP/TLS handshake per
+    request. Closed at interpreter exit.
+    """
+    import httpx
+
+    client = httpx.Client(
+        # Fail fast on an unreachable host; the backend may still take a while
+        # to answer once connected.
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=4),
+        # Re-attempts failed connection setups on the transport itself.
+        transport=httpx.HTTPTransport(retries=3),
+    )
+    atexit.register(client.close)
+    return client
+
+
 def get_sdk_client(api_url: Optional[str] = None):
     """Get an authenticated Cyberwave SDK client.
 
@@ -261,17 +288,74 @@ def get_sdk_client(api_url: Optional[str] = None):
     if not creds or not creds.token:
         return None
     try:
-        from cyberwave import Cyberwave
-
         base_url = resolve_api_url(api_url, creds)
         client_kwargs = _resolve_mqtt_kwargs(creds, base_url)
         if creds.workspace_uuid:
             client_kwargs["workspace_id"] = creds.workspace_uuid
-        return Cyberwave(base_url=base_url, token=creds.token, **client_kwargs)
+        return _build_sdk_client(base_url, creds.token, tuple(sorted(client_kwargs.items())))
     except ImportError:
         return None
 
 
+# SDK clients by everything passed to ``Cyberwave()``, most recently used
+# last. Bounded so clients for earlier tokens/URLs are dropped, and each
+# dropped client is disconnected rather than lingering until exit.
+_SDK_CLIENT_CACHE_SIZE = 4
+_SDK_CLIENTS: OrderedDict[tuple, Any] = OrderedDict()
+_SDK_CLIENTS_LOCK = threading.Lock()
+
+
+def _build_sdk_client(base_url: str, token: str, client_kwargs: tuple[tuple[str, Any], ...]):
+    """Construct (once per process) the SDK client for a given connection setup.
+
+    The client owns the REST connection pool, so handing the same instance
+    to every command in a process (scripted invocations, tests, ``twin
+    create --pair``) keeps connections alive instead of paying a fresh
+    TCP/TLS handshake per call.  Keyed on everything passed to
+    ``Cyberwave()`` so a re-login or URL override builds a new client.
+    """
+    key = (base_url, token, client_kwargs)
+    evicted = None
+    with _SDK_CLIENTS_LOCK:
+        client = _SDK_CLIENTS.get(key)
+        if client is not None:
+            _SDK_CLIENTS.move_to_end(key)
+            return client
+
+        from cyberwave import Cyberwave
+
+        client = Cyberwave(base_url=base_url, token=token, **dict(client_kwargs))
+        _SDK_CLIENTS[key] = client
+        if len(_SDK_CLIENTS) > _SDK_CLIENT_CACHE_SIZE:
+            _, evicted = _SDK_CLIENTS.popitem(last=False)
+    if evicted is not None:
+        _disconnect_sdk_client(evicted)
+    return client
+
+
+def _disconnect_sdk_client(client: Any) -> None:
+    """Close *client*'s connections. Best effort."""
+    disconnect = getattr(client, "disconnect", None)
+    if callable(disconnect):
+        try:
+            disconnect()
+        except Exception:
+            pass
+
+
+def clear_sdk_client_cache() -> None:
+    """Disconnect and forget memoized SDK clients (e.g. after credentials change)."""
+    with _SDK_CLIENTS_LOCK:
+        clients = list(_SDK_CLIENTS.values())
+        _SDK_CLIENTS.clear()
+    for client in clients:
+        _disconnect_sdk_client(client)
+
+
+# Whatever is still cached at exit gets disconnected once.
+atexit.register(clear_sdk_client_cache)
+
+
 def require_client(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator that ensures SDK client is available.
@@ -71,6 +71,7 @@ def load_core_module(monkeypatch):
     cli_config_module.CONFIG_DIR = Path("/tmp/cyberwave-config")
     cli_config_module.LEGACY_SYSTEM_CONFIG_DIR = Path("/tmp/nonexistent-cyberwave-legacy")
     cli_config_module.clean_subprocess_env = lambda: {}
+    cli_config_module.clean_subprocess_env_view = lambda: None
     cli_config_module.get_api_url = lambda: "https://api.example.test"
     cli_config_module._resolve_sudo_user_home = lambda: None
     cli_config_module.chown_to_sudo_user = lambda *_paths: None
@@ -82,6 +83,9 @@ def load_core_module(monkeypatch):
     credentials_module.load_credentials = lambda: None
     credentials_module.save_credentials = lambda *_args, **_kwargs: None
     credentials_module.get_token = lambda: None
+    credentials_module.token_recently_verified = lambda *_args, **_kwargs: False
+    credentials_module.mark_token_verified = lambda *_args, **_kwargs: None
+    credentials_module.forget_token_verification = lambda: None
 
     monkeypatch.setitem(sys.modules, "cyberwave", cyberwave_module)
     monkeypatch.setitem(sys.modules, "cyberwave.config", config_module)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from cyberwave_cli import asset_resolver
+
+
+def _client_with_alias(asset) -> MagicMock:
+    client = MagicMock()
+    client.assets.get_by_alias.return_value = asset
+    return client
+
+
+def test_resolve_asset_caches_api_lookups(monkeypatch) -> None:
+    asset_resolver.clear_asset_cache()
+    client = _client_with_alias(SimpleNamespace(uuid="a-1", name="Camera"))
+
+    first = asset_resolver.resolve_asset("camera", client)
+    second = asset_resolver.resolve_asset("camera", client)
+
+    assert first == second
+    assert first["uuid"] == "a-1"
+    client.assets.get_by_alias.assert_called_once_with("camera")
+    asset_resolver.clear_asset_cache()
+
+
+def test_resolve_asset_cache_expires_after_ttl(monkeypatch) -> None:
+    asset_resolver.clear_asset_cache()
+    client = _client_with_alias(SimpleNamespace(uuid="a-1", name="Camera"))
+    now = [1000.0]
+    monkeypatch.setattr(asset_resolver.time, "monotonic", lambda: now[0])
+
+    asset_resolver.resolve_asset("camera", client)
+    now[0] += asset_resolver.ASSET_CACHE_TTL_SECONDS + 1
+    asset_resolver.resolve_asset("camera", client)
+
+    assert client.assets.get_by_alias.call_count == 2
+    asset_resolver.clear_asset_cache()
+
+
+def test_get_asset_caches_by_uuid() -> None:
+    asset_resolver.clear_asset_cache()
+    client = MagicMock()
+    client.assets.get.return_value = SimpleNamespace(uuid="a-2")
+
+    assert asset_resolver.get_asset("a-2", client) is asset_resolver.get_asset("a-2", client)
+    client.assets.get.assert_called_once_with("a-2")
+    asset_resolver.clear_asset_cache()
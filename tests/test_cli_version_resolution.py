@@ -31,3 +31,16 @@ def test_get_version_falls_back_to_static_version_on_metadata_error(monkeypatch)
     monkeypatch.setattr(version_module, "metadata_version", _raise)
 
     assert version_module.get_version() == version_module.STATIC_VERSION
+
+
+def test_version_flag_resolves_version_on_demand(monkeypatch):
+    from click.testing import CliRunner
+
+    import cyberwave_cli.main as main_module
+
+    monkeypatch.setattr(version_module, "BUILD_VERSION", "0.11.43.9")
+
+    result = CliRunner().invoke(main_module.cli, ["--version"])
+
+    assert result.exit_code == 0
+    assert result.output == "cyberwave, version 0.11.43.9\n"
@@ -1,3 +1,4 @@
+import ast
 from pathlib import Path
 
 import cyberwave_cli.config as config
@@ -30,3 +31,55 @@ def test_resolve_config_dir_env_override_wins_over_sudo_home(monkeypatch):
     monkeypatch.setattr(config, "_resolve_sudo_user_home", lambda: Path("/home/alice"))
 
     assert config._resolve_config_dir() == Path("/opt/custom")
+
+
+def test_clean_subprocess_env_view_inherits_outside_pyinstaller(monkeypatch):
+    monkeypatch.delenv("LD_LIBRARY_PATH_ORIG", raising=False)
+    monkeypatch.delattr(config.sys, "_MEIPASS", raising=False)
+    assert config.clean_subprocess_env_view() is None
+
+    monkeypatch.setenv("LD_LIBRARY_PATH", "/tmp/_MEIxyz")
+    monkeypatch.setenv("LD_LIBRARY_PATH_ORIG", "/usr/lib")
+    env = config.clean_subprocess_env_view()
+    assert env is not None
+    assert env["LD_LIBRARY_PATH"] == "/usr/lib"
+    assert "LD_LIBRARY_PATH_ORIG" not in env
+
+
+def test_resolve_sudo_user_home_looks_up_each_user_once(monkeypatch):
+    import pwd
+
+    lookups: list[str] = []
+
+    def _getpwnam(name):
+        lookups.append(name)
+        return type("pw", (), {"pw_dir": f"/home/{name}"})()
+
+    monkeypatch.setattr(pwd, "getpwnam", _getpwnam)
+    config._user_home.cache_clear()
+    monkeypatch.setenv("SUDO_USER", "alice")
+
+    assert config._resolve_sudo_user_home() == Path("/home/alice")
+    assert config._resolve_sudo_user_home() == Path("/home/alice")
+    config._user_home.cache_clear()
+    assert lookups == ["alice"]
+
+
+def test_all_lists_every_public_name_imported_from_config():
+    package_root = Path(config.__file__).resolve().parent
+    imported: set[str] = set()
+    for path in package_root.rglob("*.py"):
+        package = path.parent.relative_to(package_root.parent).parts
+        for node in ast.walk(ast.parse(path.read_text())):
+            if not isinstance(node, ast.ImportFrom):
+                continue
+            if node.level:
+                base = package[: len(package) - node.level + 1]
+                module = ".".join(base + ((node.module,) if node.module else ()))
+            else:
+                module = node.module
+            if module == "cyberwave_cli.config":
+                imported.update(a.name for a in node.names if not a.name.startswith("_"))
+
+    assert imported
+    assert imported - set(config.__all__) == set()
@@ -0,0 +1,385 @@
+"""Validator caching in ``cyberwave_cli.config_validator``."""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from types import ModuleType
+
+import pytest
+
+import cyberwave_cli.config_validator as config_validator
+
+
+@pytest.fixture(autouse=True)
+def _resolve_jsonschema_per_test(monkeypatch) -> None:
+    # Tests swap ``sys.modules["jsonschema"]``; make each one re-import it.
+    monkeypatch.setattr(config_validator, "_DRAFT7_VALIDATOR", config_validator._UNRESOLVED)
+    monkeypatch.setattr(config_validator, "_RESULT_CACHE", OrderedDict())
+
+
+def _asset(schema: dict) -> dict:
+    return {
+        "metadata": {
+            "edge_runtimes": [{"name": "cyberwave-edge-python", "config_schema": schema}]
+        }
+    }
+
+
+def test_validator_is_compiled_once_per_distinct_schema(monkeypatch) -> None:
+    built: list[dict] = []
+
+    class _Draft7Validator:
+        def __init__(self, schema):
+            built.append(schema)
+
+        def iter_errors(self, config):
+            return iter(())
+
+    fake_jsonschema = ModuleType("jsonschema")
+    fake_jsonschema.Draft7Validator = _Draft7Validator
+    fake_jsonschema.ValidationError = Exception
+    monkeypatch.setitem(sys.modules, "jsonschema", fake_jsonschema)
+    monkeypatch.setattr(config_validator, "_VALIDATOR_CACHE", OrderedDict())
+    monkeypatch.setattr(config_validator, "_SCHEMA_DIGESTS", {})
+
+    schema = {"type": "object", "properties": {"fps": {"type": "integer"}}}
+    asset = _asset(schema)
+    assert config_validator.validate_edge_config({"fps": 5}, asset) == []
+    assert config_validator.validate_edge_config({"fps": 6}, asset) == []
+    # An equal schema loaded separately reuses the same validator.
+    config_validator.validate_edge_config({}, _asset({**schema}))
+    config_validator.validate_edge_config({}, _asset({"type": "object"}))
+
+    assert len(built) == 2
+
+
+def test_basic_validation_used_without_jsonschema(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "jsonschema", None)
+
+    errors = config_validator.validate_edge_config(
+        {"fps": 999},
+        _asset({"type": "object", "properties": {"fps": {"type": "integer", "maximum": 60}}}),
+    )
+
+    assert errors == ["fps: 999 exceeds maximum (60)"]
+
+
+def test_basic_validation_compiles_schema_once_and_checks_nested_values() -> None:
+    schema = {
+        "type": "object",
+        "required": ["cameras"],
+        "properties": {
+            "cameras": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"fps": {"type": "integer", "maximum": 30}},
+                },
+            },
+        },
+    }
+
+    errors = config_validator._basic_validation({"cameras": [{"fps": 31}, {"fps": "x"}]}, schema)
+
+    assert errors == [
+        "cameras[0].fps: 31 exceeds maximum (30)",
+        "cameras[1].fps: Expected integer, got str",
+    ]
+    assert config_validator._compile_basic(schema) is config_validator._compile_basic(schema)
+    assert config_validator._basic_validation({}, schema) == ["Missing required field: cameras"]
+
+
+def test_suggest_fixes_reads_bounds_and_choices_from_errors() -> None:
+    errors = [
+        "fps: 999 exceeds maximum (60)",
+        "fps: 0 is below minimum (1)",
+        "mode: 'x' not in allowed values: ['a', 'b']",
+        "Missing required field: cameras",
+    ]
+
+    assert config_validator.suggest_fixes(errors) == [
+        "Set fps to 60 (maximum supported)",
+        "Set fps to at least 1",
+        "Use one of: 'a', 'b'",
+        "Add required field: cameras",
+    ]
+
+
+def test_basic_validation_issues_carry_structure_for_suggestions() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "fps": {"type": "number", "maximum": 7.5},
+            "mode": {"enum": ["a", "b"]},
+        },
+    }
+
+    errors = config_validator._basic_validation({"fps": 9, "mode": "c"}, schema)
+
+    assert errors == [
+        "fps: 9 exceeds maximum (7.5)",
+        "mode: 'c' not in allowed values: ['a', 'b']",
+    ]
+    assert [(e.kind, e.path, e.bound) for e in errors] == [
+        ("maximum", "fps", 7.5),
+        ("enum", "mode", None),
+    ]
+    assert config_validator.suggest_fixes(errors) == [
+        "Set fps to 7.5 (maximum supported)",
+        "Use one of: 'a', 'b'",
+    ]
+
+
+def test_basic_validation_does_not_accept_booleans_as_numbers() -> None:
+    schema = {
+        "type": "object",
+        "properties": {"fps": {"type": "integer"}, "scale": {"type": "number", "minimum": 2}},
+    }
+
+    errors = config_validator._basic_validation({"fps": True, "scale": False}, schema)
+
+    assert errors == [
+        "fps: Expected integer, got bool",
+        "scale: Expected number, got bool",
+    ]
+
+
+def test_basic_validation_accepts_type_unions() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "fps": {"type": "integer", "maximum": 60},
+            "name": {"type": ["string", "null"], "maxLength": 3},
+        },
+    }
+
+    assert config_validator._basic_validation({"fps": 99}, schema) == [
+        "fps: 99 exceeds maximum (60)"
+    ]
+    assert config_validator._basic_validation({"name": None}, schema) == []
+    assert config_validator._basic_validation({"name": 5}, schema) == [
+        "name: Expected string or null, got int"
+    ]
+    assert config_validator._basic_validation({"name": "long"}, schema) == [
+        "name: String too long (max 3)"
+    ]
+
+
+def test_basic_validation_ignores_tuple_form_items() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "fps": {"type": "integer", "maximum": 60},
+            "pair": {"type": "array", "items": [{"type": "string"}, {"type": "integer"}]},
+        },
+    }
+
+    assert config_validator._basic_validation({"fps": 99}, schema) == [
+        "fps: 99 exceeds maximum (60)"
+    ]
+    assert config_validator._basic_validation({"pair": ["a", 1]}, schema) == []
+
+
+def test_basic_validation_ignores_boolean_subschemas() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "fps": {"type": "integer", "maximum": 60},
+            "a": True,
+            "nested": {"type": "object", "properties": {"b": False}},
+        },
+    }
+
+    assert config_validator._basic_validation({"fps": 99}, schema) == [
+        "fps: 99 exceeds maximum (60)"
+    ]
+    assert config_validator._basic_validation({"a": 1, "nested": {"b": 2}}, schema) == []
+
+
+def test_basic_validation_walks_deep_nesting_in_document_order() -> None:
+    leaf = {"type": "integer", "maximum": 1}
+    node = leaf
+    for _ in range(200):
+        node = {"type": "array", "items": node}
+    schema = {"type": "object", "properties": {"deep": node}}
+    value = 5
+    for _ in range(200):
+        value = [value]
+
+    errors = config_validator._basic_validation({"deep": value}, schema)
+
+    assert len(errors) == 1
+    assert errors[0].kind == "maximum"
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "a": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"x": {"type": "string"}, "y": {"type": "string"}},
+                },
+            },
+            "b": {"type": "string"},
+        },
+    }
+    errors = config_validator._basic_validation(
+        {"a": [{"x": 1, "y": 2}, {"x": 3}], "b": 4}, schema
+    )
+    assert [e.path for e in errors] == ["a[0].x", "a[0].y", "a[1].x", "b"]
+
+
+def test_is_edge_config_valid_stops_at_first_error(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "jsonschema", None)
+    schema = {
+        "type": "object",
+        "required": ["fps"],
+        "properties": {"fps": {"type": "integer", "maximum": 60}, "mode": {"enum": ["a"]}},
+    }
+
+    assert config_validator.is_edge_config_valid({"fps": 30, "mode": "a"}, _asset(schema))
+    assert not config_validator.is_edge_config_valid({"fps": 99}, _asset(schema))
+    assert config_validator._basic_validation({"mode": "b"}, schema, max_errors=1) == [
+        "Missing required field: fps"
+    ]
+    # Unknown runtime fails; an asset without runtimes has nothing to check.
+    assert not config_validator.is_edge_config_valid({}, _asset(schema), runtime_name="other")
+    assert config_validator.is_edge_config_valid({}, {"metadata": {}})
+
+
+def test_enum_lookup_uses_a_set_and_handles_unhashable_values() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "mode": {"enum": ["a", "b"]},
+            "shape": {"enum": [[1, 2], {"x": 1}]},
+        },
+    }
+    compiled = config_validator._compile_basic(schema)
+
+    assert compiled.properties["mode"].enum_set == frozenset({"a", "b"})
+    assert compiled.properties["shape"].enum_set is None
+    assert schema["properties"]["mode"] == {"enum": ["a", "b"]}
+    assert config_validator._basic_validation(
+        {"mode": ["a"], "shape": [1, 2]}, schema
+    ) == ["mode: '['a']' not in allowed values: ['a', 'b']"]
+
+
+def test_runtimes_are_indexed_once_per_asset(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "jsonschema", None)
+    runtimes = [
+        {"name": "cyberwave-edge-python", "config_schema": {"required": ["fps"]}},
+        {"name": "cyberwave-edge-python", "config_schema": {"required": ["other"]}},
+    ]
+    asset = {"metadata": {"edge_runtimes": runtimes}}
+
+    assert config_validator.validate_edge_config({}, asset) == ["Missing required field: fps"]
+    index = config_validator._runtimes_by_name(runtimes)
+    assert config_validator._runtimes_by_name(runtimes) is index
+
+    runtimes.append({"name": "late"})
+    assert "late" in config_validator._runtimes_by_name(runtimes)
+
+
+def test_validate_edge_config_caps_error_count(monkeypatch) -> None:
+    consumed: list[int] = []
+
+    class _Error:
+        def __init__(self, i):
+            self.absolute_path = ["f"]
+            self.message = f"bad {i}"
+
+    class _Draft7Validator:
+        def __init__(self, schema):
+            pass
+
+        def iter_errors(self, config):
+            for i in range(10):
+                consumed.append(i)
+                yield _Error(i)
+
+    fake_jsonschema = ModuleType("jsonschema")
+    fake_jsonschema.Draft7Validator = _Draft7Validator
+    monkeypatch.setitem(sys.modules, "jsonschema", fake_jsonschema)
+    monkeypatch.setattr(config_validator, "_VALIDATOR_CACHE", OrderedDict())
+    monkeypatch.setattr(config_validator, "_SCHEMA_DIGESTS", {})
+    asset = _asset({"type": "object"})
+
+    assert config_validator.validate_edge_config({}, asset, max_errors=2) == [
+        "f: bad 0",
+        "f: bad 1",
+    ]
+    assert consumed == [0, 1]
+    assert len(config_validator.validate_edge_config({}, asset)) == 10
+
+    monkeypatch.setitem(sys.modules, "jsonschema", None)
+    monkeypatch.setattr(config_validator, "_DRAFT7_VALIDATOR", config_validator._UNRESOLVED)
+    assert config_validator.validate_edge_config(
+        {}, _asset({"required": ["a", "b", "c"]}), max_errors=2
+    ) == ["Missing required field: a", "Missing required field: b"]
+
+
+@pytest.mark.parametrize("max_errors", [0, -1])
+def test_validate_edge_config_rejects_non_positive_error_cap(monkeypatch, max_errors) -> None:
+    asset = _asset({"required": ["a"]})
+
+    # Both the jsonschema path and the fallback reject the cap the same way.
+    fake_jsonschema = ModuleType("jsonschema")
+    fake_jsonschema.Draft7Validator = lambda schema: None
+    monkeypatch.setitem(sys.modules, "jsonschema", fake_jsonschema)
+    monkeypatch.setattr(config_validator, "_DRAFT7_VALIDATOR", config_validator._UNRESOLVED)
+    with pytest.raises(ValueError):
+        config_validator.validate_edge_config({}, asset, max_errors=max_errors)
+
+    monkeypatch.setitem(sys.modules, "jsonschema", None)
+    monkeypatch.setattr(config_validator, "_DRAFT7_VALIDATOR", config_validator._UNRESOLVED)
+    with pytest.raises(ValueError):
+        config_validator.validate_edge_config({}, asset, max_errors=max_errors)
+
+
+def test_config_validation_error_message() -> None:
+    error = config_validator.ConfigValidationError(["a: bad", "b: bad"], ["fix a"])
+
+    assert str(error) == (
+        "Configuration validation failed:\n  • a: bad\n  • b: bad\n\nSuggested fixes:\n  • fix a\n"
+    )
+
+
+def test_jsonschema_import_is_resolved_once(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "jsonschema", None)
+    assert config_validator._draft7_validator_class() is None
+
+    fake_jsonschema = ModuleType("jsonschema")
+    fake_jsonschema.Draft7Validator = object
+    monkeypatch.setitem(sys.modules, "jsonschema", fake_jsonschema)
+
+    assert config_validator._draft7_validator_class() is None
+
+
+def test_validation_results_are_cached_until_ttl(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "jsonschema", None)
+    calls: list[dict] = []
+    real_basic = config_validator._basic_validation
+
+    def _counting_basic(config, schema, max_errors=None):
+        calls.append(config)
+        return real_basic(config, schema, max_errors=max_errors)
+
+    monkeypatch.setattr(config_validator, "_basic_validation", _counting_basic)
+    now = [100.0]
+    monkeypatch.setattr(config_validator.time, "monotonic", lambda: now[0])
+    asset = _asset({"required": ["fps"]})
+
+    first = config_validator.validate_edge_config({"a": 1}, asset)
+    first.append("caller mutation")
+    assert config_validator.validate_edge_config({"a": 1}, asset) == ["Missing required field: fps"]
+    assert len(calls) == 1
+
+    config_validator.validate_edge_config({"a": 2}, asset)
+    assert len(calls) == 2
+
+    now[0] += config_validator.RESULT_CACHE_TTL_SECONDS + 1
+    config_validator.validate_edge_config({"a": 1}, asset)
+    assert len(calls) == 3
@@ -0,0 +1,16 @@
+"""Built-in plugin/model fallbacks in ``cyberwave_cli.constants``."""
+
+from __future__ import annotations
+
+import pytest
+
+from cyberwave_cli.constants import get_fallback_models
+
+
+def test_fallback_models_are_built_once_and_read_only() -> None:
+    models = get_fallback_models()
+
+    assert models is get_fallback_models()
+    assert models["yolov8n"]["event_types"] == ("detect_detected",)
+    with pytest.raises(TypeError):
+        models["yolov8n"]["name"] = "changed"  # type: ignore[index]
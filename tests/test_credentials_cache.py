@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import importlib
+import json
+
+credentials_module = importlib.import_module("cyberwave_cli.credentials")
+
+
+def test_load_credentials_reuses_parse_until_file_changes(monkeypatch, tmp_path) -> None:
+    creds_file = tmp_path / "credentials.json"
+    creds_file.write_text(json.dumps({"token": "token-a"}))
+    monkeypatch.setattr(credentials_module, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(credentials_module, "CREDENTIALS_FILE", creds_file)
+    credentials_module._invalidate_credentials_cache()
+
+    parses: list[dict] = []
+    real_from_dict = credentials_module.Credentials.from_dict.__func__
+
+    def _counting_from_dict(cls, data):
+        parses.append(data)
+        return real_from_dict(cls, data)
+
+    monkeypatch.setattr(
+        credentials_module.Credentials, "from_dict", classmethod(_counting_from_dict)
+    )
+
+    first = credentials_module.load_credentials()
+    second = credentials_module.load_credentials()
+    assert first is not None and second is not None
+    assert first.token == second.token == "token-a"
+    assert first is not second
+    assert len(parses) == 1
+
+    credentials_module.save_credentials(credentials_module.Credentials(token="token-b"))
+    third = credentials_module.load_credentials()
+    assert third is not None and third.token == "token-b"
+    assert len(parses) == 2
+
+
+def test_load_credentials_returns_none_when_file_missing(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(credentials_module, "CREDENTIALS_FILE", tmp_path / "missing.json")
+    credentials_module._invalidate_credentials_cache()
+
+    assert credentials_module.load_credentials() is None
+
+
+def test_token_verification_is_remembered_per_token_and_url(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(credentials_module, "TOKEN_VERIFIED_FILE", tmp_path / "token_verified.json")
+    monkeypatch.setattr(credentials_module, "chown_to_sudo_user", lambda *_paths: None)
+
+    assert not credentials_module.token_recently_verified("secret-token", "https://api.example.test")
+
+    credentials_module.mark_token_verified("secret-token", "https://api.example.test")
+
+    assert credentials_module.token_recently_verified("secret-token", "https://api.example.test")
+    assert "secret-token" not in (tmp_path / "token_verified.json").read_text()
+    assert not credentials_module.token_recently_verified("other", "https://api.example.test")
+    assert not credentials_module.token_recently_verified("secret-token", "https://api-dev.example.test")
+    assert not credentials_module.token_recently_verified(
+        "secret-token", "https://api.example.test", max_age=0
+    )
+
+    credentials_module.forget_token_verification()
+    assert not credentials_module.token_recently_verified("secret-token", "https://api.example.test")
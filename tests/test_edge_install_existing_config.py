@@ -262,3 +262,69 @@ def test_configure_edge_environment_skips_prompt_with_skip_confirm(
 
     assert result is True
     assert not any("already connected" in p for p in confirm_prompts)
+
+
+def test_save_environment_file_syncs_directory_only_when_durable(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    env_file = tmp_path / "environment.json"
+    monkeypatch.setattr(core, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(core, "ENVIRONMENT_FILE", env_file)
+    env_file.write_text("{}")  # replace path; first writes may use O_TMPFILE
+    synced: list[int] = []
+    real_fsync = core.os.fsync
+    monkeypatch.setattr(core.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+
+    core._save_environment_file(workspace_uuid="ws-1", workspace_name="WS")
+
+    assert json.loads(env_file.read_text()) == {"workspace_uuid": "ws-1", "workspace_name": "WS"}
+    assert len(synced) == 1
+
+    synced.clear()
+    core._save_environment_file(workspace_uuid="ws-2", workspace_name="WS", durable=True)
+
+    assert json.loads(env_file.read_text())["workspace_uuid"] == "ws-2"
+    assert len(synced) == 2
+
+
+def test_save_environment_file_leaves_identical_file_untouched(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    env_file = tmp_path / "environment.json"
+    monkeypatch.setattr(core, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(core, "ENVIRONMENT_FILE", env_file)
+
+    core._save_environment_file(workspace_uuid="ws-1", workspace_name="WS", twin_uuids=["t1"])
+    inode = env_file.stat().st_ino
+    monkeypatch.setattr(
+        core.tempfile,
+        "NamedTemporaryFile",
+        lambda *a, **kw: (_ for _ in ()).throw(AssertionError("unexpected rewrite")),
+    )
+
+    core._save_environment_file(workspace_uuid="ws-1", workspace_name="WS", twin_uuids=["t1"])
+
+    assert env_file.stat().st_ino == inode
+
+
+def test_create_file_from_tmpfile_is_all_or_nothing(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    target = tmp_path / "environment.json"
+
+    if core._create_file_from_tmpfile(target, b'{"a": 1}\n'):
+        assert target.read_bytes() == b'{"a": 1}\n'
+        assert target.stat().st_mode & 0o777 == 0o600
+    else:
+        assert not target.exists()
+    assert list(tmp_path.iterdir()) in ([], [target])
+
+    # An existing file is never replaced through this path.
+    target.write_text("old")
+    assert core._create_file_from_tmpfile(target, b"new") is False
+    assert target.read_text() == "old"
+
+    # New files end up with the payload either way.
+    monkeypatch.setattr(core, "CONFIG_DIR", tmp_path / "cfg")
+    monkeypatch.setattr(core, "ENVIRONMENT_FILE", tmp_path / "cfg" / "environment.json")
+    core._save_environment_file(workspace_uuid="ws-1", workspace_name="WS")
+    saved = json.loads((tmp_path / "cfg" / "environment.json").read_text())
+    assert saved["workspace_uuid"] == "ws-1"
+    assert [p.name for p in (tmp_path / "cfg").iterdir()] == ["environment.json"]
@@ -92,6 +92,7 @@ def test_edge_install_command_uses_channel_flag(monkeypatch):
             "channel": "dev",
             "version": "0.3.1.dev5",
             "force_reinstall": False,
+            "assume_installed": False,
         }
     ]
 
@@ -123,6 +124,7 @@ def test_edge_install_without_workers_flag_is_deprecated_noop(monkeypatch):
             "channel": "stable",
             "version": None,
             "force_reinstall": False,
+            "assume_installed": False,
         }
     ]
 
@@ -0,0 +1,100 @@
+"""Raw-TTY rendering in ``cyberwave_cli.interactive_select``."""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import sys
+import termios
+import tty
+
+import pytest
+
+import cyberwave_cli.interactive_select as interactive_select
+
+
+class _FakeStdin:
+    def __init__(self, keys: str) -> None:
+        self._keys = io.StringIO(keys)
+
+    def isatty(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return 0
+
+    def read(self, n: int) -> str:
+        return self._keys.read(n)
+
+
+class _FakeStdout(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def fake_tty(monkeypatch):
+    stdout = _FakeStdout()
+
+    def _install(keys: str, *, columns: int = 80) -> _FakeStdout:
+        monkeypatch.setattr(sys, "stdin", _FakeStdin(keys))
+        monkeypatch.setattr(sys, "stdout", stdout)
+        monkeypatch.setattr(termios, "tcgetattr", lambda fd: [])
+        monkeypatch.setattr(termios, "tcsetattr", lambda fd, when, attrs: None)
+        monkeypatch.setattr(tty, "setraw", lambda fd: None)
+        monkeypatch.setattr(
+            shutil, "get_terminal_size", lambda *a, **kw: os.terminal_size((columns, 24))
+        )
+        return stdout
+
+    return _install
+
+
+def test_single_select_moves_highlight_without_clearing_screen(fake_tty) -> None:
+    stdout = fake_tty("jj\r")
+
+    assert interactive_select._select_with_arrows("Pick", ["a", "b", "c"]) == 2
+
+    output = stdout.getvalue()
+    assert output.count("\x1b[2J") == 1
+    # Second move rewrites rows 5 ("b") and 6 ("c") in place.
+    assert "\x1b[5;1H\x1b[2K  b" in output
+    assert "\x1b[6;1H\x1b[2K❯ c" in output
+
+
+def test_single_select_repaints_when_lines_wrap(fake_tty) -> None:
+    stdout = fake_tty("j\r", columns=10)
+
+    assert interactive_select._select_with_arrows("Pick", ["a", "b"]) == 1
+
+    assert stdout.getvalue().count("\x1b[2J") == 2
+
+
+def test_multi_select_redraws_only_toggled_row(fake_tty) -> None:
+    stdout = fake_tty("j \r")
+
+    assert interactive_select._select_multiple_with_arrows("Pick", ["a", "b", "c"]) == [1]
+
+    output = stdout.getvalue()
+    assert output.count("\x1b[2J") == 1
+    assert "\x1b[5;1H\x1b[2K❯ [x] b" in output
+
+
+def test_each_frame_is_a_single_write(fake_tty, monkeypatch) -> None:
+    stdout = fake_tty("jk\r")
+    writes: list[str] = []
+    real_write = stdout.write
+    monkeypatch.setattr(stdout, "write", lambda text: writes.append(text) or real_write(text))
+
+    interactive_select._select_with_arrows("Pick", ["a", "b", "c"])
+
+    # hide cursor, full frame, two partial frames, show cursor
+    assert len(writes) == 5
+    assert writes[1].startswith("\x1b[2J\x1b[H") and writes[1].count("\r\n") == 6
+
+
+def test_arrow_keys_in_normal_and_application_cursor_mode(fake_tty) -> None:
+    fake_tty("\x1b[B\x1bOB\x1bOA\x1b[C\r")
+
+    assert interactive_select._select_with_arrows("Pick", ["a", "b", "c"]) == 1
@@ -289,3 +289,26 @@ def test_login_with_token_persists_mqtt_runtime_overrides(
     assert credentials.cyberwave_base_url == "http://localhost:8000"
     assert credentials.cyberwave_mqtt_host == "localhost"
     assert credentials.cyberwave_mqtt_port == "1883"
+
+
+def test_login_validates_stored_token_once_when_urls_match(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    existing = _login_module.Credentials(
+        token="old-token",
+        email="old@example.com",
+        cyberwave_base_url="https://api.example.test/",
+    )
+    calls: list[str | None] = []
+
+    def _validate(token: str, base_url: str | None = None) -> bool:
+        calls.append(base_url)
+        return False
+
+    monkeypatch.setattr(_login_module, "load_credentials", lambda: existing)
+    monkeypatch.setattr(_login_module, "get_api_url", lambda: "https://api.example.test")
+    monkeypatch.setattr(_login_module, "_validate_stored_token", _validate)
+
+    CliRunner().invoke(_login_module.login, [], input="\n")
+
+    assert calls == ["https://api.example.test/"]
@@ -1,7 +1,13 @@
 # tests/test_service_spec.py
+import base64
+import os
 import plistlib
+import socket
 import sys
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import httpx
 import pytest
@@ -105,6 +111,22 @@ def test_create_systemd_service_writes_unit_to_spec_path(monkeypatch, tmp_path):
     assert "cyberwave-cloud-node" in unit_path.read_text()
 
 
+def test_create_systemd_service_leaves_unchanged_unit_alone(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+
+    unit_path = tmp_path / "cyberwave-cloud-node.service"
+    cloud_spec = core.CLOUD_NODE_SPEC
+    monkeypatch.setattr(cloud_spec, "unit_path", unit_path)
+    monkeypatch.setattr(core, "_has_systemd", lambda: True)
+    monkeypatch.setattr(cloud_spec, "binary_path", Path("/usr/bin/cyberwave-cloud-node"))
+
+    assert core.create_systemd_service(cloud_spec) is True
+    os.utime(unit_path, (0, 0))
+
+    assert core.create_systemd_service(cloud_spec) is True
+    assert unit_path.stat().st_mtime == 0
+
+
 def test_create_launchagent_service_writes_plist_with_config(monkeypatch, tmp_path):
     core = load_core_module(monkeypatch)
     home_dir = tmp_path / "home"
@@ -404,6 +426,47 @@ def test_apt_get_install_uses_internal_registry_for_dev(monkeypatch, tmp_path):
 
 
 
+def test_apt_get_install_skips_update_when_index_is_fresh(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    run_calls: list[list[str]] = []
+    keyring_path = tmp_path / "cyberwave-edge-core.gpg"
+    keyring_path.write_text("existing-key")
+    sources_list_path = tmp_path / "cyberwave-edge-core.list"
+    binary_path = tmp_path / "cyberwave-edge-core"
+    lists_dir = tmp_path / "lists"
+    lists_dir.mkdir()
+
+    def fake_run(cmd, **_kw):
+        run_calls.append(cmd)
+        if cmd[:3] == ["apt-get", "install", "-y"]:
+            binary_path.write_text("#!/bin/sh\n")
+
+    monkeypatch.setattr(
+        core,
+        "_resolve_deb_registry_paths",
+        lambda spec, channel="stable": (keyring_path, sources_list_path),
+    )
+    monkeypatch.setattr(core, "_resolve_deb_registry_read_token", lambda channel="stable": None)
+    monkeypatch.setattr(core, "APT_LISTS_DIR", lists_dir)
+    monkeypatch.setattr(core.EDGE_CORE_SPEC, "binary_path", binary_path)
+    monkeypatch.setattr(core, "_run", fake_run)
+
+    # First run writes the sources list, so the index must be refreshed.
+    assert core._apt_get_install(core.EDGE_CORE_SPEC) is True
+    assert ["apt-get", "update", "-qq"] in run_calls
+
+    run_calls.clear()
+    assert core._apt_get_install(core.EDGE_CORE_SPEC) is True
+    assert ["apt-get", "update", "-qq"] not in run_calls
+    assert any(cmd[:2] == ["apt-get", "install"] for cmd in run_calls)
+
+    run_calls.clear()
+    old = time.time() - core.APT_INDEX_FRESH_SECONDS - 60
+    os.utime(lists_dir, (old, old))
+    assert core._apt_get_install(core.EDGE_CORE_SPEC) is True
+    assert ["apt-get", "update", "-qq"] in run_calls
+
+
 def test_apt_get_install_dev_requires_internal_token(monkeypatch, tmp_path):
     core = load_core_module(monkeypatch)
     messages: list[str] = []
@@ -647,6 +710,26 @@ def test_setup_service_does_not_call_docker_when_requires_docker_false(monkeypat
     assert docker_called == [], "Docker should not be installed for cloud node"
 
 
+def test_setup_service_assume_installed_skips_package_and_docker(monkeypatch):
+    core = load_core_module(monkeypatch)
+    service_calls: list[str] = []
+
+    monkeypatch.setattr(core, "_is_linux", lambda: True)
+    monkeypatch.setattr(core, "os", type("os", (), {"geteuid": staticmethod(lambda: 0)})())
+    monkeypatch.setattr(core, "_ensure_credentials", lambda *, skip_confirm: True)
+    monkeypatch.setattr(core, "install_service_package", _raise_assertion("should not install"))
+    monkeypatch.setattr(core, "_install_docker", _raise_assertion("should not install docker"))
+    monkeypatch.setattr(
+        core, "create_systemd_service", lambda spec=None: service_calls.append("create") or True
+    )
+    monkeypatch.setattr(
+        core, "enable_and_start_service", lambda spec=None: service_calls.append("enable") or True
+    )
+
+    assert core.setup_service(core.EDGE_CORE_SPEC, skip_confirm=True, assume_installed=True)
+    assert service_calls == ["create", "enable"]
+
+
 def test_setup_service_calls_post_install_hook(monkeypatch):
     core = load_core_module(monkeypatch)
     hook_calls: list[bool] = []
@@ -1213,3 +1296,277 @@ def test_start_service_returns_true_on_success(monkeypatch, tmp_path):
     result = core.start_service(core.CLOUD_NODE_SPEC)
 
     assert result is True
+
+
+def test_ensure_credentials_skips_probe_for_recently_verified_token(monkeypatch):
+    core = load_core_module(monkeypatch)
+    probes: list[str] = []
+
+    class FakeCreds:
+        token = "stored-token"
+        email = "user@example.test"
+        cyberwave_base_url = "https://api.example.test"
+
+    monkeypatch.setattr(core, "load_credentials", lambda: FakeCreds())
+    monkeypatch.setattr(core, "collect_runtime_env_overrides", lambda: {})
+    monkeypatch.setattr(
+        core, "_get_sdk_client", lambda token, base_url=None: probes.append(token)
+    )
+    monkeypatch.setattr(
+        core,
+        "token_recently_verified",
+        lambda token, base_url=None: (token, base_url) == ("stored-token", "https://api.example.test"),
+    )
+
+    assert core._ensure_credentials(skip_confirm=True) is True
+    assert probes == []
+
+
+def test_get_sdk_client_reuses_client_per_token_and_url(monkeypatch):
+    core = load_core_module(monkeypatch)
+    built: list[tuple[str, str]] = []
+
+    class FakeCyberwave:
+        def __init__(self, *, base_url, token):
+            built.append((token, base_url))
+
+    monkeypatch.setattr(sys.modules["cyberwave"], "Cyberwave", FakeCyberwave, raising=False)
+
+    first = core._get_sdk_client("tok")
+    assert core._get_sdk_client("tok", base_url="https://api.example.test") is first
+    assert core._get_sdk_client("other") is not first
+    assert built == [("tok", "https://api.example.test"), ("other", "https://api.example.test")]
+
+
+# Exported with ``gpg --armor --export``; the body decodes to the keyring
+# ``gpg --dearmor`` produces for it.
+_ARMORED_TEST_KEY = b"""\
+-----BEGIN PGP PUBLIC KEY BLOCK-----
+
+mDMEatGwhBYJKwYBBAHaRw8BAQdAJySH6la1hM9sEKfYXjA/4CWpQq82CLWzMWwE
+AtMFTFW0FFRlc3QgPHRAZXhhbXBsZS5jb20+iJAEExYIADgWIQSwql9HMqr7SbVk
+WEiJSKAph2zSWAUCatGwhAIbAwULCQgHAgYVCgkICwIEFgIDAQIeAQIXgAAKCRCJ
+SKAph2zSWLCfAQC5ZB8rfSZTR2A2y7INxPo+UaydZkwAmj8KVot/mxbMZAEA7zYs
+GuHEmajU7tq2AJIZz22+sLvFyhJCfsfDc+y0Jwg=
+=+CC2
+-----END PGP PUBLIC KEY BLOCK-----
+"""
+
+
+def test_apt_get_install_fetches_and_dearmors_gpg_key_in_process(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    keyring_path = tmp_path / "keyrings" / "cyberwave-edge-core.gpg"
+    sources_list_path = tmp_path / "cyberwave-edge-core.list"
+    binary_path = tmp_path / "cyberwave-edge-core"
+
+    def fake_get(url, **_kw):
+        return httpx.Response(200, content=_ARMORED_TEST_KEY, request=httpx.Request("GET", url))
+
+    def fake_run(cmd, **_kw):
+        if cmd[:3] == ["apt-get", "install", "-y"]:
+            binary_path.write_text("#!/bin/sh\n")
+
+    monkeypatch.setattr(
+        core,
+        "_resolve_deb_registry_paths",
+        lambda spec, channel="stable": (keyring_path, sources_list_path),
+    )
+    monkeypatch.setattr(core, "_resolve_deb_registry_read_token", lambda channel="stable": None)
+    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(core.subprocess, "run", _raise_assertion("no subprocess expected"))
+    monkeypatch.setattr(core.EDGE_CORE_SPEC, "binary_path", binary_path)
+    monkeypatch.setattr(core, "_run", fake_run)
+
+    assert core._apt_get_install(core.EDGE_CORE_SPEC) is True
+    body = b"".join(_ARMORED_TEST_KEY.splitlines()[2:7])
+    assert keyring_path.read_bytes() == base64.b64decode(body)
+
+
+def test_dearmor_pgp_key_rejects_corrupt_input(monkeypatch):
+    core = load_core_module(monkeypatch)
+
+    with pytest.raises(ValueError, match="CRC-24"):
+        core._dearmor_pgp_key(_ARMORED_TEST_KEY.replace(b"=+CC2", b"=+CC3"))
+    with pytest.raises(ValueError, match="no ASCII-armored"):
+        core._dearmor_pgp_key(b"<html>not found</html>")
+
+
+def test_docker_probe_is_memoized_until_forgotten(monkeypatch):
+    core = load_core_module(monkeypatch)
+    which_calls: list[str] = []
+    info_calls: list[list[str]] = []
+
+    def fake_which(name):
+        which_calls.append(name)
+        return "/usr/bin/docker"
+
+    def fake_subprocess_run(cmd, **_kw):
+        info_calls.append(cmd)
+        return SimpleNamespace(returncode=0, stderr=b"")
+
+    monkeypatch.setattr(core.shutil, "which", fake_which)
+    monkeypatch.setattr(core.subprocess, "run", fake_subprocess_run)
+    monkeypatch.setattr(core, "_docker_daemon_pingable", lambda: False)
+
+    assert core._ensure_docker_installed() is True
+    assert core._ensure_docker_installed() is True
+    assert core._docker_path() == "/usr/bin/docker"
+    assert (len(which_calls), len(info_calls)) == (1, 1)
+
+    core._forget_docker_probe()
+    assert core._ensure_docker_installed() is True
+    assert (len(which_calls), len(info_calls)) == (2, 2)
+
+
+def test_docker_daemon_failure_is_not_memoized(monkeypatch):
+    core = load_core_module(monkeypatch)
+    returncodes = iter([1, 0])
+
+    monkeypatch.setattr(core.shutil, "which", lambda name: "/usr/bin/docker")
+    monkeypatch.setattr(core, "_docker_daemon_pingable", lambda: False)
+    monkeypatch.setattr(
+        core.subprocess,
+        "run",
+        lambda cmd, **_kw: SimpleNamespace(returncode=next(returncodes), stderr=b""),
+    )
+
+    assert core._ensure_docker_installed() is False
+    assert core._ensure_docker_installed() is True
+
+
+def _serve_once(server: socket.socket, reply: bytes) -> threading.Thread:
+    def _handle():
+        conn, _ = server.accept()
+        with conn:
+            conn.recv(64)
+            conn.sendall(reply)
+
+    thread = threading.Thread(target=_handle, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_ensure_docker_installed_pings_socket_without_docker_cli(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    sock_path = tmp_path / "docker.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock_path))
+    server.listen(1)
+    thread = _serve_once(server, b"HTTP/1.0 200 OK\r\nContent-Length: 2\r\n\r\nOK")
+
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{sock_path}")
+    monkeypatch.delenv("DOCKER_TLS_VERIFY", raising=False)
+    monkeypatch.setattr(core.shutil, "which", lambda name: "/usr/bin/docker")
+    monkeypatch.setattr(core.subprocess, "run", _raise_assertion("docker info should not run"))
+
+    try:
+        assert core._ensure_docker_installed() is True
+    finally:
+        thread.join(timeout=5)
+        server.close()
+
+
+def test_docker_ping_rejects_error_status_and_unsupported_hosts(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    sock_path = tmp_path / "docker.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock_path))
+    server.listen(1)
+    thread = _serve_once(server, b"HTTP/1.0 500 Internal Server Error\r\n\r\n")
+
+    monkeypatch.delenv("DOCKER_TLS_VERIFY", raising=False)
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{sock_path}")
+    try:
+        assert core._docker_daemon_pingable() is False
+    finally:
+        thread.join(timeout=5)
+        server.close()
+
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{tmp_path / 'missing.sock'}")
+    assert core._docker_daemon_pingable() is False
+    monkeypatch.setenv("DOCKER_HOST", "ssh://user@host")
+    assert core._docker_daemon_pingable() is False
+
+
+def _patch_systemctl_show(monkeypatch, core, stdout: str, returncode: int = 0):
+    calls: list[tuple[list[str], dict]] = []
+
+    def fake_run(cmd, **kw):
+        calls.append((cmd, kw))
+        return SimpleNamespace(returncode=returncode, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(core.subprocess, "run", fake_run)
+    return calls
+
+
+def test_enable_and_start_service_skips_reload_and_enable_when_current(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    unit_path = tmp_path / "cyberwave-edge-core.service"
+    unit_path.write_text("[Unit]\n")
+    monkeypatch.setattr(core.EDGE_CORE_SPEC, "unit_path", unit_path)
+    show_calls = _patch_systemctl_show(
+        monkeypatch, core, "NeedDaemonReload=no\nUnitFileState=enabled\n"
+    )
+    # A PyInstaller bundle must not leak its library path into systemctl.
+    clean_env = {"LD_LIBRARY_PATH": "/usr/lib"}
+    monkeypatch.setattr(core, "clean_subprocess_env_view", lambda: clean_env)
+    run_calls: list[list[str]] = []
+    monkeypatch.setattr(core, "_run", lambda cmd, **_kw: run_calls.append(cmd))
+
+    assert core.enable_and_start_service(core.EDGE_CORE_SPEC) is True
+    assert run_calls == [["systemctl", "restart", "--no-block", "cyberwave-edge-core.service"]]
+    [(show_cmd, show_kwargs)] = show_calls
+    assert show_cmd[:2] == ["systemctl", "show"]
+    assert show_kwargs["env"] is clean_env
+
+
+def test_enable_and_start_service_enables_when_state_unknown(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    unit_path = tmp_path / "cyberwave-edge-core.service"
+    unit_path.write_text("[Unit]\n")
+    monkeypatch.setattr(core.EDGE_CORE_SPEC, "unit_path", unit_path)
+    _patch_systemctl_show(monkeypatch, core, "", returncode=1)
+    run_calls: list[list[str]] = []
+    monkeypatch.setattr(core, "_run", lambda cmd, **_kw: run_calls.append(cmd))
+
+    assert core.enable_and_start_service(core.EDGE_CORE_SPEC) is True
+    # enable reloads the daemon implicitly; no separate daemon-reload.
+    assert run_calls == [
+        ["systemctl", "enable", "cyberwave-edge-core.service"],
+        ["systemctl", "restart", "--no-block", "cyberwave-edge-core.service"],
+    ]
+
+
+def test_enable_and_start_service_reloads_changed_enabled_unit(monkeypatch, tmp_path):
+    core = load_core_module(monkeypatch)
+    unit_path = tmp_path / "cyberwave-edge-core.service"
+    unit_path.write_text("[Unit]\n")
+    monkeypatch.setattr(core.EDGE_CORE_SPEC, "unit_path", unit_path)
+    _patch_systemctl_show(monkeypatch, core, "NeedDaemonReload=yes\nUnitFileState=enabled\n")
+    run_calls: list[list[str]] = []
+    monkeypatch.setattr(core, "_run", lambda cmd, **_kw: run_calls.append(cmd))
+
+    assert core.enable_and_start_service(core.EDGE_CORE_SPEC) is True
+    assert run_calls == [
+        ["systemctl", "daemon-reload"],
+        ["systemctl", "restart", "--no-block", "cyberwave-edge-core.service"],
+    ]
+
+
+def test_wait_docker_ready_backs_off_until_daemon_answers(monkeypatch):
+    core = load_core_module(monkeypatch)
+    answers = iter([False, False, False, True])
+    sleeps: list[float] = []
+
+    monkeypatch.setattr(core, "_docker_daemon_pingable", lambda: next(answers))
+    monkeypatch.setattr(core.time, "sleep", sleeps.append)
+
+    assert core._wait_docker_ready(timeout=5.0) is True
+    assert sleeps == [0.01, 0.02, 0.04]
+
+
+def test_wait_docker_ready_gives_up_at_timeout(monkeypatch):
+    core = load_core_module(monkeypatch)
+    monkeypatch.setattr(core, "_docker_daemon_pingable", lambda: False)
+
+    assert core._wait_docker_ready(timeout=0.05) is False
@@ -0,0 +1,224 @@
+"""Edge discover/pair flow used by ``twin create --pair`` and ``twin pair``."""
+
+import json
+from types import SimpleNamespace
+
+from tests.test_twin_quickstart_environment import _load_twin_commands
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, payload: dict | None = None, body: bytes | None = None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self._body = body
+
+    @property
+    def content(self) -> bytes:
+        if self._body is not None:
+            return self._body
+        return json.dumps(self._payload).encode()
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FakeHttpClient:
+    def __init__(self, responses: dict[str, _FakeResponse]):
+        self.responses = responses
+        self.calls: list[tuple[str, dict]] = []
+
+    def post(self, url, content=None, headers=None):
+        assert headers["Content-Type"] == "application/json"
+        path = url.split("/api/v1", 1)[1]
+        self.calls.append((path, json.loads(content)))
+        return self.responses[path]
+
+
+def _patch_auth(monkeypatch, twin_commands, http_client, tmp_path):
+    monkeypatch.setattr(
+        twin_commands,
+        "DISCOVER_AND_PAIR_UNSUPPORTED_FILE",
+        tmp_path / "discover_and_pair_unsupported.json",
+    )
+    monkeypatch.setattr(twin_commands, "load_credentials", lambda: SimpleNamespace(token="tok"))
+    monkeypatch.setattr(twin_commands, "get_api_url", lambda: "https://api.example.test")
+    monkeypatch.setattr(twin_commands, "get_http_client", lambda: http_client)
+
+
+def test_register_and_pair_uses_single_consolidated_request(monkeypatch, tmp_path):
+    twin_commands = _load_twin_commands(monkeypatch)
+    http_client = _FakeHttpClient(
+        {"/edges/discover-and-pair": _FakeResponse(200, {"edge_uuid": "edge-1234567890"})}
+    )
+    _patch_auth(monkeypatch, twin_commands, http_client, tmp_path)
+
+    edge_uuid = twin_commands._register_and_pair_edge(
+        "twin-1", "fp-1", {"hostname": "host"}, {"fps": 15, "registered_at": "now"}
+    )
+
+    assert edge_uuid == "edge-1234567890"
+    assert [path for path, _ in http_client.calls] == ["/edges/discover-and-pair"]
+    payload = http_client.calls[0][1]
+    assert payload["twin_uuid"] == "twin-1"
+    assert payload["fingerprint"] == "fp-1"
+    assert payload["camera_config"] == {"fps": 15}
+
+
+def _two_step_backend(
+    not_found: _FakeResponse | None = None,
+) -> _FakeHttpClient:
+    return _FakeHttpClient(
+        {
+            "/edges/discover-and-pair": not_found or _FakeResponse(404),
+            "/edges/discover": _FakeResponse(200, {"edge_uuid": "edge-abcdefgh"}),
+            "/edges/edge-abcdefgh/pair": _FakeResponse(200),
+        }
+    )
+
+
+def test_register_and_pair_falls_back_to_two_step_flow_on_404(monkeypatch, tmp_path):
+    twin_commands = _load_twin_commands(monkeypatch)
+    http_client = _two_step_backend()
+    _patch_auth(monkeypatch, twin_commands, http_client, tmp_path)
+
+    edge_uuid = twin_commands._register_and_pair_edge("twin-1", "fp-1", {}, {})
+    assert edge_uuid == "edge-abcdefgh"
+    assert [path for path, _ in http_client.calls] == [
+        "/edges/discover-and-pair",
+        "/edges/discover",
+        "/edges/edge-abcdefgh/pair",
+    ]
+
+    # The endpoint is not retried for the rest of the process.
+    http_client.calls.clear()
+    twin_commands._register_and_pair_edge("twin-1", "fp-1", {}, {})
+    assert [path for path, _ in http_client.calls] == [
+        "/edges/discover",
+        "/edges/edge-abcdefgh/pair",
+    ]
+
+
+def _run_pairing_in_fresh_processes(monkeypatch, tmp_path, http_client, runs=3):
+    paths_per_run = []
+    for _ in range(runs):
+        # Each CLI invocation is a fresh process: reload the module.
+        twin_commands = _load_twin_commands(monkeypatch)
+        _patch_auth(monkeypatch, twin_commands, http_client, tmp_path)
+        assert twin_commands._register_and_pair_edge("twin-1", "fp-1", {}, {}) == "edge-abcdefgh"
+        paths_per_run.append([path for path, _ in http_client.calls])
+        http_client.calls.clear()
+    return twin_commands, paths_per_run
+
+
+def test_missing_discover_and_pair_route_is_remembered_across_invocations(
+    monkeypatch, tmp_path
+):
+    marker = tmp_path / "discover_and_pair_unsupported.json"
+    marker.write_text(json.dumps({"https://other.example.test": 1}))
+    http_client = _two_step_backend(_FakeResponse(404, body=b"<h1>Not Found</h1>"))
+    twin_commands, paths_per_run = _run_pairing_in_fresh_processes(
+        monkeypatch, tmp_path, http_client
+    )
+
+    # Only the first run pays for the probe; later runs take two requests.
+    assert paths_per_run == [
+        ["/edges/discover-and-pair", "/edges/discover", "/edges/edge-abcdefgh/pair"],
+        ["/edges/discover", "/edges/edge-abcdefgh/pair"],
+        ["/edges/discover", "/edges/edge-abcdefgh/pair"],
+    ]
+
+    # Once the TTL lapses the endpoint is probed again, and for another
+    # backend URL the remembered answer doesn't apply.
+    now = twin_commands.time.time()
+    monkeypatch.setattr(
+        twin_commands.time,
+        "time",
+        lambda: now + twin_commands.DISCOVER_AND_PAIR_UNSUPPORTED_MAX_AGE_SECONDS + 1,
+    )
+    assert not twin_commands._discover_and_pair_known_unsupported("https://api.example.test")
+    monkeypatch.setattr(twin_commands.time, "time", lambda: now)
+    assert twin_commands._discover_and_pair_known_unsupported("https://api.example.test")
+    assert not twin_commands._discover_and_pair_known_unsupported("https://other.example.test")
+    # Entries for other backends are kept when a new one is recorded.
+    assert set(json.loads(marker.read_text())) == {
+        "https://other.example.test",
+        "https://api.example.test",
+    }
+
+
+def test_api_404_from_discover_and_pair_is_not_persisted(monkeypatch, tmp_path):
+    # A JSON 404 may mean an unknown twin rather than a missing route.
+    http_client = _two_step_backend(_FakeResponse(404, {"detail": "Not Found"}))
+
+    _, paths_per_run = _run_pairing_in_fresh_processes(
+        monkeypatch, tmp_path, http_client, runs=2
+    )
+
+    assert paths_per_run == [
+        ["/edges/discover-and-pair", "/edges/discover", "/edges/edge-abcdefgh/pair"],
+        ["/edges/discover-and-pair", "/edges/discover", "/edges/edge-abcdefgh/pair"],
+    ]
+    assert not (tmp_path / "discover_and_pair_unsupported.json").exists()
+
+
+def test_list_twins_for_fingerprint_prefers_server_side_filter(monkeypatch):
+    twin_commands = _load_twin_commands(monkeypatch)
+    calls: list[dict] = []
+
+    class _Twins:
+        def list(self, **kwargs):
+            calls.append(kwargs)
+            return ["twin"]
+
+    client = SimpleNamespace(twins=_Twins())
+    assert twin_commands._list_twins_for_fingerprint(client, "asset-1", "fp-1") == ["twin"]
+    assert calls == [{"asset_uuid": "asset-1", "fingerprint": "fp-1"}]
+
+
+def test_list_twins_for_fingerprint_falls_back_for_old_sdk(monkeypatch):
+    twin_commands = _load_twin_commands(monkeypatch)
+    calls: list[dict] = []
+
+    class _Twins:
+        def list(self, asset_uuid=None):
+            calls.append({"asset_uuid": asset_uuid})
+            return ["twin-a", "twin-b"]
+
+    client = SimpleNamespace(twins=_Twins())
+    assert twin_commands._list_twins_for_fingerprint(client, "asset-1", "fp-1") == [
+        "twin-a",
+        "twin-b",
+    ]
+    assert calls == [{"asset_uuid": "asset-1"}]
+
+
+def test_post_with_retry_retries_gateway_errors_with_backoff(monkeypatch):
+    twin_commands = _load_twin_commands(monkeypatch)
+    sleeps: list[float] = []
+    monkeypatch.setattr(twin_commands.time, "sleep", sleeps.append)
+    responses = iter([_FakeResponse(503), _FakeResponse(502), _FakeResponse(200)])
+
+    class _Client:
+        def post(self, url, **kwargs):
+            return next(responses)
+
+    response = twin_commands._post_with_retry(
+        _Client(), "https://x/api/v1/edges/discover", {}, {}
+    )
+
+    assert response.status_code == 200
+    assert sleeps == [0.5, 1.0]
+
+
+def test_post_with_retry_returns_non_retryable_errors_immediately(monkeypatch):
+    twin_commands = _load_twin_commands(monkeypatch)
+    monkeypatch.setattr(twin_commands.time, "sleep", lambda _s: None)
+    http_client = _FakeHttpClient({"/edges/discover": _FakeResponse(409)})
+
+    response = twin_commands._post_with_retry(
+        http_client, "https://x/api/v1/edges/discover", {"fingerprint": "fp"}, {}
+    )
+
+    assert response.status_code == 409
+    assert len(http_client.calls) == 1
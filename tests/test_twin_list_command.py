@@ -0,0 +1,154 @@
+"""``cyberwave twin list`` rendering and limits, and bulk ``twin delete``."""
+
+from __future__ import annotations
+
+import importlib
+import json
+from types import SimpleNamespace
+
+import pytest
+from click.testing import CliRunner
+
+twin_module = importlib.import_module("cyberwave_cli.commands.twin")
+
+
+def _twin(i: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        uuid=f"twin-{i:04d}-uuid",
+        name=f"Twin {i}",
+        asset_uuid=f"asset-{i}",
+        environment_uuid="env-1",
+        metadata={},
+    )
+
+
+class _Twins:
+    def __init__(self, twins, supports_limit: bool):
+        self._twins = twins
+        self._supports_limit = supports_limit
+        self.calls: list[dict] = []
+
+    def list(self, environment_id=None, **kwargs):
+        if kwargs and not self._supports_limit:
+            raise TypeError("unexpected keyword argument 'limit'")
+        self.calls.append({"environment_id": environment_id, **kwargs})
+        return list(self._twins)
+
+
+def test_list_twins_limit_is_forwarded_when_supported() -> None:
+    twins = _Twins([_twin(i) for i in range(5)], supports_limit=True)
+    client = SimpleNamespace(twins=twins)
+
+    result = twin_module._list_twins_limited(client, "env-1", 2)
+
+    assert [t.name for t in result] == ["Twin 0", "Twin 1"]
+    assert twins.calls == [{"environment_id": "env-1", "limit": 2}]
+
+
+def test_list_twins_limit_truncates_for_old_sdk(monkeypatch) -> None:
+    twins = _Twins([_twin(i) for i in range(5)], supports_limit=False)
+    monkeypatch.setattr(twin_module, "get_sdk_client", lambda: SimpleNamespace(twins=twins))
+
+    result = CliRunner().invoke(twin_module.twin, ["list", "--json", "--limit", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count('"uuid"') == 3
+    assert twins.calls == [{"environment_id": None}]
+
+
+def test_list_twins_limit_does_not_hide_errors_from_iterating_results() -> None:
+    calls: list[dict] = []
+
+    def _bad_rows():
+        yield _twin(0)
+        raise TypeError("bad row")
+
+    def _list(**kwargs):
+        calls.append(kwargs)
+        return _bad_rows()
+
+    client = SimpleNamespace(twins=SimpleNamespace(list=_list))
+
+    with pytest.raises(TypeError, match="bad row"):
+        twin_module._list_twins_limited(client, None, 2)
+    # No silent fallback to an unbounded listing.
+    assert calls == [{"limit": 2}]
+
+
+def test_list_twins_adds_a_row_per_twin_inside_live(monkeypatch) -> None:
+    twins = _Twins([_twin(i) for i in range(3)], supports_limit=True)
+    monkeypatch.setattr(twin_module, "get_sdk_client", lambda: SimpleNamespace(twins=twins))
+    rows: list[tuple] = []
+    live_renderables: list = []
+
+    class _Table:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def add_column(self, *args, **kwargs):
+            pass
+
+        def add_row(self, *cells):
+            assert live_renderables, "rows must be added while Live is active"
+            rows.append(cells)
+
+    class _Live:
+        def __init__(self, renderable, **kwargs):
+            self._renderable = renderable
+
+        def __enter__(self):
+            live_renderables.append(self._renderable)
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(twin_module, "Table", _Table)
+    monkeypatch.setattr(twin_module, "Live", _Live)
+
+    result = CliRunner().invoke(twin_module.twin, ["list"])
+
+    assert result.exit_code == 0, result.output
+    assert [row[0] for row in rows] == ["Twin 0", "Twin 1", "Twin 2"]
+    assert rows[0][1] == "twin-000..."
+    assert "Total: 3 twin(s)" in result.output
+
+
+def test_list_twins_resolve_joins_names_with_one_listing_each(monkeypatch) -> None:
+    twins = _Twins([_twin(i) for i in range(4)], supports_limit=True)
+    listing_calls: list[str] = []
+
+    def _listing(kind, items):
+        def _list():
+            listing_calls.append(kind)
+            return items
+
+        return SimpleNamespace(list=_list)
+
+    client = SimpleNamespace(
+        twins=twins,
+        assets=_listing(
+            "assets", [SimpleNamespace(uuid=f"asset-{i}", name=f"Cam {i}") for i in range(3)]
+        ),
+        environments=_listing("environments", [SimpleNamespace(uuid="env-1", name="Lab")]),
+    )
+    monkeypatch.setattr(twin_module, "get_sdk_client", lambda: client)
+
+    result = CliRunner().invoke(twin_module.twin, ["list", "--json", "--resolve"])
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert [row["asset_name"] for row in data] == ["Cam 0", "Cam 1", "Cam 2", None]
+    assert {row["environment_name"] for row in data} == {"Lab"}
+    assert sorted(listing_calls) == ["assets", "environments"]
+
+
+def test_delete_twin_deletes_every_uuid(monkeypatch) -> None:
+    deleted: list[str] = []
+    client = SimpleNamespace(twins=SimpleNamespace(delete=deleted.append))
+    monkeypatch.setattr(twin_module, "get_sdk_client", lambda: client)
+
+    result = CliRunner().invoke(twin_module.twin, ["delete", "t-1", "t-2", "t-3", "--yes"])
+
+    assert result.exit_code == 0, result.output
+    assert sorted(deleted) == ["t-1", "t-2", "t-3"]
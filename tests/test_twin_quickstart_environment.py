@@ -20,6 +20,7 @@ def _load_twin_commands(monkeypatch):
         utils_module.truncate_uuid = lambda value: value
         utils_module.write_edge_env = lambda **_kwargs: None
         utils_module.get_sdk_client = lambda: None
+        utils_module.get_http_client = lambda: None
         monkeypatch.setitem(sys.modules, "cyberwave_cli.utils", utils_module)
 
     fingerprint_module = type(sys)("cyberwave.fingerprint")
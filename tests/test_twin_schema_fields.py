@@ -0,0 +1,77 @@
+"""Edge config schema handling for ``twin create --pair`` / ``twin pair``."""
+
+from tests.test_twin_quickstart_environment import _load_twin_commands
+
+_SCHEMA = [
+    {"name": "camera_source", "flag": "--camera-source", "type": "string", "default": "0"},
+    {"name": "fps", "type": "integer", "default": 15},
+    {"name": "enabled", "type": "boolean", "default": "yes"},
+    {"name": "token", "type": "string", "required": True},
+    {"flag": "--nameless"},
+]
+
+
+def test_compile_schema_normalizes_fields_once(monkeypatch):
+    twin_commands = _load_twin_commands(monkeypatch)
+
+    compiled = twin_commands._compile_schema(_SCHEMA)
+
+    assert [f.name for f in compiled] == ["camera_source", "fps", "enabled", "token"]
+    assert compiled[0].cli_key == "camera_source"
+    assert compiled[1].cli_key == "fps"
+    assert compiled[3].required is True
+    assert twin_commands._compile_schema(_SCHEMA) is compiled
+
+
+def test_prompt_for_schema_fields_uses_overrides_then_defaults(monkeypatch):
+    twin_commands = _load_twin_commands(monkeypatch)
+
+    config = twin_commands._prompt_for_schema_fields(
+        _SCHEMA, {"camera_source": "rtsp://cam", "fps": "30"}, yes=True
+    )
+
+    assert config == {"camera_source": "rtsp://cam", "fps": 30, "enabled": True}
+
+
+def test_parse_extra_kv_handles_values_flags_and_strays(monkeypatch):
+    twin_commands = _load_twin_commands(monkeypatch)
+
+    overrides = twin_commands._parse_extra_kv(
+        ["--camera-source", "rtsp://cam", "stray", "--debug", "--fps", "15", "--verbose"]
+    )
+
+    assert overrides == {
+        "camera_source": "rtsp://cam",
+        "debug": "true",
+        "fps": "15",
+        "verbose": "true",
+    }
+
+
+def test_coerce_value_by_schema_type(monkeypatch):
+    twin_commands = _load_twin_commands(monkeypatch)
+    coerce = twin_commands._coerce_value
+
+    assert coerce("integer", "7") == 7
+    assert coerce("INTEGER", "seven") == "seven"
+    assert coerce("number", "2.5") == 2.5
+    assert coerce("boolean", "Yes") is True
+    assert coerce("boolean", "off") is False
+    assert coerce("string", "abc") == "abc"
+    assert coerce(None, "abc") == "abc"
+    assert coerce("integer", "") is None
+
+
+def test_prompt_for_schema_fields_yes_without_overrides_uses_cached_defaults(monkeypatch):
+    twin_commands = _load_twin_commands(monkeypatch)
+    warnings: list[str] = []
+    monkeypatch.setattr(twin_commands, "print_warning", warnings.append)
+
+    first = twin_commands._prompt_for_schema_fields(_SCHEMA, {}, yes=True)
+    first["fps"] = 99
+    second = twin_commands._prompt_for_schema_fields(_SCHEMA, {}, yes=True)
+
+    assert second == {"camera_source": "0", "fps": 15, "enabled": True}
+    assert warnings == [
+        "Required field 'token' has no default and --yes was used",
+    ] * 2
@@ -50,3 +50,59 @@ def test_get_sdk_client_omits_workspace_when_credentials_have_none(monkeypatch)
         utils_module.get_sdk_client()
 
     assert "workspace_id" not in captured
+
+
+def test_get_sdk_client_reuses_client_for_same_credentials(monkeypatch) -> None:
+    creds = Credentials(token="token-reuse", cyberwave_base_url="http://localhost:8000")
+    constructed: list = []
+
+    class _FakeCyberwave:
+        def __init__(self, **kwargs):
+            constructed.append(kwargs)
+
+    monkeypatch.setattr(utils_module, "load_credentials", lambda: creds)
+    monkeypatch.setattr(utils_module, "resolve_api_url", lambda *_a, **_k: "http://localhost:8000")
+    monkeypatch.setattr(utils_module, "_resolve_mqtt_kwargs", lambda *_a, **_k: {})
+    utils_module.clear_sdk_client_cache()
+
+    with patch.dict("sys.modules", {"cyberwave": SimpleNamespace(Cyberwave=_FakeCyberwave)}):
+        first = utils_module.get_sdk_client()
+        second = utils_module.get_sdk_client()
+        creds.token = "token-other"
+        third = utils_module.get_sdk_client()
+
+    utils_module.clear_sdk_client_cache()
+    assert first is second
+    assert third is not first
+    assert len(constructed) == 2
+
+
+def test_evicted_and_cleared_sdk_clients_are_disconnected(monkeypatch) -> None:
+    creds = Credentials(token="token-0")
+    disconnected: list[str] = []
+
+    class _FakeCyberwave:
+        def __init__(self, **kwargs):
+            self.token = kwargs["token"]
+
+        def disconnect(self):
+            disconnected.append(self.token)
+
+    monkeypatch.setattr(utils_module, "load_credentials", lambda: creds)
+    monkeypatch.setattr(utils_module, "resolve_api_url", lambda *_a, **_k: "http://localhost:8000")
+    monkeypatch.setattr(utils_module, "_resolve_mqtt_kwargs", lambda *_a, **_k: {})
+    utils_module.clear_sdk_client_cache()
+
+    with patch.dict("sys.modules", {"cyberwave": SimpleNamespace(Cyberwave=_FakeCyberwave)}):
+        for i in range(utils_module._SDK_CLIENT_CACHE_SIZE + 1):
+            creds.token = f"token-{i}"
+            utils_module.get_sdk_client()
+
+    # The least recently used client is disconnected when it is dropped.
+    assert disconnected == ["token-0"]
+
+    utils_module.clear_sdk_client_cache()
+    assert sorted(disconnected) == sorted(
+        f"token-{i}" for i in range(utils_module._SDK_CLIENT_CACHE_SIZE + 1)
+    )
+    assert not utils_module._SDK_CLIENTS
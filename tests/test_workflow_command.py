@@ -4,6 +4,7 @@ import importlib
 import json
 import sys
 from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
 from uuid import UUID
 
 import click
@@ -70,7 +71,7 @@ def test_extract_twin_uuids_uses_all_enabled_twin_references() -> None:
 
 
 def test_list_workflows_json_includes_edge_metadata_and_referenced_twins(
-    monkeypatch,
+    monkeypatch, capsys
 ) -> None:
     workflow = SimpleNamespace(
         uuid="wf-1",
@@ -102,7 +103,7 @@ def test_list_workflows_json_includes_edge_metadata_and_referenced_twins(
 
     workflow_module.list_workflows.callback(as_json=True, base_url=None)
 
-    assert json.loads(printed[-1]) == [
+    assert json.loads(capsys.readouterr().out) == [
         {
             "uuid": "wf-1",
             "name": "frame",
@@ -116,6 +117,41 @@ def test_list_workflows_json_includes_edge_metadata_and_referenced_twins(
     ]
 
 
+def test_list_workflows_fetches_nodes_concurrently_in_stable_order(
+    monkeypatch, capsys
+) -> None:
+    import threading
+    import time
+
+    workflows = [
+        SimpleNamespace(uuid=f"wf-{i}", name=f"flow {i}", is_active=True, description="")
+        for i in range(3)
+    ]
+    all_started = threading.Barrier(len(workflows), timeout=5)
+
+    def _list_nodes(uuid):
+        all_started.wait()
+        if uuid == "wf-0":
+            time.sleep(0.05)  # the first row's lookup finishes last
+        return [_node(node_type="send_alert", twin_uuid=f"twin-of-{uuid}")]
+
+    client = SimpleNamespace(
+        api=SimpleNamespace(
+            src_app_api_workflows_list_workflows=lambda: workflows,
+            src_app_api_workflows_list_workflow_nodes=_list_nodes,
+        )
+    )
+    monkeypatch.setattr(workflow_module, "get_sdk_client", lambda api_url=None: client)
+    monkeypatch.setattr(workflow_module.console, "print", lambda *a, **k: None)
+
+    workflow_module.list_workflows.callback(as_json=True, base_url=None)
+
+    rows = json.loads(capsys.readouterr().out)
+    assert [(r["uuid"], r["twin_uuids"]) for r in rows] == [
+        (f"wf-{i}", [f"twin-of-wf-{i}"]) for i in range(3)
+    ]
+
+
 def test_list_workflows_table_uses_edge_cloud_target_labels(monkeypatch) -> None:
     workflows = [
         SimpleNamespace(
@@ -158,7 +194,18 @@ def test_list_workflows_table_uses_edge_cloud_target_labels(monkeypatch) -> None
     printed: list[object] = []
 
     monkeypatch.setattr(workflow_module, "get_sdk_client", lambda api_url=None: client)
+    class FakeLive:
+        def __init__(self, renderable, **kwargs):
+            captured["live"] = renderable
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
     monkeypatch.setattr(workflow_module, "Table", FakeTable)
+    monkeypatch.setattr(workflow_module, "Live", FakeLive)
     monkeypatch.setattr(workflow_module.console, "print", printed.append)
 
     workflow_module.list_workflows.callback(as_json=False, base_url=None)
@@ -177,6 +224,7 @@ def test_list_workflows_table_uses_edge_cloud_target_labels(monkeypatch) -> None
     assert captured["rows"][0][4] == "simulation"
     assert captured["rows"][1][3] == "cloud"
     assert captured["rows"][1][4] == "physical"
+    assert isinstance(captured["live"], FakeTable)
 
 
 def test_pick_workflow_options_include_run_on_edge(monkeypatch) -> None:
@@ -511,3 +559,102 @@ def test_sync_workflow_edge_active_with_explicit_uuid_is_rejected(monkeypatch) -
         "--edge-active" in message and "explicit workflow UUID" in message
         for message in printed
     )
+
+
+def test_create_workflow_uses_stored_workspace_without_listing(monkeypatch) -> None:
+    created: list = []
+
+    def _no_listing():
+        raise AssertionError("workspaces.list should not be called")
+
+    client = SimpleNamespace(
+        workspaces=SimpleNamespace(list=_no_listing),
+        api=SimpleNamespace(
+            src_app_api_workflows_create_workflow=lambda workflow_create_schema: (
+                created.append(workflow_create_schema) or SimpleNamespace(uuid="wf-new")
+            )
+        ),
+    )
+    monkeypatch.setattr(workflow_module, "get_sdk_client", lambda api_url=None: client)
+    monkeypatch.setattr(
+        workflow_module,
+        "load_credentials",
+        lambda: Credentials(token="t", workspace_uuid="ws-stored"),
+    )
+    monkeypatch.setattr(
+        workflow_module, "resolve_api_url", lambda *_a, **_k: "https://api.example.test"
+    )
+    monkeypatch.setattr(workflow_module.console, "print", lambda *a, **k: None)
+
+    rest_models = ModuleType("cyberwave.rest.models")
+    rest_models.WorkflowCreateSchema = lambda **kwargs: SimpleNamespace(**kwargs)
+    sdk_modules = {
+        "cyberwave": ModuleType("cyberwave"),
+        "cyberwave.rest": ModuleType("cyberwave.rest"),
+        "cyberwave.rest.models": rest_models,
+    }
+
+    with patch.dict("sys.modules", sdk_modules):
+        workflow_module.create_workflow.callback(name="Mine", template=None, base_url=None)
+
+    assert [c.workspace_uuid for c in created] == ["ws-stored"]
+
+
+def test_show_workflow_fetches_workflow_and_nodes_concurrently(monkeypatch) -> None:
+    import threading
+
+    both_started = threading.Barrier(2, timeout=5)
+    workflow = SimpleNamespace(
+        uuid="wf-1",
+        name="frame",
+        is_active=True,
+        description="",
+        run_on_edge=False,
+        execution_target=None,
+        environment_uuid=None,
+    )
+
+    def _get_workflow(uuid):
+        both_started.wait()
+        return workflow
+
+    def _list_nodes(uuid):
+        both_started.wait()
+        return [SimpleNamespace(node_type="trigger", name="start", uuid="n-1", parameters={})]
+
+    client = SimpleNamespace(
+        api=SimpleNamespace(
+            src_app_api_workflows_get_workflow=_get_workflow,
+            src_app_api_workflows_list_workflow_nodes=_list_nodes,
+        )
+    )
+    printed: list[str] = []
+    monkeypatch.setattr(workflow_module, "get_sdk_client", lambda api_url=None: client)
+    monkeypatch.setattr(workflow_module.console, "print", printed.append)
+
+    workflow_module.show_workflow.callback(uuid="wf-1", base_url=None)
+
+    assert any("trigger: start" in line for line in printed)
+
+
+def test_activate_workflow_accepts_several_uuids_and_reports_failures(monkeypatch) -> None:
+    activated: list[str] = []
+
+    def _activate(uuid: str) -> None:
+        if uuid == "wf-bad":
+            raise RuntimeError("boom")
+        activated.append(uuid)
+
+    client = SimpleNamespace(api=SimpleNamespace(src_app_api_workflows_activate_workflow=_activate))
+    printed: list[str] = []
+    monkeypatch.setattr(workflow_module, "get_sdk_client", lambda api_url=None: client)
+    monkeypatch.setattr(workflow_module.console, "print", printed.append)
+
+    with pytest.raises(click.Abort):
+        workflow_module.activate_workflow.callback(
+            uuids=("wf-1", "wf-bad", "wf-2", "wf-1"), base_url=None
+        )
+
+    assert sorted(activated) == ["wf-1", "wf-2"]
+    assert any("Failed to activate workflow wf-bad: boom" in line for line in printed)
+    assert printed[-1] == "[red]✗[/red] 1 of 3 failed."
@@ -1,3 +1,4 @@
+import threading
 from types import SimpleNamespace
 
 from tests._core_module_loader import load_core_module as _load_core_module
@@ -82,6 +83,67 @@ def test_workspace_environments_includes_standalone_and_project_scoped(monkeypat
     assert None in environments.calls
 
 
+def test_workspace_projects_are_listed_once_until_a_project_is_created(monkeypatch):
+    core = _load_core_module(monkeypatch)
+    list_calls: list[None] = []
+
+    class _CountingProjects(_FakeProjectsManager):
+        def list(self):
+            list_calls.append(None)
+            return super().list()
+
+        def create(self, **kwargs):
+            project = SimpleNamespace(uuid="project-new", workspace_uuid=kwargs["workspace_id"])
+            self._projects.append(project)
+            return project
+
+    client = SimpleNamespace(
+        projects=_CountingProjects([SimpleNamespace(uuid="project-1", workspace_uuid="ws-1")]),
+        environments=_FakeEnvironmentsManager(all_envs=[], envs_by_project={}),
+    )
+
+    core._workspace_environments(client, "ws-1")
+    assert [p.uuid for p in core._workspace_projects(client, "ws-1")] == ["project-1"]
+    assert len(list_calls) == 1
+
+    # Creating a project in a workspace drops that workspace's cached list.
+    client.environments.create = lambda **kwargs: SimpleNamespace(name=kwargs["name"])
+    core._create_environment_in_workspace(client, "ws-2", skip_confirm=True)
+    assert [p.uuid for p in core._workspace_projects(client, "ws-2")] == ["project-new"]
+    assert len(list_calls) == 3
+
+    core._reset_workspace_cache()
+    core._workspace_projects(client, "ws-1")
+    assert len(list_calls) == 4
+
+
+def test_workspace_environments_lists_projects_concurrently_in_order(monkeypatch):
+    core = _load_core_module(monkeypatch)
+    barrier = threading.Barrier(3, timeout=5)
+
+    class _BarrierEnvironments(_FakeEnvironmentsManager):
+        def list(self, project_id=None):
+            if project_id is not None:
+                barrier.wait()  # times out if projects are listed one at a time
+            return super().list(project_id)
+
+    projects = [SimpleNamespace(uuid=f"project-{i}", workspace_uuid="ws-1") for i in range(3)]
+    client = SimpleNamespace(
+        projects=_FakeProjectsManager(projects),
+        environments=_BarrierEnvironments(
+            all_envs=[],
+            envs_by_project={
+                f"project-{i}": [SimpleNamespace(uuid=f"env-{i}", workspace_uuid="ws-1")]
+                for i in range(3)
+            },
+        ),
+    )
+
+    result = core._workspace_environments(client, "ws-1")
+
+    assert [env.uuid for env in result] == ["env-0", "env-1", "env-2"]
+
+
 def test_workspace_environments_uses_settings_workspace_uuid_for_standalone(monkeypatch):
     core = _load_core_module(monkeypatch)
 
@@ -221,12 +283,62 @@ def test_attach_edge_fingerprint_sends_only_the_key(monkeypatch):
 
     assert updated == 2
     assert failed == 1
-    assert twins.updated == [
+    # Updates run concurrently, so completion order isn't fixed.
+    assert sorted(twins.updated, key=lambda call: call[0]) == [
         ("twin-a", {"edge_fingerprint": "fp-123"}),
         ("twin-c", {"edge_fingerprint": "fp-123"}),
     ]
 
 
+def test_attach_edge_fingerprint_updates_twins_concurrently(monkeypatch):
+    core = _load_core_module(monkeypatch)
+    barrier = threading.Barrier(3, timeout=5)
+
+    class _BarrierTwins(_FakeTwinsManager):
+        def update(self, twin_uuid, metadata):
+            barrier.wait()  # deadlocks (and times out) if run one at a time
+            super().update(twin_uuid, metadata)
+
+    twins = _BarrierTwins(twins=[])
+
+    updated, failed = core._attach_edge_fingerprint_to_twins(
+        SimpleNamespace(twins=twins),
+        twin_uuids=["twin-a", "twin-b", "twin-c"],
+        edge_fingerprint="fp-123",
+    )
+
+    assert (updated, failed) == (3, 0)
+    assert core._attach_edge_fingerprint_to_twins(SimpleNamespace(twins=twins), [], "fp") == (0, 0)
+
+
+def test_detach_edge_fingerprint_updates_stale_twins_concurrently(monkeypatch):
+    core = _load_core_module(monkeypatch)
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _BarrierTwins(_FakeTwinsManager):
+        def update(self, twin_uuid, metadata):
+            barrier.wait()  # deadlocks (and times out) if run one at a time
+            super().update(twin_uuid, metadata)
+
+    twins = _BarrierTwins(
+        [
+            SimpleNamespace(uuid="twin-a", metadata={"edge_fingerprint": "fp-123"}),
+            SimpleNamespace(uuid="twin-b", metadata={"edge_fingerprint": "fp-123"}),
+        ],
+        allowed_environment_id="env-1",
+    )
+
+    detached, failed = core._detach_edge_fingerprint_from_other_twins(
+        SimpleNamespace(twins=twins),
+        environment_uuid="env-1",
+        keep_twin_uuids=[],
+        edge_fingerprint="fp-123",
+    )
+
+    assert (detached, failed) == (2, 0)
+    assert sorted(uuid for uuid, _ in twins.updated) == ["twin-a", "twin-b"]
+
+
 class _FakeWorkspacesManager:
     def __init__(self, workspaces):
         self._workspaces = workspaces
@@ -264,3 +376,27 @@ def test_resolve_workspace_from_credentials_empty_uuid(monkeypatch):
 
     assert core._resolve_workspace_from_credentials(client, "") is None
     assert core._resolve_workspace_from_credentials(client, "   ") is None
+
+
+def test_workspaces_are_listed_once_per_client(monkeypatch):
+    core = _load_core_module(monkeypatch)
+    list_calls: list[None] = []
+    ws = SimpleNamespace(uuid="ws-1", name="only", slug="only")
+
+    class _CountingWorkspaces(_FakeWorkspacesManager):
+        def list(self):
+            list_calls.append(None)
+            return super().list()
+
+    client = SimpleNamespace(workspaces=_CountingWorkspaces([ws]))
+
+    # Credential check, workspace selection and the saved-workspace lookup
+    # all share one round trip.
+    core._list_workspaces(client)
+    assert core._select_workspace(client, skip_confirm=True) is ws
+    assert core._resolve_workspace_from_credentials(client, "ws-1") is ws
+    assert len(list_calls) == 1
+
+    core._reset_workspace_cache()
+    core._list_workspaces(client)
+    assert len(list_calls) == 2